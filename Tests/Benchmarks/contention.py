@@ -0,0 +1,106 @@
+"""
+Writer throughput of a shared OrderBook with snapshot readers
+
+Run from the project directory:
+    python -m Tests.Benchmarks.contention [levels_count] [seconds]
+"""
+import sys
+import threading
+import time
+from typing import Callable
+
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.OrderBook.ThreadSafeOrderBook import ThreadSafeOrderBook
+
+READERS_COUNTS = (0, 1, 2, 4, 8)
+
+
+class LockedOrderBook:
+    """
+    OrderBook behind one lock, snapshots are built under the lock
+    """
+
+    def __init__(self, order_book: OrderBook):
+        self.__order_book = order_book
+        self.__lock = threading.Lock()
+
+    def add_request(self, request):
+        with self.__lock:
+            return self.__order_book.add_request(request)
+
+    def delete_request(self, request_id):
+        with self.__lock:
+            self.__order_book.delete_request(request_id)
+
+    def get_snapshot(self):
+        with self.__lock:
+            return self.__order_book.get_snapshot()
+
+
+def fill_order_book(levels_count: int) -> OrderBook:
+    """
+    Create an OrderBook with levels_count levels per side
+
+    :param levels_count: Number of price levels per side
+
+    :return: OrderBook object
+    """
+    order_book = OrderBook()
+    order_book.add_requests_bulk(
+        [AskRequest(price=10_000 + i, volume=5) for i in range(levels_count)]
+        + [BidRequest(price=10_000 - 1 - i, volume=5) for i in range(levels_count)]
+    )
+    return order_book
+
+
+def measure(factory: Callable, levels_count: int, readers_count: int, seconds: float) -> dict:
+    """
+    Measure writer operations and reader snapshots per second
+
+    :param factory: Callable wrapping an OrderBook into a shared book
+    :param levels_count: Number of price levels per side
+    :param readers_count: Number of reader threads
+    :param seconds: Duration of the measurement
+
+    :return: dict: {'writer_ops': ..., 'snapshots': ...}
+    """
+    book = factory(fill_order_book(levels_count))
+    stop = threading.Event()
+    snapshots = [0] * readers_count
+
+    def read(index: int) -> None:
+        while not stop.is_set():
+            book.get_snapshot()
+            snapshots[index] += 1
+
+    readers = [threading.Thread(target=read, args=(index,)) for index in range(readers_count)]
+    for reader in readers:
+        reader.start()
+
+    writer_ops = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        request = AskRequest(price=10_000 + writer_ops % levels_count, volume=1)
+        book.add_request(request)
+        book.delete_request(request.id)
+        writer_ops += 2
+
+    stop.set()
+    for reader in readers:
+        reader.join()
+    return {'writer_ops': writer_ops / seconds, 'snapshots': sum(snapshots) / seconds}
+
+
+if __name__ == '__main__':
+    levels_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    print(f'Levels per side: {levels_count}, seconds per run: {seconds}')
+    print(f'{"book":<20}{"readers":>8}{"writer ops/s":>15}{"snapshots/s":>15}')
+    for name, factory in (('LockedOrderBook', LockedOrderBook), ('ThreadSafeOrderBook', ThreadSafeOrderBook)):
+        for readers_count in READERS_COUNTS:
+            result = measure(factory, levels_count, readers_count, seconds)
+            print(f'{name:<20}{readers_count:>8}{result["writer_ops"]:>15.0f}{result["snapshots"]:>15.0f}')
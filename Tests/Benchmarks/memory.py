@@ -0,0 +1,52 @@
+"""
+Memory usage of resting requests
+
+Run from the project directory:
+    python -m Tests.Benchmarks.memory [requests_count] [levels_count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+
+
+def measure(requests_count: int, levels_count: int) -> dict:
+    """
+    Measure bytes per request object and bytes per resting request in the OrderBook
+
+    :param requests_count: Number of requests
+    :param levels_count: Number of price levels per side
+
+    :return: dict: {'request_bytes': ..., 'resting_request_bytes': ...}
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        requests = [
+            (AskRequest if i % 2 else BidRequest)(price=100 + i % levels_count, volume=5)
+            for i in range(requests_count)
+        ]
+        requests_memory = tracemalloc.get_traced_memory()[0]
+        order_book = OrderBook()
+        order_book.add_requests(requests)
+        book_memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {
+        'request_bytes': requests_memory / requests_count,
+        'resting_request_bytes': book_memory / requests_count,
+    }
+
+
+if __name__ == '__main__':
+    requests_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    levels_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    result = measure(requests_count, levels_count)
+    print(f'Requests: {requests_count}, levels per side: {levels_count}')
+    print(f'Bytes per request object (including the list slot): {result["request_bytes"]:.1f}')
+    print(f'Bytes per resting request (request + book structures): {result["resting_request_bytes"]:.1f}')
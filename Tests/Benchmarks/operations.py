@@ -0,0 +1,233 @@
+"""
+Speed of OrderBook operations by book size and number of levels
+
+Run from the project directory:
+    python -m Tests.Benchmarks.operations [--sizes 1000 1000000] [--levels 1 10000] [--output results.json]
+    python -m Tests.Benchmarks.operations --compare old.json new.json
+
+Results are written as JSON: for every book size, levels count and operation
+ops/s, p50 and p99 latency (nanoseconds) and peak traced memory (bytes).
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Sequence,
+)
+
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    Request,
+)
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LEVELS = (1, 10, 100, 1_000, 10_000)
+BASE_PRICE = 100_000
+BATCH_SIZE = 100
+MEMORY_SAMPLES = 10
+
+
+def create_requests(count: int, levels_count: int, shift: int = 0) -> List[Request]:
+    """
+    Create asks and bids over levels_count levels per side, asks are above bids
+
+    :param count: Number of requests
+    :param levels_count: Number of price levels per side
+    :param shift: Shift of the level of the first request
+
+    :return: Requests
+    """
+    return [
+        AskRequest(price=BASE_PRICE + 1 + (i + shift) % levels_count, volume=5) if i % 2 else
+        BidRequest(price=BASE_PRICE - (i + shift) % levels_count, volume=5)
+        for i in range(count)
+    ]
+
+
+def percentile(values: List[int], rank: float) -> int:
+    """
+    Percentile of sorted values by the nearest rank
+    """
+    return values[min(len(values) - 1, int(len(values) * rank))]
+
+
+def time_calls(call: Callable, arguments: Sequence, per_call: int = 1) -> dict:
+    """
+    Time every call separately
+
+    :param call: Callable with one argument
+    :param arguments: Arguments of calls
+    :param per_call: Number of operations in one call
+
+    :return: dict: {'ops': ..., 'p50_ns': ..., 'p99_ns': ...}
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    gc.disable()
+    try:
+        for argument in arguments:
+            start = clock()
+            call(argument)
+            append(clock() - start)
+    finally:
+        gc.enable()
+    latencies.sort()
+    return {
+        'ops': len(arguments) * per_call * 1e9 / max(sum(latencies), 1),
+        'p50_ns': percentile(latencies, 0.5),
+        'p99_ns': percentile(latencies, 0.99),
+    }
+
+
+def traced_peak(call: Callable, arguments: Sequence) -> int:
+    """
+    Peak of traced memory above the current one while calling
+
+    :param call: Callable with one argument
+    :param arguments: Arguments of calls
+
+    :return: Bytes
+    """
+    tracemalloc.start()
+    try:
+        current = tracemalloc.get_traced_memory()[0]
+        for argument in arguments:
+            call(argument)
+        return tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+
+def measure(size: int, levels_count: int, samples: int) -> Dict[str, dict]:
+    """
+    Measure all operations on one book, operations keep the book size
+
+    :param size: Number of resting requests
+    :param levels_count: Number of price levels per side
+    :param samples: Number of timed calls of every operation
+
+    :return: dict: {operation: {'ops': ..., 'p50_ns': ..., 'p99_ns': ..., 'peak_memory_bytes': ...}}
+    """
+    generator = random.Random(size * 31 + levels_count)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        requests = create_requests(size, levels_count)
+        order_book = OrderBook()
+        order_book.add_requests_bulk(requests)
+        book_bytes = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    samples = min(samples, size // 2)
+    ids = [request.id for request in generator.sample(requests, samples)]
+    new_requests = create_requests(samples + MEMORY_SAMPLES, levels_count, shift=size)
+    batches = [
+        create_requests(BATCH_SIZE, levels_count, shift=size + i)
+        for i in range(max(1, samples // BATCH_SIZE) + 1)
+    ]
+    snapshot_samples = max(1, min(samples, 1_000_000 // (levels_count * 10)))
+
+    def change_price(request_id: int) -> None:
+        request = order_book._get_request(request_id)
+        order_book.change_request_info(request_id, price=request.price + 1 if request.price > BASE_PRICE
+                                       else request.price - 1)
+
+    def delete_batch(batch: List[Request]) -> None:
+        for request in batch:
+            order_book.delete_request(request.id)
+
+    memory_ids = ids[:MEMORY_SAMPLES]
+    timed_requests, memory_requests = new_requests[MEMORY_SAMPLES:], new_requests[:MEMORY_SAMPLES]
+    # name, call, timed arguments, memory arguments, operations per call
+    operations = (
+        ('get_request_info', order_book.get_request_info, ids, memory_ids, 1),
+        ('get_snapshot', order_book.get_snapshot, [None] * snapshot_samples, [None], 1),
+        ('change_request_info_volume', lambda request_id: order_book.change_request_info(request_id, volume=7),
+         ids, memory_ids, 1),
+        ('change_request_info_price', change_price, ids, memory_ids, 1),
+        ('add_request', order_book.add_request, timed_requests, memory_requests, 1),
+        ('delete_request', lambda request: order_book.delete_request(request.id),
+         timed_requests, memory_requests, 1),
+        ('add_requests', order_book.add_requests, batches[1:], batches[:1], BATCH_SIZE),
+        ('delete_request_batch', delete_batch, batches[1:], batches[:1], BATCH_SIZE),
+    )
+    results = {}
+    for name, call, timed_arguments, memory_arguments, per_call in operations:
+        results[name] = time_calls(call, timed_arguments, per_call)
+        results[name]['peak_memory_bytes'] = book_bytes + traced_peak(call, memory_arguments)
+    return results
+
+
+def git_revision() -> str:
+    """
+    Current git commit of the project or an empty string
+    """
+    try:
+        process = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+        return process.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def run(sizes: Sequence[int], levels: Sequence[int], samples: int) -> dict:
+    """
+    Measure all operations for every book size and levels count
+    Levels counts over half of the book size are skipped
+
+    :return: dict: {'revision': ..., 'python': ..., 'results': [...]}
+    """
+    results = []
+    for size in sizes:
+        for levels_count in levels:
+            if levels_count > size // 2:
+                continue
+            for operation, result in measure(size, levels_count, samples).items():
+                results.append({'size': size, 'levels': levels_count, 'operation': operation, **result})
+                print(f'{size:>9}{levels_count:>7}  {operation:<28}{result["ops"]:>14.0f}'
+                      f'{result["p50_ns"]:>10}{result["p99_ns"]:>10}{result["peak_memory_bytes"]:>14}')
+    return {'revision': git_revision(), 'python': platform.python_version(), 'results': results}
+
+
+def compare(old: dict, new: dict) -> None:
+    """
+    Print ops/s of the new results relative to the old ones
+    """
+    old_results = {(item['size'], item['levels'], item['operation']): item for item in old['results']}
+    print(f'{old["revision"][:10]} -> {new["revision"][:10]}')
+    for item in new['results']:
+        key = (item['size'], item['levels'], item['operation'])
+        if key in old_results:
+            print(f'{key[0]:>9}{key[1]:>7}  {key[2]:<28}{item["ops"] / old_results[key]["ops"]:>8.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='Book sizes')
+    parser.add_argument('--levels', type=int, nargs='+', default=LEVELS, help='Levels per side')
+    parser.add_argument('--samples', type=int, default=10_000, help='Timed calls of every operation')
+    parser.add_argument('--output', default='benchmark.json', help='JSON results file')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='Compare two JSON results files')
+    arguments = parser.parse_args()
+
+    if arguments.compare:
+        with open(arguments.compare[0]) as old_file, open(arguments.compare[1]) as new_file:
+            compare(json.load(old_file), json.load(new_file))
+        sys.exit()
+
+    print(f'{"size":>9}{"levels":>7}  {"operation":<28}{"ops/s":>14}{"p50 ns":>10}{"p99 ns":>10}{"peak bytes":>14}')
+    with open(arguments.output, 'w') as file:
+        json.dump(run(arguments.sizes, arguments.levels, arguments.samples), file, indent=2)
+    print(f'Results were written to {arguments.output}')
@@ -0,0 +1,74 @@
+"""
+Replay wall-clock time by the number of worker processes
+
+Run from the project directory:
+    python -m Tests.Benchmarks.replay [symbols_count] [events_per_symbol]
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from Tests.OrderBook.Replay import (
+    FIELDS,
+    ReplayActions,
+    replay,
+)
+from Tests.OrderBook.Requests import RequestTypes
+
+
+def write_events(path: str, symbols_count: int, events_per_symbol: int, seed: int = 0) -> None:
+    """
+    Write a random event file, events of all symbols are interleaved
+
+    :param path: Event file path
+    :param symbols_count: Number of symbols
+    :param events_per_symbol: Number of events of every symbol
+    :param seed: Random seed
+
+    :return: None
+    """
+    generator = random.Random(seed)
+    resting = [[] for _ in range(symbols_count)]
+    next_id = 0
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+        for timestamp in range(symbols_count * events_per_symbol):
+            index = timestamp % symbols_count
+            symbol = f'SYM{index}'
+            ids = resting[index]
+            choice = generator.random()
+            if len(ids) < 100 or choice < 0.5:
+                side = generator.choice((RequestTypes.ASK, RequestTypes.BID))
+                price = 1000 + generator.randint(1, 50) if side == RequestTypes.ASK else 1000 - generator.randint(0, 49)
+                writer.writerow((timestamp, symbol, ReplayActions.ADD, next_id, side, price, generator.randint(1, 100)))
+                ids.append(next_id)
+                next_id += 1
+            elif choice < 0.8:
+                position = generator.randrange(len(ids))
+                ids[position], ids[-1] = ids[-1], ids[position]
+                writer.writerow((timestamp, symbol, ReplayActions.DELETE, ids.pop(), '', '', ''))
+            else:
+                writer.writerow((timestamp, symbol, ReplayActions.CHANGE, generator.choice(ids), '', '',
+                                 generator.randint(1, 100)))
+
+
+if __name__ == '__main__':
+    symbols_count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    events_per_symbol = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.csv')
+        write_events(path, symbols_count, events_per_symbol)
+        print(f'Symbols: {symbols_count}, events per symbol: {events_per_symbol}')
+        workers = 1
+        baseline = None
+        while workers <= (os.cpu_count() or 1):
+            start = time.perf_counter()
+            replay(path, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f'Workers: {workers:>3}, seconds: {elapsed:.2f}, speedup: {baseline / elapsed:.2f}')
+            workers *= 2
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .OrderBook import OrderBook
+from .Requests import (
+    Request,
+    PRICE_TYPE,
+)
+
+__all__ = ['AsyncOrderBook']
+
+LOGGER = logging.getLogger(__name__)
+_COMMAND_TYPE = Tuple[str, tuple, dict, asyncio.Future]
+
+
+class AsyncOrderBook:
+    """
+    asyncio front-end of the OrderBook
+
+    Commands from any number of coroutines are queued and applied in order by a single writer task,
+    all commands pending at a loop iteration are applied as one batch. Every command returns the result
+    of the OrderBook method or raises its exception (RequestError subclasses, ValueError).
+    """
+
+    def __init__(self, order_book: Optional[OrderBook] = None, max_batch: int = 1000):
+        """
+        :param order_book: OrderBook object, a new OrderBook if None
+        :param max_batch: Maximum number of commands applied in one batch
+        """
+        if not isinstance(max_batch, int) or max_batch < 1:
+            raise ValueError(f'max_batch should be an int over than 0: {max_batch}')
+        self.order_book: OrderBook = order_book if order_book is not None else OrderBook()
+        self.__max_batch: int = max_batch
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__writer: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> 'AsyncOrderBook':
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """
+        Start the writer task in the running event loop
+
+        :return: None
+        """
+        if self.__writer is not None:
+            raise RuntimeError('The AsyncOrderBook is already started.')
+        self.__queue = asyncio.Queue()
+        self.__writer = asyncio.get_running_loop().create_task(self.__write())
+
+    async def close(self) -> None:
+        """
+        Apply already queued commands and stop the writer task
+
+        :return: None
+        """
+        if self.__writer is None:
+            return
+        await self.__queue.join()
+        self.__writer.cancel()
+        try:
+            await self.__writer
+        except asyncio.CancelledError:
+            pass
+        self.__writer = None
+
+    async def __write(self) -> None:
+        """
+        Writer task: take all pending commands and apply them in order
+
+        :return: None
+        """
+        queue = self.__queue
+        while True:
+            batch: List[_COMMAND_TYPE] = [await queue.get()]
+            while len(batch) < self.__max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            LOGGER.debug('Applying a batch of %s commands' % len(batch))
+            for method, args, kwargs, future in batch:
+                try:
+                    result = getattr(self.order_book, method)(*args, **kwargs)
+                except Exception as exception:
+                    if not future.done():
+                        future.set_exception(exception)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                finally:
+                    queue.task_done()
+
+    async def __call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Queue a command and wait for its result
+
+        :param method: OrderBook method name
+
+        :return: The method result
+        """
+        if self.__writer is None:
+            raise RuntimeError('The AsyncOrderBook is not started.')
+        future = asyncio.get_running_loop().create_future()
+        self.__queue.put_nowait((method, args, kwargs, future))
+        return await future
+
+    async def add_request(self, request: Request) -> List[dict]:
+        """
+        See OrderBook.add_request
+        """
+        return await self.__call('add_request', request)
+
+    async def add_requests(self, requests: List[Request], raise_exceptions: bool = True) -> list:
+        """
+        See OrderBook.add_requests
+        """
+        return await self.__call('add_requests', requests, raise_exceptions=raise_exceptions)
+
+    async def delete_request(self, request_id: int, request_type: Optional[str] = None) -> None:
+        """
+        See OrderBook.delete_request
+        """
+        return await self.__call('delete_request', request_id, request_type=request_type)
+
+    async def change_request_info(self, request_id: int, price: Optional[PRICE_TYPE] = None,
+                                  volume: Optional[int] = None) -> List[dict]:
+        """
+        See OrderBook.change_request_info
+        """
+        return await self.__call('change_request_info', request_id, price=price, volume=volume)
+
+    async def change_requests(self, changes: Iterable[Tuple[int, Optional[PRICE_TYPE], Optional[int]]],
+                              raise_exceptions: bool = True) -> tuple:
+        """
+        See OrderBook.change_requests
+        """
+        return await self.__call('change_requests', changes, raise_exceptions=raise_exceptions)
+
+    async def get_request_info(self, request_id: int, request_type: Optional[str] = None) -> dict:
+        """
+        See OrderBook.get_request_info
+        """
+        return await self.__call('get_request_info', request_id, request_type=request_type)
+
+    async def get_snapshot(self, depth: Optional[int] = None) -> dict:
+        """
+        See OrderBook.get_snapshot
+        """
+        return await self.__call('get_snapshot', depth=depth)
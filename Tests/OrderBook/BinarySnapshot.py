@@ -0,0 +1,117 @@
+import struct
+import sys
+from array import array
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from . import BinarySnapshotError
+from .PriceLevels import PriceLadder
+from .Requests import (
+    Request,
+    RequestTypes,
+    REQUEST_CLASSES,
+    PRICE_TYPE,
+)
+
+__all__ = ['dump_ladders', 'load_levels']
+
+# Binary snapshot layout, all numbers are little-endian:
+#     header:   magic (4 bytes), version (uint16), padding (2 bytes), levels count (int64), requests count (int64)
+#     levels:   side (uint8), price is int (uint8), padding (6 bytes), price (float64), volume (int64), count (int64)
+#     requests: id (int64), volume (int64) for every request, level by level in the order of the level table
+# Levels go from the worst price to the best one, Asks first, requests of a level go in time priority.
+MAGIC = b'OBSN'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sH2xqq')
+_LEVEL = struct.Struct('<BB6xdqq')
+_REQUEST_SIZE = 16
+_SIDES = (RequestTypes.ASK, RequestTypes.BID)
+
+
+def dump_ladders(ladders: Iterable[PriceLadder]) -> bytes:
+    """
+    Write all levels and requests of the ladders to one buffer
+
+    :param ladders: Ask and Bid PriceLadder objects
+
+    :return: Binary snapshot
+    """
+    levels = bytearray()
+    requests = array('q')
+    levels_count = 0
+    for ladder in ladders:
+        side = _SIDES.index(ladder.request_type)
+        for level in ladder:
+            levels += _LEVEL.pack(side, isinstance(level.price, int), level.price, level.volume, level.count)
+            levels_count += 1
+            for request in level:
+                requests.append(request.id)
+                requests.append(request.volume)
+    if sys.byteorder == 'big':
+        requests.byteswap()
+    header = _HEADER.pack(MAGIC, VERSION, levels_count, len(requests) // 2)
+    return b''.join((header, levels, requests.tobytes()))
+
+
+def load_levels(buffer) -> Iterator[Tuple[str, PRICE_TYPE, int, List[Request]]]:
+    """
+    Read levels and requests from a binary snapshot
+    Request ids and volumes of all requests are converted with a single array copy
+
+    :param buffer: bytes, memoryview, mmap or any object supporting the buffer protocol
+
+    :return: Iterator of tuples: (side, price, level volume, requests in time priority)
+    """
+    with memoryview(buffer) as view:
+        if view.nbytes < _HEADER.size:
+            raise BinarySnapshotError('The buffer is too short for a binary snapshot.')
+        magic, version, levels_count, requests_count = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise BinarySnapshotError(f'Wrong binary snapshot magic: {magic}.')
+        if version != VERSION:
+            raise BinarySnapshotError(f'Unsupported binary snapshot version: {version}.')
+        if levels_count < 0 or requests_count < 0:
+            raise BinarySnapshotError('Negative counts in the binary snapshot header.')
+        levels_offset = _HEADER.size
+        requests_offset = levels_offset + levels_count * _LEVEL.size
+        if view.nbytes != requests_offset + requests_count * _REQUEST_SIZE:
+            raise BinarySnapshotError('The buffer size does not match the binary snapshot header.')
+
+        values = array('q')
+        values.frombytes(view[requests_offset:])
+        levels = list(_LEVEL.iter_unpack(view[levels_offset:requests_offset]))
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+    ids = values[0::2].tolist()
+    volumes = values[1::2].tolist()
+
+    # The whole level table is checked before any level is returned
+    start = 0
+    for side, price_is_int, price, volume, count in levels:
+        if side >= len(_SIDES):
+            raise BinarySnapshotError(f'Wrong side of a binary snapshot level: {side}.')
+        if count < 1:
+            raise BinarySnapshotError(f'Wrong number of requests of a binary snapshot level: {count}.')
+        if sum(volumes[start:start + count]) != volume:
+            raise BinarySnapshotError(f'The volume of the binary snapshot level {price} does not match its requests.')
+        start += count
+    if start != requests_count:
+        raise BinarySnapshotError('Numbers of requests of binary snapshot levels do not match the header.')
+
+    start = 0
+    for side, price_is_int, price, volume, count in levels:
+        request_class = REQUEST_CLASSES[_SIDES[side]]
+        if price_is_int:
+            price = int(price)
+        end = start + count
+        yield _SIDES[side], price, volume, [
+            request_class._restore(request_id, price, request_volume)
+            for request_id, request_volume in zip(ids[start:end], volumes[start:end])
+        ]
+        start = end
@@ -0,0 +1,254 @@
+import logging
+import multiprocessing
+import zlib
+from collections import defaultdict
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .OrderBook import OrderBook
+from .Requests import (
+    Request,
+    PRICE_TYPE,
+)
+
+__all__ = ['BookManager', 'shard_index']
+
+LOGGER = logging.getLogger(__name__)
+# method, symbol, args, kwargs
+_COMMAND_TYPE = Tuple[str, str, tuple, dict]
+_COMMANDS = frozenset((
+    'add_request',
+    'add_requests',
+    'delete_request',
+    'change_request_info',
+    'change_requests',
+    'get_request_info',
+    'get_snapshot',
+    'bbo',
+))
+
+
+def shard_index(symbol: str, shards_count: int) -> int:
+    """
+    Stable shard of the symbol, the same in every process and run (unlike hash(str))
+
+    :param symbol: Instrument symbol
+    :param shards_count: Number of shards
+
+    :return: Shard index
+    """
+    return zlib.crc32(symbol.encode()) % shards_count
+
+
+def _bbo(order_book: Optional[OrderBook]) -> Dict[str, Optional[PRICE_TYPE]]:
+    """
+    Best bid and ask prices of the book
+
+    :param order_book: OrderBook object or None for an unknown symbol
+
+    :return: dict: {'bid': price or None, 'ask': price or None}
+    """
+    if order_book is None:
+        return {'bid': None, 'ask': None}
+    return {'bid': order_book.best_bid(), 'ask': order_book.best_ask()}
+
+
+def _serve(connection: Connection, matching: bool) -> None:
+    """
+    Worker process: apply batches of commands to the books of its symbols
+
+    :param connection: Pipe end, receives lists of commands and None to stop, sends lists of (error, result)
+    :param matching: OrderBook matching mode
+
+    :return: None
+    """
+    books: Dict[str, OrderBook] = {}
+    while True:
+        commands: Optional[List[_COMMAND_TYPE]] = connection.recv()
+        if commands is None:
+            break
+        results = []
+        for method, symbol, args, kwargs in commands:
+            try:
+                if method == 'bbo':
+                    result = _bbo(books.get(symbol))
+                else:
+                    order_book = books.get(symbol)
+                    if order_book is None:
+                        order_book = books[symbol] = OrderBook(matching=matching)
+                    result = getattr(order_book, method)(*args, **kwargs)
+            except Exception as exception:
+                results.append((exception, None))
+            else:
+                results.append((None, result))
+        connection.send(results)
+    connection.close()
+
+
+class BookManager:
+    """
+    OrderBooks of many symbols in worker processes
+
+    Every symbol belongs to one worker, chosen by a stable hash of the symbol, and each worker owns
+    the OrderBooks of its symbols. Commands of one call are grouped by worker: every worker gets one
+    message, so all workers apply their parts of a batch in parallel.
+    """
+
+    def __init__(self, workers: int = 4, matching: bool = False, start_method: Optional[str] = None):
+        """
+        :param workers: Number of worker processes
+        :param matching: OrderBook matching mode
+        :param start_method: multiprocessing start method, the platform default if None
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(f'workers should be an int over than 0: {workers}')
+        self.workers: int = workers
+        self.matching: bool = matching
+        self.__context = multiprocessing.get_context(start_method)
+        self.__connections: List[Connection] = []
+        self.__processes: list = []
+
+    def __enter__(self) -> 'BookManager':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """
+        Start the worker processes
+
+        :return: None
+        """
+        if self.__processes:
+            raise RuntimeError('The BookManager is already started.')
+        for _ in range(self.workers):
+            connection, worker_connection = self.__context.Pipe()
+            process = self.__context.Process(target=_serve, args=(worker_connection, self.matching), daemon=True)
+            process.start()
+            worker_connection.close()
+            self.__connections.append(connection)
+            self.__processes.append(process)
+        LOGGER.debug('%s book workers were started' % self.workers)
+
+    def close(self) -> None:
+        """
+        Stop the worker processes, all books are lost
+
+        :return: None
+        """
+        for connection in self.__connections:
+            connection.send(None)
+            connection.close()
+        for process in self.__processes:
+            process.join()
+        self.__connections = []
+        self.__processes = []
+
+    def execute(self, commands: Sequence[_COMMAND_TYPE], raise_exceptions: bool = True) -> List[Any]:
+        """
+        Apply commands to the books, commands of every symbol are applied in the given order
+
+        :param commands: Tuples: (OrderBook method name, symbol, args, kwargs), the 'bbo' method
+                         returns {'bid': price or None, 'ask': price or None}
+        :param raise_exceptions: Raise the first exception of the commands or return exceptions as results
+
+        :return: Results of the commands in the given order
+        """
+        if not self.__processes:
+            raise RuntimeError('The BookManager is not started.')
+        batches: Dict[int, List[_COMMAND_TYPE]] = defaultdict(list)
+        positions: Dict[int, List[int]] = defaultdict(list)
+        for position, command in enumerate(commands):
+            if command[0] not in _COMMANDS:
+                raise ValueError(f'Unknown command: {command[0]}')
+            shard = shard_index(command[1], self.workers)
+            batches[shard].append(command)
+            positions[shard].append(position)
+
+        # Every batch is pickled before any is sent: a batch which can not be pickled must not leave
+        # replies of other workers in their pipes for the next call
+        payloads = {shard: ForkingPickler.dumps(batch) for shard, batch in batches.items()}
+        for shard, payload in payloads.items():
+            self.__connections[shard].send_bytes(payload)
+        results: List[Any] = [None] * len(commands)
+        errors: List[Tuple[int, Exception]] = []
+        for shard in batches:
+            for position, (error, result) in zip(positions[shard], self.__connections[shard].recv()):
+                if error is not None:
+                    errors.append((position, error))
+                    result = error
+                results[position] = result
+
+        if errors and raise_exceptions:
+            raise min(errors, key=lambda item: item[0])[1]
+        return results
+
+    def __execute_one(self, method: str, symbol: str, *args, **kwargs) -> Any:
+        return self.execute([(method, symbol, args, kwargs)])[0]
+
+    def add_request(self, symbol: str, request: Request) -> List[dict]:
+        """
+        See OrderBook.add_request
+        """
+        return self.__execute_one('add_request', symbol, request)
+
+    def add_requests(self, symbol: str, requests: List[Request], raise_exceptions: bool = True) -> list:
+        """
+        See OrderBook.add_requests
+        """
+        return self.__execute_one('add_requests', symbol, requests, raise_exceptions=raise_exceptions)
+
+    def delete_request(self, symbol: str, request_id: int, request_type: Optional[str] = None) -> None:
+        """
+        See OrderBook.delete_request
+        """
+        return self.__execute_one('delete_request', symbol, request_id, request_type=request_type)
+
+    def change_request_info(self, symbol: str, request_id: int, price: Optional[PRICE_TYPE] = None,
+                            volume: Optional[int] = None) -> List[dict]:
+        """
+        See OrderBook.change_request_info
+        """
+        return self.__execute_one('change_request_info', symbol, request_id, price=price, volume=volume)
+
+    def change_requests(self, symbol: str, changes: List[Tuple[int, Optional[PRICE_TYPE], Optional[int]]],
+                        raise_exceptions: bool = True) -> tuple:
+        """
+        See OrderBook.change_requests
+        """
+        return self.__execute_one('change_requests', symbol, changes, raise_exceptions=raise_exceptions)
+
+    def get_request_info(self, symbol: str, request_id: int, request_type: Optional[str] = None) -> dict:
+        """
+        See OrderBook.get_request_info
+        """
+        return self.__execute_one('get_request_info', symbol, request_id, request_type=request_type)
+
+    def get_snapshot(self, symbol: str, depth: Optional[int] = None) -> dict:
+        """
+        See OrderBook.get_snapshot
+        """
+        return self.__execute_one('get_snapshot', symbol, depth=depth)
+
+    def get_bbo(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Optional[PRICE_TYPE]]]:
+        """
+        Method for getting best bid and ask prices of many symbols with one message per worker
+
+        :param symbols: Instrument symbols
+
+        :return: dict: {symbol: {'bid': price or None, 'ask': price or None}}
+        """
+        symbols = list(symbols)
+        results = self.execute([('bbo', symbol, (), {}) for symbol in symbols])
+        return dict(zip(symbols, results))
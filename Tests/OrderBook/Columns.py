@@ -0,0 +1,127 @@
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Tuple,
+)
+
+from . import (
+    RequestIdError,
+    RequestTypeError,
+    RequestPriceError,
+    RequestVolumeError,
+    RequestAlreadyExistsError,
+)
+from .Requests import (
+    Request,
+    RequestTypes,
+    MAX_REQUEST_ID,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['check_columns', 'build_columns']
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _check_numpy() -> None:
+    """
+    Columnar ingestion and export need numpy, it is not required for the rest of the OrderBook
+
+    :return: None
+    """
+    if numpy is None:
+        raise ImportError('numpy is required for columnar ingestion and export: pip install numpy')
+
+
+def check_columns(ids: Any, sides: Any, prices: Any, volumes: Any) -> Tuple[list, list, list, list]:
+    """
+    Validate requests columns with vectorised checks following the rules of Request.price and Request.volume
+    Columns may be numpy arrays or any objects supporting the buffer protocol or sequences
+
+    :param ids: Requests ids, not negative int64 values without duplicates
+    :param sides: Requests types, RequestTypes.ASK or RequestTypes.BID
+    :param prices: Requests prices, ints or floats over than 0
+    :param volumes: Requests volumes, ints not lower than 1
+
+    :return: Columns converted to lists of Python objects: (ids, sides, prices, volumes)
+    """
+    _check_numpy()
+    ids, sides, prices, volumes = (numpy.asarray(column) for column in (ids, sides, prices, volumes))
+
+    # Columns should be one-dimensional and have the same length
+    if any(column.ndim != 1 for column in (ids, sides, prices, volumes)):
+        LOGGER.error('Columns are not one-dimensional')
+        raise ValueError('Columns should be one-dimensional.')
+    if not len(ids) == len(sides) == len(prices) == len(volumes):
+        LOGGER.error('Columns have different lengths')
+        raise ValueError('Columns should have the same length.')
+    if not len(ids):
+        return [], [], [], []
+
+    # Ids should be not negative ints without duplicates
+    if not numpy.issubdtype(ids.dtype, numpy.integer):
+        LOGGER.error('ids are not ints (%s)' % ids.dtype)
+        raise RequestIdError(f'ids should be ints, got {ids.dtype}.') from TypeError
+    if (ids < 0).any():
+        LOGGER.error('Some ids are lower than 0')
+        raise RequestIdError('ids can not be lower than 0.') from ValueError
+    if (ids > MAX_REQUEST_ID).any():
+        LOGGER.error('Some ids are over than int64')
+        raise RequestIdError(f'ids can not be over than {MAX_REQUEST_ID}.') from ValueError
+    if numpy.unique(ids).size != ids.size:
+        LOGGER.error('There are duplicated ids')
+        raise RequestAlreadyExistsError('ids should be unique.')
+
+    # Sides should be Ask or Bid
+    if not numpy.isin(sides, [RequestTypes.ASK, RequestTypes.BID]).all():
+        LOGGER.error('Some sides are not Ask or Bid')
+        raise RequestTypeError(
+            f'The request type should be {RequestTypes.ASK} or {RequestTypes.BID}.'
+        ) from TypeError
+
+    # Prices should be ints or floats over than 0
+    if not (numpy.issubdtype(prices.dtype, numpy.integer) or numpy.issubdtype(prices.dtype, numpy.floating)):
+        LOGGER.error('prices are not ints or floats (%s)' % prices.dtype)
+        raise RequestPriceError(f'The price should be an instance of int or float, got {prices.dtype}.') from TypeError
+    if not (prices > 0).all():
+        LOGGER.error('Some prices are lower than 0')
+        raise RequestPriceError('The price should be over than 0.') from ValueError
+
+    # Volumes should be ints not lower than 1
+    if not numpy.issubdtype(volumes.dtype, numpy.integer):
+        LOGGER.error('volumes are not ints (%s)' % volumes.dtype)
+        raise RequestVolumeError(f'A volume should be an instance of int, got {volumes.dtype}.') from TypeError
+    if (volumes < 1).any():
+        LOGGER.error('Some volumes are lower than 1')
+        raise RequestVolumeError('A volume can not be lower than 1.') from ValueError
+
+    return ids.tolist(), sides.tolist(), prices.tolist(), volumes.tolist()
+
+
+def build_columns(requests: Iterable[Request]) -> Dict[str, Any]:
+    """
+    Build requests columns in the form accepted by check_columns
+
+    :param requests: Iterable of requests
+
+    :return: dict of numpy arrays: {'ids': ..., 'sides': ..., 'prices': ..., 'volumes': ...}
+    """
+    _check_numpy()
+    ids, sides, prices, volumes = [], [], [], []
+    for request in requests:
+        ids.append(request.id)
+        sides.append(request.type)
+        prices.append(request.price)
+        volumes.append(request.volume)
+    return {
+        'ids': numpy.array(ids, dtype=numpy.int64),
+        'sides': numpy.array(sides, dtype=numpy.str_),
+        'prices': numpy.array(prices) if prices else numpy.array([], dtype=numpy.float64),
+        'volumes': numpy.array(volumes, dtype=numpy.int64),
+    }
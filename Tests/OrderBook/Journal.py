@@ -0,0 +1,216 @@
+import logging
+import mmap
+import os
+import struct
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+)
+
+from .Requests import (
+    Request,
+    RequestTypes,
+    REQUEST_CLASSES,
+    PRICE_TYPE,
+)
+
+if TYPE_CHECKING:
+    from .OrderBook import OrderBook
+
+__all__ = ['Journal', 'JournalOperations']
+
+LOGGER = logging.getLogger(__name__)
+
+# operation, side, flags, padding, request id, price, volume
+_RECORD = struct.Struct('<BBBxqdq')
+_SIDES = (RequestTypes.ASK, RequestTypes.BID)
+_SIDE_CODES = {side: code for code, side in enumerate(_SIDES)}
+
+# Record flags
+_PRICE_IS_INT = 1
+_HAS_PRICE = 2
+_HAS_VOLUME = 4
+
+
+class JournalOperations:
+    """
+    Operations recorded in the journal
+    """
+    ADD = 1
+    DELETE = 2
+    CHANGE = 3
+
+
+class Journal:
+    """
+    Append-only journal of OrderBook changes
+
+    Every change is a fixed-size binary record (28 bytes). Records are written to the file as they come
+    and the file is flushed and fsync'ed every sync_every records, so up to sync_every - 1 last records
+    may be lost on a crash. A partially written last record is dropped when the journal is opened,
+    so records written after a crash are not misaligned.
+    """
+    RECORD_SIZE = _RECORD.size
+
+    def __init__(self, path: str, sync_every: int = 1):
+        """
+        :param path: Journal file path, the file is created if it does not exist
+        :param sync_every: Number of records between fsync calls
+        """
+        if not isinstance(sync_every, int) or sync_every < 1:
+            raise ValueError(f'sync_every should be an int over than 0: {sync_every}')
+        self.path: str = path
+        self.__sync_every: int = sync_every
+        self.__not_synced: int = 0
+        self.__replaying: bool = False
+        self.__file = open(path, 'ab')
+        # Dropping a partially written last record, so new records start at a record boundary
+        size = self.__file.seek(0, os.SEEK_END)
+        if size % _RECORD.size:
+            LOGGER.warning('A partially written record (%s bytes) was dropped from the journal %s'
+                           % (size % _RECORD.size, path))
+            self.__file.truncate(size - size % _RECORD.size)
+
+    def __enter__(self) -> 'Journal':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __write(self, operation: int, side: int, flags: int, request_id: int, price: float, volume: int) -> None:
+        """
+        Write a record to the journal file
+
+        :return: None
+        """
+        if self.__replaying:
+            return
+        self.__file.write(_RECORD.pack(operation, side, flags, request_id, price, volume))
+        self.__not_synced += 1
+        if self.__not_synced >= self.__sync_every:
+            self.sync()
+
+    def write_add(self, request: Request) -> None:
+        """
+        Record adding the request
+
+        :param request: Request object
+
+        :return: None
+        """
+        flags = _PRICE_IS_INT if isinstance(request.price, int) else 0
+        self.__write(JournalOperations.ADD, _SIDE_CODES[request.type], flags, request.id, request.price, request.volume)
+
+    def write_delete(self, request_id: int) -> None:
+        """
+        Record deleting the request
+
+        :param request_id: Request id
+
+        :return: None
+        """
+        self.__write(JournalOperations.DELETE, 0, 0, request_id, 0, 0)
+
+    def write_change(self, request_id: int, price: Optional[PRICE_TYPE] = None, volume: Optional[int] = None) -> None:
+        """
+        Record changing the request
+
+        :param request_id: Request id
+        :param price: New price or None if the price was not changed
+        :param volume: New volume or None if the volume was not changed
+
+        :return: None
+        """
+        flags = 0
+        if price is not None:
+            flags |= _HAS_PRICE | (_PRICE_IS_INT if isinstance(price, int) else 0)
+        if volume is not None:
+            flags |= _HAS_VOLUME
+        self.__write(JournalOperations.CHANGE, 0, flags, request_id, price or 0, volume or 0)
+
+    def sync(self) -> None:
+        """
+        Flush written records and fsync the journal file
+
+        :return: None
+        """
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.__not_synced = 0
+
+    def close(self) -> None:
+        """
+        Sync and close the journal file
+
+        :return: None
+        """
+        if not self.__file.closed:
+            self.sync()
+            self.__file.close()
+
+    def replay(self, order_book: 'OrderBook') -> int:
+        """
+        Apply all records of the journal file to the OrderBook
+        The file is memory-mapped, consecutive adds are applied with OrderBook.add_requests_bulk.
+        Records are not written again while replaying, so the OrderBook may use this journal.
+
+        :param order_book: OrderBook object
+
+        :return: Number of applied records
+        """
+        self.sync()
+        size = os.path.getsize(self.path)
+        size -= size % _RECORD.size
+        if not size:
+            return 0
+
+        LOGGER.debug('Trying to replay %s records from the journal %s' % (size // _RECORD.size, self.path))
+        self.__replaying = True
+        try:
+            with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    count = self.__apply(order_book, view[:size])
+        finally:
+            self.__replaying = False
+
+        LOGGER.debug('%s records were replayed' % count)
+        return count
+
+    @staticmethod
+    def __apply(order_book: 'OrderBook', view: memoryview) -> int:
+        """
+        Apply journal records to the OrderBook
+
+        :param order_book: OrderBook object
+        :param view: Journal records
+
+        :return: Number of applied records
+        """
+        added = []
+        count = 0
+        max_id = -1
+        for operation, side, flags, request_id, price, volume in _RECORD.iter_unpack(view):
+            count += 1
+            if flags & _PRICE_IS_INT:
+                price = int(price)
+            if operation == JournalOperations.ADD:
+                added.append(REQUEST_CLASSES[_SIDES[side]]._restore(request_id, price, volume))
+                max_id = max(max_id, request_id)
+                continue
+            if added:
+                order_book.add_requests_bulk(added)
+                added = []
+            if operation == JournalOperations.DELETE:
+                order_book.delete_request(request_id)
+            else:
+                order_book.change_request_info(
+                    request_id,
+                    price=price if flags & _HAS_PRICE else None,
+                    volume=volume if flags & _HAS_VOLUME else None,
+                )
+        if added:
+            order_book.add_requests_bulk(added)
+
+        # New requests must not get ids of the replayed ones
+        order_book.id_allocator.skip(max_id)
+        return count
@@ -0,0 +1,240 @@
+import logging
+import os
+import threading
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from .OrderBook import OrderBook
+
+__all__ = ['render_metrics', 'MetricsFileWriter', 'MetricsHTTPServer']
+
+LOGGER = logging.getLogger(__name__)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    """
+    Prometheus labels string
+    """
+    if not labels:
+        return ''
+    values = ','.join(
+        '%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in labels.items()
+    )
+    return '{%s}' % values
+
+
+def render_metrics(order_book: 'OrderBook', prefix: str = 'order_book',
+                   labels: Optional[Dict[str, str]] = None) -> str:
+    """
+    Render metrics of the book in the Prometheus text format
+    Only counters of the book are read (OrderBook.get_metrics and OrderBook.get_stats), never its levels,
+    so metrics may be rendered from another thread while the book is changed.
+    Method calls and errors are counters, so rates are computed by Prometheus.
+
+    :param order_book: OrderBook object, method metrics are rendered only if its stats are enabled
+    :param prefix: Metric names prefix
+    :param labels: Labels added to every metric, e.g. {'symbol': 'AAPL'}
+
+    :return: Metrics text
+    """
+    labels = labels or {}
+    lines: List[str] = []
+
+    def metric(name: str, metric_type: str, description: str, samples: list) -> None:
+        lines.append(f'# HELP {prefix}_{name} {description}')
+        lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+        for suffix, sample_labels, value in samples:
+            lines.append(f'{prefix}_{name}{suffix}{_labels({**labels, **sample_labels})} {value}')
+
+    metrics = order_book.get_metrics()
+    metric('version', 'counter', 'Number of book changes', [('', {}, metrics['version'])])
+    metric('requests', 'gauge', 'Number of resting requests',
+           [('', {'side': side}, count) for side, count in metrics['requests'].items()])
+    metric('levels', 'gauge', 'Number of price levels',
+           [('', {'side': side}, count) for side, count in metrics['levels'].items()])
+    metric('best_price', 'gauge', 'Best price of the side, absent for an empty side',
+           [('', {'side': side}, price) for side, price in metrics['best_prices'].items() if price is not None])
+
+    stats = order_book.get_stats()
+    if stats:
+        metric('calls_total', 'counter', 'Number of method calls',
+               [('', {'method': method}, method_stats['count']) for method, method_stats in stats.items()])
+        metric('errors_total', 'counter', 'Number of exceptions raised by methods', [
+            ('', {'method': method, 'error': error}, count)
+            for method, method_stats in stats.items() for error, count in method_stats['errors'].items()
+        ])
+        latency_samples = []
+        for method, method_stats in stats.items():
+            latency_samples += [
+                ('', {'method': method, 'quantile': '0.5'}, method_stats['p50_ns'] / 1e9),
+                ('', {'method': method, 'quantile': '0.99'}, method_stats['p99_ns'] / 1e9),
+                ('_sum', {'method': method}, method_stats['total_ns'] / 1e9),
+                ('_count', {'method': method}, method_stats['count']),
+            ]
+        metric('latency_seconds', 'summary', 'Method latency, quantiles are upper bounds of log2 buckets',
+               latency_samples)
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsFileWriter:
+    """
+    Thread writing book metrics to a file every interval seconds
+    The file is replaced atomically, so a collector (e.g. node_exporter textfile collector)
+    never reads a partially written file.
+    """
+
+    def __init__(self, order_book: 'OrderBook', path: str, interval: float = 15,
+                 prefix: str = 'order_book', labels: Optional[Dict[str, str]] = None):
+        """
+        :param order_book: OrderBook object
+        :param path: Metrics file path
+        :param interval: Seconds between writes
+        :param prefix: Metric names prefix
+        :param labels: Labels added to every metric
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError(f'interval should be a number over than 0: {interval}')
+        self.path: str = path
+        self.__order_book = order_book
+        self.__interval: float = interval
+        self.__prefix: str = prefix
+        self.__labels: Optional[Dict[str, str]] = labels
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'MetricsFileWriter':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def write(self) -> None:
+        """
+        Write metrics to the file now
+
+        :return: None
+        """
+        temporary_path = f'{self.path}.tmp'
+        with open(temporary_path, 'w') as file:
+            file.write(render_metrics(self.__order_book, self.__prefix, self.__labels))
+        os.replace(temporary_path, self.path)
+
+    def __run(self) -> None:
+        while not self.__stop.wait(self.__interval):
+            try:
+                self.write()
+            except OSError as exception:
+                LOGGER.error('Metrics were not written to %s: %s' % (self.path, exception))
+
+    def start(self) -> None:
+        """
+        Start the writer thread
+
+        :return: None
+        """
+        if self.__thread is not None:
+            raise RuntimeError('The MetricsFileWriter is already started.')
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, name='MetricsFileWriter', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the writer thread and write metrics for the last time
+
+        :return: None
+        """
+        if self.__thread is None:
+            return
+        self.__stop.set()
+        self.__thread.join()
+        self.__thread = None
+        self.write()
+
+
+class MetricsHTTPServer:
+    """
+    HTTP server thread rendering book metrics on GET /metrics
+    """
+
+    def __init__(self, order_book: 'OrderBook', port: int = 0, host: str = '127.0.0.1',
+                 prefix: str = 'order_book', labels: Optional[Dict[str, str]] = None):
+        """
+        :param order_book: OrderBook object
+        :param port: Port, a free port is chosen if 0
+        :param host: Host to listen on
+        :param prefix: Metric names prefix
+        :param labels: Labels added to every metric
+        """
+        def render() -> bytes:
+            return render_metrics(order_book, prefix, labels).encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = render()
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                LOGGER.debug('Metrics request: %s' % (format % args))
+
+        self.__server = ThreadingHTTPServer((host, port), Handler)
+        self.__server.daemon_threads = True
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'MetricsHTTPServer':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def port(self) -> int:
+        """
+        Port getter
+
+        :return: Port the server listens on
+        """
+        return self.__server.server_address[1]
+
+    def start(self) -> None:
+        """
+        Start the server thread
+
+        :return: None
+        """
+        if self.__thread is not None:
+            raise RuntimeError('The MetricsHTTPServer is already started.')
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name='MetricsHTTPServer', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the server thread and close the socket
+
+        :return: None
+        """
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
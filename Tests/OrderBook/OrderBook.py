@@ -1,6 +1,11 @@
 import logging
+from collections import OrderedDict
+from itertools import islice
 from typing import (
+    Any,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Union,
@@ -11,31 +16,139 @@ from . import (
     RequestWasNotFoundError,
     RequestIdError,
     RequestError,
+    RequestPriceError,
     RequestTypeError,
     RequestAlreadyExistsError,
+    BinarySnapshotError,
+)
+from .BinarySnapshot import (
+    dump_ladders,
+    load_levels,
+)
+from .Columns import (
+    build_columns,
+    check_columns,
+)
+from .Journal import Journal
+from .Stats import Stats
+from .PriceLevels import (
+    DensePriceLadder,
+    PriceLadder,
 )
 from .Requests import (
+    IdAllocator,
     Request,
     RequestTypes,
+    REQUEST_CLASSES,
     PRICE_TYPE,
+    MAX_REQUEST_ID,
+)
+from .Subscriptions import (
+    SlowConsumerPolicies,
+    Subscription,
 )
+from .Ticks import TickSize
 
-__all__ = ['OrderBook']
+__all__ = ['OrderBook', 'RequestStatuses']
 
 LOGGER = logging.getLogger(__name__)
-_REQUESTS_LIST_TYPE = Dict[str, List[Request]]
+_LADDERS_TYPE = Dict[str, Union[PriceLadder, DensePriceLadder]]
+_CHANGES_TYPE = Dict[Tuple[str, PRICE_TYPE], int]
+# Public methods recorded by OrderBook stats
+_INSTRUMENTED_METHODS = (
+    'add_request',
+    'add_requests',
+    'add_requests_bulk',
+    'add_columns',
+    'get_columns',
+    'delete_request',
+    'get_request_info',
+    'change_request_info',
+    'change_requests',
+    'get_snapshot',
+    'get_snapshot_since',
+    'to_bytes',
+)
+
+
+class RequestStatuses:
+    """
+    Per-request statuses returned by OrderBook.add_requests_bulk
+    """
+    ADDED = 0
+    NOT_A_REQUEST = 1
+    WRONG_TYPE = 2
+    # The same id is in the book or the request object rests in another book
+    ALREADY_EXISTS = 3
+    WRONG_PRICE = 4
+
+
+# Exceptions add_request raises for the same problems
+_STATUS_ERRORS = {
+    RequestStatuses.NOT_A_REQUEST: RequestError,
+    RequestStatuses.WRONG_TYPE: RequestTypeError,
+    RequestStatuses.ALREADY_EXISTS: RequestAlreadyExistsError,
+    RequestStatuses.WRONG_PRICE: RequestPriceError,
+}
 
 
 class OrderBook:
     """
     Object for working with a list of requests
+
+    If matching is enabled, a new request is matched against the opposite side in price-time priority
+    and only its remainder is added to the requests list
+
+    If stats are enabled, public methods are wrapped on the instance to count calls, exceptions
+    and latencies, see get_stats. Without stats the methods are not wrapped and cost nothing extra.
+
+    If a tick size is set, prices must be multiples of it: prices of added and changed requests are replaced
+    with canonical prices of their ticks (e.g. 0.1 + 0.2 becomes 0.3 for the tick size 0.1) and levels are keyed
+    by integer numbers of ticks, so prices equal up to float rounding are the same level.
+    With a dense window levels are kept in lists indexed by ticks (see DensePriceLadder) instead of sorted maps.
     """
 
-    def __init__(self):
-        self.__requests: _REQUESTS_LIST_TYPE = {
-            RequestTypes.ASK: [],
-            RequestTypes.BID: [],
-        }
+    def __init__(self, matching: bool = False, journal: Optional[Journal] = None, stats: bool = False,
+                 id_allocator: Optional[IdAllocator] = None, tick_size: Optional[PRICE_TYPE] = None,
+                 dense_window: Optional[int] = None):
+        """
+        :param matching: Match new requests against the opposite side or not
+        :param journal: Journal to record all changes to
+        :param stats: Record calls, exceptions and latencies of public methods or not
+        :param id_allocator: Allocator of ids of requests created by create_request, Request.id_allocator if None
+        :param tick_size: Price tick size or None for any prices
+        :param dense_window: Initial number of ticks of dense ladders or None for sorted ladders,
+                             requires the tick size
+        """
+        self.__matching: bool = matching
+        self.__tick_size: Optional[TickSize] = TickSize(tick_size) if tick_size is not None else None
+        self.__id_allocator: IdAllocator = id_allocator if id_allocator is not None else Request.id_allocator
+        self.__journal: Optional[Journal] = journal
+        if dense_window is not None:
+            if self.__tick_size is None:
+                raise ValueError('dense_window requires tick_size')
+            self.__ladders: _LADDERS_TYPE = {
+                request_type: DensePriceLadder(request_type, self.__tick_size, dense_window)
+                for request_type in (RequestTypes.ASK, RequestTypes.BID)
+            }
+        else:
+            self.__ladders: _LADDERS_TYPE = {
+                request_type: PriceLadder(request_type, self.__tick_size)
+                for request_type in (RequestTypes.ASK, RequestTypes.BID)
+            }
+        # Index "request id -> resting request", the side and the level are known from the request itself
+        self.__requests: Dict[int, Request] = {}
+        # Number of resting requests by side
+        self.__counts: Dict[str, int] = {RequestTypes.ASK: 0, RequestTypes.BID: 0}
+        # Book version and "(request type, price) -> version of the last level change" ordered by version
+        self.__version: int = 0
+        self.__changes: _CHANGES_TYPE = OrderedDict()
+        self.__subscriptions: List[Subscription] = []
+        self.__stats: Optional[Stats] = None
+        if stats:
+            self.__stats = Stats()
+            for name in _INSTRUMENTED_METHODS:
+                setattr(self, name, self.__stats.wrap(name, getattr(self, name)))
 
     @staticmethod
     def __check_request_id(request_id: int) -> None:
@@ -56,6 +169,11 @@ class OrderBook:
             LOGGER.error('request_id is lower than 0 (%s)' % request_id)
             raise RequestIdError(f'request_id can not be lower than 0: {request_id}') from ValueError
 
+        # request_id should fit in int64
+        if request_id > MAX_REQUEST_ID:
+            LOGGER.error('request_id is over than int64 (%s)' % request_id)
+            raise RequestIdError(f'request_id can not be over than {MAX_REQUEST_ID}: {request_id}') from ValueError
+
     @staticmethod
     def __check_request_type(request_type: str) -> None:
         """
@@ -72,14 +190,218 @@ class OrderBook:
                 f'The request type should be {RequestTypes.ASK} or {RequestTypes.BID}: {request_type}'
             ) from TypeError
 
-    def add_request(self, request: Request) -> None:
+    @staticmethod
+    def __check_depth(depth: Optional[int]) -> None:
         """
-        Method for adding a new request to the requests list
+        Snapshot depth validation method
+
+        :param depth: Snapshot depth
+
+        :return: None
+        """
+        # depth should be None or a not negative int
+        if depth is not None and (not isinstance(depth, int) or depth < 0):
+            LOGGER.error('depth is not a not negative int (%s)' % depth)
+            raise ValueError(f'depth should be None or a not negative int: {depth}')
+
+    def get_stats(self) -> Dict[str, dict]:
+        """
+        Method for getting stats of public methods
+
+        :return: dict: {method name: {'count': ..., 'total_ns': ..., 'p50_ns': ..., 'p99_ns': ...,
+                 'buckets': {latency upper bound ns: count}, 'errors': {exception class name: count}}},
+                 an empty dict if stats are disabled
+        """
+        return self.__stats.as_dict if self.__stats is not None else {}
+
+    def reset_stats(self) -> None:
+        """
+        Method for resetting stats of public methods
+
+        :return: None
+        """
+        if self.__stats is not None:
+            self.__stats.reset()
+
+    def get_metrics(self) -> dict:
+        """
+        Method for getting the book load from counters, without iterating over levels or requests,
+        so it may be called from another thread while the book is changed
+
+        :return: dict: {'version': ..., 'requests': {request type: count}, 'levels': {request type: count},
+                 'best_prices': {request type: price or None}}
+        """
+        return {
+            'version': self.__version,
+            'requests': dict(self.__counts),
+            'levels': {request_type: len(ladder) for request_type, ladder in self.__ladders.items()},
+            'best_prices': {request_type: ladder.best_price() for request_type, ladder in self.__ladders.items()},
+        }
+
+    def best_bid(self) -> Optional[PRICE_TYPE]:
+        """
+        Method for getting the best bid price in constant time, may be called from another thread
+
+        :return: Best bid price or None if there are no bids
+        """
+        return self.__ladders[RequestTypes.BID].best_price()
+
+    def best_ask(self) -> Optional[PRICE_TYPE]:
+        """
+        Method for getting the best ask price in constant time, may be called from another thread
+
+        :return: Best ask price or None if there are no asks
+        """
+        return self.__ladders[RequestTypes.ASK].best_price()
+
+    def spread(self) -> Optional[PRICE_TYPE]:
+        """
+        Method for getting the difference between the best ask and bid prices
+        The spread is a canonical price if the book has a tick size, it is negative for a crossed book
+
+        :return: Spread or None if a side is empty
+        """
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        if self.__tick_size is not None:
+            return self.__tick_size.normalize(ask - bid)
+        return ask - bid
+
+    def mid(self) -> Optional[float]:
+        """
+        Method for getting the middle between the best ask and bid prices
+
+        :return: Mid price or None if a side is empty
+        """
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return (ask + bid) / 2
+
+    @property
+    def tick_size(self) -> Optional[PRICE_TYPE]:
+        """
+        Tick size getter
+
+        :return: Tick size or None if prices are not on a grid
+        """
+        return self.__tick_size.value if self.__tick_size is not None else None
+
+    @property
+    def id_allocator(self) -> IdAllocator:
+        """
+        Request id allocator getter
+
+        :return: IdAllocator object
+        """
+        return self.__id_allocator
+
+    def create_request(self, request_type: str, price: PRICE_TYPE, volume: int,
+                       request_id: Optional[int] = None) -> Request:
+        """
+        Method for creating a request with an id from the book id allocator, the request is not added
 
+        :param request_type: Request type
+        :param price: Request price
+        :param volume: Request volume
+        :param request_id: Request id assigned by the caller, a new id is allocated if None
+
+        :return: Request object
+        """
+        self.__check_request_type(request_type)
+        return REQUEST_CLASSES[request_type](price, volume, request_id=request_id, id_allocator=self.__id_allocator)
+
+    @property
+    def version(self) -> int:
+        """
+        Book version getter, the version grows with every change of a price level
+
+        :return: Book version
+        """
+        return self.__version
+
+    def __touch(self, request_type: str, price: PRICE_TYPE) -> None:
+        """
+        Mark the price level as changed in a new book version
+
+        :param request_type: Level side
+        :param price: Level price
+
+        :return: None
+        """
+        self.__version += 1
+        key = (request_type, price)
+        self.__changes[key] = self.__version
+        self.__changes.move_to_end(key)
+
+        if self.__subscriptions:
+            level = self.__ladders[request_type].get(price)
+            volume = level.volume if level is not None else 0
+            for subscription in self.__subscriptions:
+                subscription._publish_level(request_type, price, volume, self.__version)
+            self.__drop_closed_subscriptions()
+
+    def __publish_order(self, action: str, request: Request) -> None:
+        """
+        Publish an order update to subscriptions
+
+        :param action: 'add', 'delete', 'change' or 'fill'
         :param request: Request object
 
         :return: None
         """
+        if self.__subscriptions:
+            request_info = request.as_dict
+            for subscription in self.__subscriptions:
+                subscription._publish_order(action, request_info, self.__version)
+            self.__drop_closed_subscriptions()
+
+    def __drop_closed_subscriptions(self) -> None:
+        """
+        Forget closed subscriptions
+
+        :return: None
+        """
+        if any(subscription.closed for subscription in self.__subscriptions):
+            self.__subscriptions = [subscription for subscription in self.__subscriptions if not subscription.closed]
+
+    def subscribe(self, maxsize: int = 1000, policy: str = SlowConsumerPolicies.CONFLATE,
+                  order_events: bool = False) -> Subscription:
+        """
+        Method for subscribing to updates of price levels and, optionally, requests
+        Updates are consumed with "async for", see Subscription
+
+        :param maxsize: Maximum number of queued updates
+        :param policy: SlowConsumerPolicies value, what to do with a new update when the queue is full
+        :param order_events: Publish request updates in addition to level updates or not
+
+        :return: Subscription object, close it to unsubscribe
+        """
+        subscription = Subscription(maxsize=maxsize, policy=policy, order_events=order_events)
+        self.__subscriptions.append(subscription)
+        LOGGER.debug('A new subscription was added (policy: %s)' % policy)
+        return subscription
+
+    @property
+    def matching(self) -> bool:
+        """
+        Matching mode getter
+
+        :return: True if new requests are matched against the opposite side
+        """
+        return self.__matching
+
+    def add_request(self, request: Request) -> List[dict]:
+        """
+        Method for adding a new request to the requests list
+        In matching mode the request is matched first and only its remainder is added,
+        the volume of the added request is decreased to the remainder
+
+        :param request: Request object
+
+        :return: List of fills: [{'taker_id': ..., 'maker_id': ..., 'price': ..., 'volume': ...}, ...]
+        """
         LOGGER.debug('Trying to add a new request: %s' % str(request))
 
         # The request must be an instance of the Request
@@ -87,20 +409,107 @@ class OrderBook:
             LOGGER.error('The request is not an instance of the Request (%s)' % type(request))
             raise RequestError(f'The request must be an instance of the Request: {request}.') from TypeError
 
+        # The request must have a type of the book side
+        self.__check_request_type(request.type)
+
+        existing_request = self.__requests.get(request.id)
+
         # The request must not exist in the requests list
-        if request in self.__requests[request.type]:
+        if existing_request is request:
             LOGGER.warning('The request is already exists')
             raise RequestAlreadyExistsError(f'The request is already exists: {request}.')
 
         # The request with the same id must not exist in the requests list
-        if self._get_request(request.id, raise_if_not_found=False) is not None:
+        if existing_request is not None:
             LOGGER.error('The request with id "%s" is already exists' % request.id)
             raise RequestAlreadyExistsError(f'The request with id "{request.id}" is already exists.')
 
-        # Adding the request to the requests list
-        self.__requests[request.type].append(request)
+        # The request object must not rest in another book, its queue links would be overwritten
+        if request._level is not None:
+            LOGGER.error('The request is already resting in another book (%s)' % request.id)
+            raise RequestAlreadyExistsError(f'The request is already resting in another book: {request}.')
+
+        # The price must be on the tick grid
+        if self.__tick_size is not None:
+            request.price = self.__tick_size.normalize(request.price)
+
+        # The request is recorded as it came, matching it again on replay gives the same result
+        if self.__journal is not None:
+            self.__journal.write_add(request)
+
+        fills = []
+        volume = request.volume
+        if self.__matching:
+            fills, volume = self.__match(request)
+            if not volume:
+                LOGGER.debug('The request was filled completely')
+                self.__publish_order('fill', request)
+                return fills
+            if fills:
+                request.volume = volume
+
+        self.__insert(request)
+        self.__publish_order('add', request)
 
         LOGGER.debug('The request was added successfully')
+        return fills
+
+    def __insert(self, request: Request) -> None:
+        """
+        Add the request to the end of its price level queue and to the id index
+
+        :param request: Request object
+
+        :return: None
+        """
+        self.__ladders[request.type].get_or_create(request.price).append(request)
+        self.__requests[request.id] = request
+        self.__counts[request.type] += 1
+        self.__touch(request.type, request.price)
+
+    def __match(self, request: Request) -> Tuple[List[dict], int]:
+        """
+        Match the request against the opposite side in price-time priority
+
+        :param request: Request object
+
+        :return: List of fills and the volume left unmatched
+        """
+        is_bid = request.type == RequestTypes.BID
+        ladder = self.__ladders[RequestTypes.ASK if is_bid else RequestTypes.BID]
+        fills = []
+        volume = request.volume
+
+        while volume:
+            level = ladder.best()
+            # Matching stops on an empty side or on the first level the request does not cross
+            if level is None or (level.price > request.price if is_bid else level.price < request.price):
+                break
+            while volume and level:
+                maker = level.head
+                traded = min(volume, maker.volume)
+                fills.append({
+                    'taker_id': request.id,
+                    'maker_id': maker.id,
+                    'price': level.price,
+                    'volume': traded,
+                })
+                volume -= traded
+                if traded == maker.volume:
+                    level.remove(maker)
+                    del self.__requests[maker.id]
+                    self.__counts[maker.type] -= 1
+                    self.__publish_order('fill', maker)
+                else:
+                    level.reduce_volume(maker, traded)
+                    self.__publish_order('change', maker)
+            if not level:
+                ladder.remove(level.price)
+            self.__touch(ladder.request_type, level.price)
+
+        if fills:
+            LOGGER.debug('The request was matched: %s' % fills)
+        return fills, volume
 
     def add_requests(self, requests: List[Request],
                      raise_exceptions: bool = True) -> Union[List[Tuple[Request, str]], None]:
@@ -112,16 +521,190 @@ class OrderBook:
         :param raise_exceptions: Raise exceptions or not
         :return: List of "bad" requests or None
         """
-        bad_requests = []
+        if raise_exceptions:
+            for request in requests:
+                self.add_request(request)
+            return []
+
+        requests = list(requests)
+        statuses = self.add_requests_bulk(requests)
+        return [
+            (request, _STATUS_ERRORS[status].__name__)
+            for request, status in zip(requests, statuses) if status != RequestStatuses.ADDED
+        ]
+
+    def add_requests_bulk(self, requests: Iterable[Request]) -> bytearray:
+        """
+        Method for adding multiple requests to the requests list in a single pass without raising exceptions
+        Requests with the same id as a request in the list or earlier in the batch are not added
+        Only a failed journal write is raised, the request is not added and requests before it stay added
+
+        :param requests: Iterable of requests
+
+        :return: bytearray with a RequestStatuses value for each request
+        """
+        if self.__matching:
+            # Every request has to be matched against the book left by the previous one
+            return self.__add_requests_one_by_one(requests)
+
+        statuses = bytearray()
+        index = self.__requests
+        ladders = self.__ladders
+        journal = self.__journal
+        tick_size = self.__tick_size
+        for request in requests:
+            if not isinstance(request, Request):
+                statuses.append(RequestStatuses.NOT_A_REQUEST)
+                continue
+            if request.type not in ladders:
+                statuses.append(RequestStatuses.WRONG_TYPE)
+                continue
+            if request.id in index or request._level is not None:
+                statuses.append(RequestStatuses.ALREADY_EXISTS)
+                continue
+            if tick_size is not None:
+                try:
+                    request.price = tick_size.normalize(request.price)
+                except RequestPriceError:
+                    statuses.append(RequestStatuses.WRONG_PRICE)
+                    continue
+            # The request is journaled first, so a failed write does not leave it in the book
+            if journal is not None:
+                journal.write_add(request)
+            self.__insert(request)
+            self.__publish_order('add', request)
+            statuses.append(RequestStatuses.ADDED)
+
+        LOGGER.debug('%s of %s requests were added' % (statuses.count(RequestStatuses.ADDED), len(statuses)))
+        return statuses
+
+    def add_columns(self, ids: Any, sides: Any, prices: Any, volumes: Any) -> None:
+        """
+        Method for adding requests given as columns (numpy arrays or buffer protocol objects) to the requests list
+        Columns are validated as a whole before any request is added,
+        requests are created from the validated values without validating each of them again
+
+        :param ids: Requests ids
+        :param sides: Requests types (RequestTypes.ASK or RequestTypes.BID)
+        :param prices: Requests prices
+        :param volumes: Requests volumes
+
+        :return: None
+        """
+        LOGGER.debug('Trying to add requests from columns')
+        ids, sides, prices, volumes = check_columns(ids, sides, prices, volumes)
+        if self.__tick_size is not None:
+            prices = [self.__tick_size.normalize(price) for price in prices]
+
+        # Requests with the same ids must not exist in the requests list
+        index = self.__requests
+        existing_ids = [request_id for request_id in ids if request_id in index]
+        if existing_ids:
+            LOGGER.error('Requests with ids %s are already exist' % existing_ids)
+            raise RequestAlreadyExistsError(f'Requests with ids {existing_ids} are already exist.')
+
+        requests = (
+            REQUEST_CLASSES[side]._restore(request_id, price, volume)
+            for request_id, side, price, volume in zip(ids, sides, prices, volumes)
+        )
+        if self.__matching:
+            for request in requests:
+                self.add_request(request)
+        else:
+            journal = self.__journal
+            for request in requests:
+                if journal is not None:
+                    journal.write_add(request)
+                self.__insert(request)
+                self.__publish_order('add', request)
+
+        LOGGER.debug('%s requests were added from columns' % len(ids))
+
+    def get_columns(self) -> Dict[str, Any]:
+        """
+        Method for getting all requests as columns in the form accepted by add_columns
+        Requests are listed by side (Asks, then Bids), by level as in the snapshot and in time priority in a level
+
+        :return: dict of numpy arrays: {'ids': ..., 'sides': ..., 'prices': ..., 'volumes': ...}
+        """
+        return build_columns(
+            request for request_type in (RequestTypes.ASK, RequestTypes.BID)
+            for level in self.__ladders[request_type] for request in level
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Method for getting a binary snapshot with all requests and levels of the requests list
+
+        :return: Binary snapshot, see BinarySnapshot for the layout
+        """
+        result = dump_ladders(self.__ladders.values())
+        LOGGER.debug('A binary snapshot of %s bytes was created' % len(result))
+        return result
+
+    @classmethod
+    def from_bytes(cls, buffer, **kwargs) -> 'OrderBook':
+        """
+        Method for creating an OrderBook from a binary snapshot
+        The buffer is read through memoryview, so bytes, mmap or any buffer protocol object can be used.
+        Levels get their total volumes from the snapshot, loaded requests are not matched or journaled.
+
+        :param buffer: Binary snapshot created by to_bytes
+        :param kwargs: OrderBook arguments
+
+        :return: OrderBook object
+        """
+        order_book = cls(**kwargs)
+        order_book.__load_levels(buffer)
+        return order_book
+
+    def __load_levels(self, buffer) -> None:
+        """
+        Add levels and requests from a binary snapshot
+
+        :param buffer: Binary snapshot
+
+        :return: None
+        """
+        index = self.__requests
+        count = 0
+        for request_type, price, volume, requests in load_levels(buffer):
+            if self.__tick_size is not None and self.__tick_size.normalize(price) != price:
+                price = self.__tick_size.normalize(price)
+                for request in requests:
+                    request._price = price
+            self.__ladders[request_type].get_or_create(price).extend(requests, volume)
+            self.__counts[request_type] += len(requests)
+            self.__touch(request_type, price)
+            index.update((request.id, request) for request in requests)
+            count += len(requests)
+
+        # Every request must have a unique id
+        if len(index) != count:
+            LOGGER.error('The binary snapshot has duplicated request ids')
+            raise BinarySnapshotError('The binary snapshot has duplicated request ids.')
+
+        self.__id_allocator.skip(max(index, default=-1))
+        LOGGER.debug('%s requests were loaded from a binary snapshot' % count)
+
+    def __add_requests_one_by_one(self, requests: Iterable[Request]) -> bytearray:
+        """
+        Add requests with add_request converting exceptions to statuses
+
+        :param requests: Iterable of requests
+
+        :return: bytearray with a RequestStatuses value for each request
+        """
+        errors_statuses = {error: status for status, error in _STATUS_ERRORS.items()}
+        statuses = bytearray()
         for request in requests:
             try:
                 self.add_request(request)
-            except Exception as exception:
-                if raise_exceptions:
-                    raise exception
-                bad_requests.append((request, type(exception).__name__))
-                continue
-        return bad_requests
+            except RequestError as exception:
+                statuses.append(errors_statuses[type(exception)])
+            else:
+                statuses.append(RequestStatuses.ADDED)
+        return statuses
 
     def delete_request(self, request_id: int, request_type: Optional[str] = None) -> None:
         """
@@ -138,7 +721,11 @@ class OrderBook:
         request = self._get_request(request_id=request_id, request_type=request_type)
 
         # Deleting request
-        self.__requests[request.type].remove(request)
+        self.__unlink_request(request, request.price)
+        del self.__requests[request.id]
+        self.__publish_order('delete', request)
+        if self.__journal is not None:
+            self.__journal.write_delete(request.id)
 
         LOGGER.debug('The request was deleted successfully')
 
@@ -156,19 +743,14 @@ class OrderBook:
         LOGGER.debug('Trying to find the request with id "%s"' % request_id)
         self.__check_request_id(request_id)
 
-        # If request_type is None - creating a list self._requests['Ask'] + self._requests['Bid']
-        if request_type is None:
-            requests_list = self.__requests[RequestTypes.ASK] + self.__requests[RequestTypes.BID]
-        # Else searching in self._requests[request_type]
-        else:
+        if request_type is not None:
             self.__check_request_type(request_type)
-            requests_list = self.__requests[request_type]
 
-        # Searching request
-        for request in requests_list:
-            if request_id == request.id:
-                LOGGER.debug('The request was found successfully')
-                return request
+        # Searching request, if request_type is specified the request must have the same type
+        request = self.__requests.get(request_id)
+        if request is not None and (request_type is None or request.type == request_type):
+            LOGGER.debug('The request was found successfully')
+            return request
 
         LOGGER.warning('The request with id "%s" was not found' % request_id)
 
@@ -176,6 +758,23 @@ class OrderBook:
         if raise_if_not_found:
             raise RequestWasNotFoundError(f'The request with id "{request_id}" was not found.')
 
+    def __unlink_request(self, request: Request, price: PRICE_TYPE) -> None:
+        """
+        Remove the request from its price level queue, dropping the level if it became empty
+
+        :param request: Request object
+        :param price: Price of the level the request rests at
+
+        :return: None
+        """
+        ladder = self.__ladders[request.type]
+        level = ladder.get(price)
+        level.remove(request)
+        self.__counts[request.type] -= 1
+        if not level:
+            ladder.remove(price)
+        self.__touch(request.type, price)
+
     def get_request_info(self, request_id: int, request_type: Optional[str] = None) -> dict:
         """
         Method for getting a request info from the requests list
@@ -188,15 +787,17 @@ class OrderBook:
         return self._get_request(request_id=request_id, request_type=request_type).as_dict
 
     def change_request_info(self, request_id: int, price: Optional[PRICE_TYPE] = None,
-                            volume: Optional[int] = None) -> None:
+                            volume: Optional[int] = None) -> List[dict]:
         """
         Method for changing a request info in the requests list
+        In matching mode a request moved through the best opposite price is matched as add_request does:
+        its volume is decreased to the remainder, a completely filled request is deleted from the book
 
         :param request_id: Request id
         :param price: New price
         :param volume: New volume
 
-        :return: None
+        :return: List of fills: [{'taker_id': ..., 'maker_id': ..., 'price': ..., 'volume': ...}, ...]
         """
         LOGGER.debug('Trying to change the request info (request_id: %s)' % request_id)
 
@@ -208,46 +809,156 @@ class OrderBook:
         # Searching request
         request = self._get_request(request_id)
 
+        # New values are validated before anything is changed, so a wrong change neither moves nor matches
+        if price is not None:
+            Request._check_price(price)
+            if self.__tick_size is not None:
+                price = self.__tick_size.normalize(price)
+        if volume is not None:
+            Request._check_volume(volume)
+
+        if self.__journal is not None:
+            self.__journal.write_change(request.id, price=price, volume=volume)
+
         # Changing data
+        moved = False
         if price is not None:
             LOGGER.debug('Changing price from %s to %s' % (request.price, price))
+            old_price = request.price
             request.price = price
+            # Moving the request to the end of the new price level queue
+            if request.price != old_price:
+                self.__unlink_request(request, old_price)
+                self.__insert(request)
+                moved = True
         if volume is not None:
             LOGGER.debug('Changing volume from %s to %s' % (request.volume, volume))
+            old_volume = request.volume
             request.volume = volume
+            level = self.__ladders[request.type].get(request.price)
+            level.volume += request.volume - old_volume
+            # A volume increase loses the time priority, a decrease keeps the place in the queue
+            if request.volume > old_volume and level.tail is not request:
+                level.remove(request)
+                level.append(request)
+            self.__touch(request.type, request.price)
+
+        fills = self.__match_resting(request) if moved and self.__matching else []
+        self.__publish_order('change' if request.id in self.__requests else 'fill', request)
 
         LOGGER.debug('The request info was changed successfully')
+        return fills
 
-    def get_snapshot(self) -> dict:
+    def __match_resting(self, request: Request) -> List[dict]:
+        """
+        Match the request resting at the end of its level queue against the opposite side
+
+        :param request: Request object
+
+        :return: List of fills
+        """
+        fills, volume = self.__match(request)
+        if not fills:
+            return fills
+        if volume:
+            self.__ladders[request.type].get(request.price).reduce_volume(request, request.volume - volume)
+            self.__touch(request.type, request.price)
+        else:
+            LOGGER.debug('The request was filled completely')
+            self.__unlink_request(request, request.price)
+            del self.__requests[request.id]
+        return fills
+
+    def change_requests(self, changes: Iterable[Tuple[int, Optional[PRICE_TYPE], Optional[int]]],
+                        raise_exceptions: bool = True) -> Tuple[List[dict], List[Tuple[int, str]]]:
+        """
+        Method for changing multiple requests in the requests list, see change_request_info
+        If raise_exceptions is False method will return a list of ids of "bad" changes
+
+        :param changes: Iterable of (request id, new price or None, new volume or None) tuples
+        :param raise_exceptions: Raise exceptions or not, changes before the failed one stay applied
+
+        :return: Fills of all changes matched in matching mode in the order of changes
+            and list of (request id, exception class name) tuples of "bad" changes
+        """
+        fills = []
+        errors = []
+        for request_id, price, volume in changes:
+            try:
+                fills.extend(self.change_request_info(request_id, price=price, volume=volume))
+            except (RequestError, ValueError) as exception:
+                if raise_exceptions:
+                    raise
+                errors.append((request_id, type(exception).__name__))
+        return fills, errors
+
+    def iter_snapshot(self, request_type: str, depth: Optional[int] = None) -> Iterator[dict]:
+        """
+        Method for lazy iterating over price levels of one side from the best price to the worst one
+        Levels are read from the book on demand, so the book must not be changed while iterating
+
+        :param request_type: Request type
+        :param depth: Maximum number of levels, all levels if None
+
+        :return: Iterator of dicts: {'price': ..., 'volume': ...}
+        """
+        self.__check_request_type(request_type)
+        self.__check_depth(depth)
+        for level in islice(reversed(self.__ladders[request_type]), depth):
+            yield {
+                'price': level.price,
+                'volume': level.volume,
+            }
+
+    def get_snapshot(self, depth: Optional[int] = None) -> dict:
         """
         Method for getting a snapshot of the current requests list
+        If depth is specified only the best depth levels of each side are returned
+
+        :param depth: Maximum number of levels per side, all levels if None
 
         :return: Requests dict: {'Asks': [...], 'Bids': [...]}
         """
-        ask_prices = sorted({x.price for x in self.__requests[RequestTypes.ASK]}, reverse=True)
-        bid_prices = sorted({x.price for x in self.__requests[RequestTypes.BID]})
-        result = {
-            'Asks': [],
-            'Bids': [],
-        }
-
-        for ask_price in ask_prices:
-            volume = 0
-            for request in self.__requests[RequestTypes.ASK]:
-                if request.price == ask_price:
-                    volume += request.volume
-            result['Asks'].append({
-                'price': ask_price,
-                'volume': volume,
-            })
-        for bid_price in bid_prices:
-            volume = 0
-            for request in self.__requests[RequestTypes.BID]:
-                if request.price == bid_price:
-                    volume += request.volume
-            result['Bids'].append({
-                'price': bid_price,
-                'volume': volume,
-            })
+        result = {}
+        for request_type, key in ((RequestTypes.ASK, 'Asks'), (RequestTypes.BID, 'Bids')):
+            # Snapshot lists levels from the worst price to the best one: Asks descending, Bids ascending
+            levels = list(self.iter_snapshot(request_type, depth))
+            levels.reverse()
+            result[key] = levels
         LOGGER.debug('A new snapshot was created: %s' % result)
         return result
+
+    def get_snapshot_since(self, version: int) -> dict:
+        """
+        Method for getting price levels changed after the given book version
+        Only changed levels are read, a removed level is returned with volume 0
+
+        :param version: Book version received from the version property or a previous call
+
+        :return: Changes dict: {'version': ..., 'Asks': [...], 'Bids': [...]}
+        """
+        # version should be a not negative int
+        if not isinstance(version, int) or version < 0:
+            LOGGER.error('version is not a not negative int (%s)' % version)
+            raise ValueError(f'version should be a not negative int: {version}')
+
+        changed = {RequestTypes.ASK: [], RequestTypes.BID: []}
+        for (request_type, price), level_version in reversed(self.__changes.items()):
+            if level_version <= version:
+                break
+            changed[request_type].append(price)
+
+        result = {'version': self.__version}
+        for request_type, key in ((RequestTypes.ASK, 'Asks'), (RequestTypes.BID, 'Bids')):
+            ladder = self.__ladders[request_type]
+            levels = []
+            # Levels go in the same order as in the snapshot: Asks descending, Bids ascending
+            for price in sorted(changed[request_type], reverse=request_type == RequestTypes.ASK):
+                level = ladder.get(price)
+                levels.append({
+                    'price': price,
+                    'volume': level.volume if level is not None else 0,
+                })
+            result[key] = levels
+        LOGGER.debug('Changes since version %s: %s' % (version, result))
+        return result
@@ -0,0 +1,558 @@
+from bisect import bisect_left
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from .Requests import (
+    Request,
+    RequestTypes,
+    PRICE_TYPE,
+)
+from .Ticks import TickSize
+
+__all__ = ['PriceLevel', 'PriceLadder', 'DensePriceLadder']
+
+
+class PriceLevel:
+    """
+    All requests of one side resting at the same price, in FIFO (time priority) order
+
+    The queue is an intrusive doubly linked list: requests keep links to their neighbours (_prev, _next)
+    and to the level (_level), so any request is unlinked in O(1) without searching the queue.
+    The total volume of the level is maintained on every change, so it never has to be recomputed
+    """
+    __slots__ = ('price', 'volume', 'count', 'head', 'tail')
+
+    def __init__(self, price: PRICE_TYPE):
+        """
+        :param price: Level price
+        """
+        self.price: PRICE_TYPE = price
+        self.volume: int = 0
+        self.count: int = 0
+        # The first and the last requests of the queue
+        self.head: Optional[Request] = None
+        self.tail: Optional[Request] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Request]:
+        request = self.head
+        while request is not None:
+            # The next request is taken first, so the current one may be removed while iterating
+            next_request = request._next
+            yield request
+            request = next_request
+
+    def append(self, request: Request) -> None:
+        """
+        Add the request to the end of the queue
+
+        :param request: Request object, it must not be in any queue
+
+        :return: None
+        """
+        tail = self.tail
+        request._prev = tail
+        request._next = None
+        request._level = self
+        if tail is None:
+            self.head = request
+        else:
+            tail._next = request
+        self.tail = request
+        self.count += 1
+        self.volume += request.volume
+
+    def extend(self, requests: Iterable[Request], volume: int) -> None:
+        """
+        Add requests with the known total volume to the end of the queue
+
+        :param requests: Request objects in time priority, they must not be in any queue
+        :param volume: Total volume of the requests
+
+        :return: None
+        """
+        tail = self.tail
+        count = 0
+        for request in requests:
+            request._prev = tail
+            request._next = None
+            request._level = self
+            if tail is None:
+                self.head = request
+            else:
+                tail._next = request
+            tail = request
+            count += 1
+        self.tail = tail
+        self.count += count
+        self.volume += volume
+
+    def remove(self, request: Request) -> None:
+        """
+        Unlink the request from the queue
+
+        :param request: Request object, it must be in this queue
+
+        :return: None
+        """
+        prev_request, next_request = request._prev, request._next
+        if prev_request is None:
+            self.head = next_request
+        else:
+            prev_request._next = next_request
+        if next_request is None:
+            self.tail = prev_request
+        else:
+            next_request._prev = prev_request
+        request._prev = request._next = request._level = None
+        self.count -= 1
+        self.volume -= request.volume
+
+    def reduce_volume(self, request: Request, volume: int) -> None:
+        """
+        Decrease the request volume keeping its place in the queue
+
+        :param request: Request object
+        :param volume: Volume to subtract, must be lower than the request volume
+
+        :return: None
+        """
+        request.volume -= volume
+        self.volume -= volume
+
+
+class PriceLadder:
+    """
+    Sorted map "price -> PriceLevel" for one side of the book
+
+    Prices are kept as sort keys ordered from the worst price to the best one,
+    so the best level is always the last item:
+        - Ask: the lowest price is the best one, the sort key is -price
+        - Bid: the highest price is the best one, the sort key is price
+    Level lookup by price is a dict access and the best level is available in O(1).
+    Sort keys are split into sorted chunks of at most CHUNK_SIZE keys: a level insert or remove is
+    a binary search over the chunk maximums and in one chunk, so the list memmove is bounded by the chunk size
+    instead of the number of levels P. Splitting a full chunk or dropping an empty one shifts the list
+    of chunks, P / CHUNK_SIZE items, which happens at most once per CHUNK_SIZE / 2 inserts or removes.
+    With a tick size levels are keyed by integer numbers of ticks instead of prices,
+    level prices stay canonical prices of the TickSize.
+    """
+    # Maximum number of sort keys in a chunk
+    CHUNK_SIZE = 1024
+
+    def __init__(self, request_type: str, tick_size: Optional[TickSize] = None):
+        """
+        :param request_type: Side of the book (RequestTypes.ASK or RequestTypes.BID)
+        :param tick_size: TickSize object or None to key levels by prices
+        """
+        self.request_type: str = request_type
+        self.tick_size: Optional[TickSize] = tick_size
+        self.__sign: int = -1 if request_type == RequestTypes.ASK else 1
+        self.__levels: Dict[PRICE_TYPE, PriceLevel] = {}
+        # Sorted chunks of sort keys and the last key of every chunk
+        self.__chunks: List[List[PRICE_TYPE]] = []
+        self.__maximums: List[PRICE_TYPE] = []
+
+    def __len__(self) -> int:
+        return len(self.__levels)
+
+    def __contains__(self, price: PRICE_TYPE) -> bool:
+        return self.__key(price) in self.__levels
+
+    def __key(self, price: PRICE_TYPE) -> PRICE_TYPE:
+        """
+        Level key of the price: the price itself or its number of ticks
+        """
+        return price if self.tick_size is None else self.tick_size.to_ticks(price)
+
+    def __iter__(self) -> Iterator[PriceLevel]:
+        """
+        Iterate over levels from the worst price to the best one
+        """
+        sign = self.__sign
+        levels = self.__levels
+        for chunk in self.__chunks:
+            for key in chunk:
+                yield levels[sign * key]
+
+    def __reversed__(self) -> Iterator[PriceLevel]:
+        """
+        Iterate over levels from the best price to the worst one
+        """
+        sign = self.__sign
+        levels = self.__levels
+        for chunk in reversed(self.__chunks):
+            for key in reversed(chunk):
+                yield levels[sign * key]
+
+    def get(self, price: PRICE_TYPE) -> Optional[PriceLevel]:
+        """
+        Get the level with the given price
+
+        :param price: Level price
+
+        :return: PriceLevel object or None if there is no such level
+        """
+        return self.__levels.get(self.__key(price))
+
+    def get_or_create(self, price: PRICE_TYPE) -> PriceLevel:
+        """
+        Get the level with the given price, creating it if it does not exist
+
+        :param price: Level price
+
+        :return: PriceLevel object
+        """
+        level_key = self.__key(price)
+        level = self.__levels.get(level_key)
+        if level is None:
+            level = self.__levels[level_key] = PriceLevel(price)
+            key = self.__sign * level_key
+            chunks = self.__chunks
+            # A new best key goes to the end of the last chunk without a search
+            if chunks and key > self.__maximums[-1] and len(chunks[-1]) < self.CHUNK_SIZE:
+                chunks[-1].append(key)
+                self.__maximums[-1] = key
+            else:
+                self.__insert_key(key)
+        return level
+
+    def __insert_key(self, key: PRICE_TYPE) -> None:
+        """
+        Add the sort key to its chunk, splitting the chunk if it is full
+
+        :param key: Sort key
+
+        :return: None
+        """
+        chunks, maximums = self.__chunks, self.__maximums
+        if not chunks:
+            chunks.append([key])
+            maximums.append(key)
+            return
+        index = bisect_left(maximums, key)
+        if index == len(chunks):
+            # A new best key goes to the end of the last chunk
+            index -= 1
+            chunks[index].append(key)
+            maximums[index] = key
+        else:
+            chunk = chunks[index]
+            chunk.insert(bisect_left(chunk, key), key)
+        chunk = chunks[index]
+        if len(chunk) > self.CHUNK_SIZE:
+            # The upper half is added before it is cut from the chunk,
+            # so the last key of the last chunk is the best one at any moment
+            half = len(chunk) // 2
+            chunks.insert(index + 1, chunk[half:])
+            maximums.insert(index, chunk[half - 1])
+            del chunk[half:]
+
+    def remove(self, price: PRICE_TYPE) -> None:
+        """
+        Remove the level with the given price
+
+        :param price: Level price
+
+        :return: None
+        """
+        level_key = self.__key(price)
+        del self.__levels[level_key]
+        key = self.__sign * level_key
+        chunks, maximums = self.__chunks, self.__maximums
+        # The best level is the last one, so removing it needs neither a search nor a shift
+        chunk = chunks[-1]
+        if maximums[-1] == key and len(chunk) > 1:
+            chunk.pop()
+            maximums[-1] = chunk[-1]
+            return
+        index = bisect_left(maximums, key)
+        chunk = chunks[index]
+        if len(chunk) == 1:
+            # The chunk is dropped as a whole, so it is never seen empty
+            del chunks[index]
+            del maximums[index]
+            return
+        if chunk[-1] == key:
+            chunk.pop()
+            maximums[index] = chunk[-1]
+        else:
+            del chunk[bisect_left(chunk, key)]
+        # A small chunk is merged into the next one, so the number of chunks stays about P / CHUNK_SIZE
+        if index + 1 < len(chunks) and len(chunk) + len(chunks[index + 1]) <= self.CHUNK_SIZE // 2:
+            chunks[index + 1][:0] = chunk
+            del chunks[index]
+            del maximums[index]
+
+    def best(self) -> Optional[PriceLevel]:
+        """
+        Get the level with the best price
+
+        :return: PriceLevel object or None if the ladder is empty
+        """
+        if not self.__chunks:
+            return None
+        return self.__levels[self.__sign * self.__chunks[-1][-1]]
+
+    def best_price(self) -> Optional[PRICE_TYPE]:
+        """
+        Get the best price from the sorted keys only, without a level lookup,
+        so the price may be read from another thread while the ladder is changed
+
+        :return: Best price or None if the ladder is empty
+        """
+        try:
+            level_key = self.__sign * self.__chunks[-1][-1]
+        except IndexError:
+            return None
+        return level_key if self.tick_size is None else self.tick_size.to_price(level_key)
+
+
+class DensePriceLadder:
+    """
+    Levels of one side in a list indexed by the number of ticks from a base price, with the interface of PriceLadder
+
+    Suits instruments with active prices inside a bounded range of ticks: level lookup, insert and remove
+    are list index operations, the best and the worst occupied indexes are maintained, so the best level
+    is available in O(1) and iterating goes over the list between them.
+    A price out of the list is handled by re-centring the occupied range in the list, the list is doubled
+    if the range takes more than half of it, up to MAX_GROWTH times the initial window. Levels which still
+    do not fit (e.g. a single far-away price) are kept in a sorted PriceLadder overflow, so memory
+    and the cost of finding the next occupied index stay bounded by the window.
+    """
+    # Maximum list size relative to the initial window
+    MAX_GROWTH = 8
+
+    def __init__(self, request_type: str, tick_size: TickSize, window: int = 4096):
+        """
+        :param request_type: Side of the book (RequestTypes.ASK or RequestTypes.BID)
+        :param tick_size: TickSize object
+        :param window: Initial number of ticks in the list
+        """
+        if not isinstance(window, int) or window < 2:
+            raise ValueError(f'window should be an int over than 1: {window}')
+        self.request_type: str = request_type
+        self.tick_size: TickSize = tick_size
+        self.__is_ask: bool = request_type == RequestTypes.ASK
+        self.__max_size: int = window * self.MAX_GROWTH
+        self.__levels: List[Optional[PriceLevel]] = [None] * window
+        # Number of ticks of the price at the index 0, set by the first level
+        self.__base: Optional[int] = None
+        self.__count: int = 0
+        # The lowest and the highest occupied indexes
+        self.__low: int = -1
+        self.__high: int = -1
+        # Levels out of the list
+        self.__overflow: PriceLadder = PriceLadder(request_type, tick_size)
+        # Written in one step after every change, so it may be read from another thread
+        self.__best_price: Optional[PRICE_TYPE] = None
+
+    def __len__(self) -> int:
+        return self.__count + len(self.__overflow)
+
+    def __contains__(self, price: PRICE_TYPE) -> bool:
+        return self.get(price) is not None
+
+    def __iter_list(self, best_first: bool) -> Iterator[PriceLevel]:
+        """
+        Iterate over levels of the list by index, without copying it
+        """
+        if not self.__count:
+            return
+        levels = self.__levels
+        if best_first == self.__is_ask:
+            indexes = range(self.__low, self.__high + 1)
+        else:
+            indexes = range(self.__high, self.__low - 1, -1)
+        for index in indexes:
+            level = levels[index]
+            if level is not None:
+                yield level
+
+    def __is_better_than_list(self, level: PriceLevel) -> bool:
+        """
+        Check if the overflow level is better than any price of the list
+        """
+        ticks = self.tick_size.to_ticks(level.price)
+        return ticks < self.__base if self.__is_ask else ticks >= self.__base + len(self.__levels)
+
+    def __iter__(self) -> Iterator[PriceLevel]:
+        """
+        Iterate over levels from the worst price to the best one
+        """
+        listed = False
+        for level in self.__overflow:
+            if not listed and self.__is_better_than_list(level):
+                yield from self.__iter_list(best_first=False)
+                listed = True
+            yield level
+        if not listed:
+            yield from self.__iter_list(best_first=False)
+
+    def __reversed__(self) -> Iterator[PriceLevel]:
+        """
+        Iterate over levels from the best price to the worst one
+        """
+        listed = False
+        for level in reversed(self.__overflow):
+            if not listed and not self.__is_better_than_list(level):
+                yield from self.__iter_list(best_first=True)
+                listed = True
+            yield level
+        if not listed:
+            yield from self.__iter_list(best_first=True)
+
+    def get(self, price: PRICE_TYPE) -> Optional[PriceLevel]:
+        """
+        Get the level with the given price
+
+        :param price: Level price
+
+        :return: PriceLevel object or None if there is no such level
+        """
+        if self.__base is None:
+            return None
+        index = self.tick_size.to_ticks(price) - self.__base
+        if 0 <= index < len(self.__levels):
+            return self.__levels[index]
+        return self.__overflow.get(price)
+
+    def get_or_create(self, price: PRICE_TYPE) -> PriceLevel:
+        """
+        Get the level with the given price, creating it if it does not exist
+
+        :param price: Level price
+
+        :return: PriceLevel object
+        """
+        ticks = self.tick_size.to_ticks(price)
+        if self.__base is None:
+            self.__base = ticks - len(self.__levels) // 2
+        index = ticks - self.__base
+        if not 0 <= index < len(self.__levels):
+            level = self.__overflow.get(price)
+            if level is not None:
+                return level
+            if not self.__recentre(ticks):
+                level = self.__overflow.get_or_create(price)
+                self.__update_best_price()
+                return level
+            index = ticks - self.__base
+
+        level = self.__levels[index]
+        if level is None:
+            level = self.__levels[index] = PriceLevel(price)
+            self.__count += 1
+            if self.__count == 1:
+                self.__low = self.__high = index
+            elif index < self.__low:
+                self.__low = index
+            elif index > self.__high:
+                self.__high = index
+            self.__update_best_price()
+        return level
+
+    def remove(self, price: PRICE_TYPE) -> None:
+        """
+        Remove the level with the given price
+
+        :param price: Level price
+
+        :return: None
+        """
+        if self.__base is None:
+            raise KeyError(price)
+        levels = self.__levels
+        index = self.tick_size.to_ticks(price) - self.__base
+        if not 0 <= index < len(levels):
+            self.__overflow.remove(price)
+        else:
+            if levels[index] is None:
+                raise KeyError(price)
+            levels[index] = None
+            self.__count -= 1
+            if not self.__count:
+                self.__low = self.__high = -1
+            # The next occupied index exists, since the list is not empty
+            elif index == self.__low:
+                while levels[self.__low] is None:
+                    self.__low += 1
+            elif index == self.__high:
+                while levels[self.__high] is None:
+                    self.__high -= 1
+        self.__update_best_price()
+
+    def __recentre(self, ticks: int) -> bool:
+        """
+        Move listed levels so the range of them and the given number of ticks is in the middle of the list,
+        overflow levels which get into the list are moved to it
+
+        :param ticks: Number of ticks of a new level
+
+        :return: False if the range does not fit the maximum list size, nothing is changed then
+        """
+        if self.__count:
+            low_ticks = min(ticks, self.__base + self.__low)
+            high_ticks = max(ticks, self.__base + self.__high)
+        else:
+            low_ticks = high_ticks = ticks
+        span = high_ticks - low_ticks + 1
+        size = len(self.__levels)
+        while span * 2 > size and size * 2 <= self.__max_size:
+            size *= 2
+        if span > size:
+            return False
+        base = low_ticks - (size - span) // 2
+
+        levels: List[Optional[PriceLevel]] = [None] * size
+        low = high = -1
+        if self.__count:
+            shift = self.__base - base
+            low, high = self.__low + shift, self.__high + shift
+            levels[low:high + 1] = self.__levels[self.__low:self.__high + 1]
+        count = self.__count
+        for level in list(self.__overflow):
+            index = self.tick_size.to_ticks(level.price) - base
+            if 0 <= index < size:
+                self.__overflow.remove(level.price)
+                levels[index] = level
+                count += 1
+                low = index if low < 0 else min(low, index)
+                high = max(high, index)
+        self.__levels, self.__base, self.__count, self.__low, self.__high = levels, base, count, low, high
+        return True
+
+    def best(self) -> Optional[PriceLevel]:
+        """
+        Get the level with the best price
+
+        :return: PriceLevel object or None if the ladder is empty
+        """
+        best = self.__levels[self.__low if self.__is_ask else self.__high] if self.__count else None
+        overflow_best = self.__overflow.best()
+        if overflow_best is not None and (best is None or self.__is_better_than_list(overflow_best)):
+            return overflow_best
+        return best
+
+    def __update_best_price(self) -> None:
+        """
+        Store the best price after a change of levels
+        """
+        level = self.best()
+        self.__best_price = level.price if level is not None else None
+
+    def best_price(self) -> Optional[PRICE_TYPE]:
+        """
+        Get the best price stored after the last change, so the price may be read from another thread
+        while the ladder is changed: indexes and the list are never read by this method
+
+        :return: Best price or None if the ladder is empty
+        """
+        return self.__best_price
@@ -0,0 +1,214 @@
+import csv
+import heapq
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import RequestError
+from .OrderBook import OrderBook
+from .Requests import (
+    REQUEST_CLASSES,
+    PRICE_TYPE,
+)
+
+__all__ = [
+    'FIELDS',
+    'ReplayActions',
+    'ReplayResult',
+    'parse_events',
+    'split_lines',
+    'read_events',
+    'replay_symbol',
+    'replay',
+]
+
+LOGGER = logging.getLogger(__name__)
+# timestamp, action, request id, side, price, volume
+_EVENT_TYPE = Tuple[Union[int, float], str, int, str, Optional[PRICE_TYPE], Optional[int]]
+# timestamp, symbol, best bid price, best ask price
+_SAMPLE_TYPE = Tuple[Union[int, float], str, Optional[PRICE_TYPE], Optional[PRICE_TYPE]]
+
+FIELDS = ('timestamp', 'symbol', 'action', 'id', 'side', 'price', 'volume')
+
+
+class ReplayActions:
+    """
+    Actions of the event file
+    """
+    ADD = 'add'
+    DELETE = 'delete'
+    CHANGE = 'change'
+
+
+class ReplayResult(NamedTuple):
+    """
+    Result of a replay
+    snapshots: final snapshot of every symbol
+    samples: top of book samples of all symbols in timestamp order
+    """
+    snapshots: Dict[str, dict]
+    samples: List[_SAMPLE_TYPE]
+
+
+def _number(value: str) -> Optional[PRICE_TYPE]:
+    """
+    Parse an int or float field, None for an empty one
+    """
+    if not value:
+        return None
+    return float(value) if '.' in value or 'e' in value else int(value)
+
+
+def parse_events(lines: Iterable[str]) -> List[_EVENT_TYPE]:
+    """
+    Parse lines of an event file without the header
+    The event file is a CSV file with the header: timestamp,symbol,action,id,side,price,volume,
+    fields are not quoted, events go in timestamp order.
+    Price and volume of a change event are empty if they are not changed, side of delete and change
+    events may be empty.
+
+    :param lines: Event file lines
+
+    :return: Events: (timestamp, action, id, side, price, volume)
+    """
+    return [
+        (_number(timestamp), action, int(request_id), side, _number(price), _number(volume))
+        for timestamp, _, action, request_id, side, price, volume in csv.reader(lines)
+    ]
+
+
+def split_lines(path: str) -> Dict[str, List[str]]:
+    """
+    Split lines of an event file by symbol without parsing them
+
+    :param path: Event file path
+
+    :return: dict: {symbol: lines in file order}
+    """
+    lines: Dict[str, List[str]] = defaultdict(list)
+    with open(path) as file:
+        header = tuple(next(file, '').strip().split(','))
+        if header != FIELDS:
+            raise ValueError(f'Wrong event file header: {header}')
+        for line in file:
+            lines[line.split(',', 2)[1]].append(line)
+    return lines
+
+
+def read_events(path: str) -> Dict[str, List[_EVENT_TYPE]]:
+    """
+    Read an event file and split events by symbol, see parse_events
+
+    :param path: Event file path
+
+    :return: dict: {symbol: events in file order}
+    """
+    return {symbol: parse_events(lines) for symbol, lines in split_lines(path).items()}
+
+
+def _top_of_book(order_book: OrderBook) -> Tuple[Optional[PRICE_TYPE], Optional[PRICE_TYPE]]:
+    """
+    Best bid and ask prices of the book, None for an empty side
+    """
+    return order_book.best_bid(), order_book.best_ask()
+
+
+def replay_symbol(symbol: str, events: Iterable[_EVENT_TYPE], sample_every: int = 1000,
+                  matching: bool = False) -> Tuple[str, dict, List[_SAMPLE_TYPE]]:
+    """
+    Replay events of one symbol into a new OrderBook
+
+    :param symbol: Instrument symbol
+    :param events: Events of the symbol in timestamp order
+    :param sample_every: Number of events between top of book samples, the last event is always sampled
+    :param matching: OrderBook matching mode
+
+    :return: Tuple: (symbol, final snapshot, top of book samples)
+    """
+    order_book = OrderBook(matching=matching)
+    samples: List[_SAMPLE_TYPE] = []
+    timestamp = None
+    count = 0
+    for count, (timestamp, action, request_id, side, price, volume) in enumerate(events, 1):
+        if action == ReplayActions.ADD:
+            # Requests of the event file are validated as any new request
+            if side not in REQUEST_CLASSES:
+                raise ValueError(f'Wrong side of the event {count} of {symbol}: {side}')
+            try:
+                request = REQUEST_CLASSES[side](price, volume, request_id=request_id)
+            except RequestError as exception:
+                raise ValueError(f'Wrong request of the event {count} of {symbol}: {exception}') from exception
+            order_book.add_request(request)
+        elif action == ReplayActions.DELETE:
+            order_book.delete_request(request_id)
+        elif action == ReplayActions.CHANGE:
+            order_book.change_request_info(request_id, price=price, volume=volume)
+        else:
+            raise ValueError(f'Unknown replay action: {action}')
+        if not count % sample_every:
+            samples.append((timestamp, symbol, *_top_of_book(order_book)))
+    if count % sample_every:
+        samples.append((timestamp, symbol, *_top_of_book(order_book)))
+    return symbol, order_book.get_snapshot(), samples
+
+
+def _replay_lines(symbol: str, lines: List[str], sample_every: int,
+                  matching: bool) -> Tuple[str, dict, List[_SAMPLE_TYPE]]:
+    """
+    Parse and replay event file lines of one symbol, lines are parsed in the worker process
+    """
+    return replay_symbol(symbol, parse_events(lines), sample_every=sample_every, matching=matching)
+
+
+def replay(path: str, workers: Optional[int] = None, sample_every: int = 1000,
+           matching: bool = False) -> ReplayResult:
+    """
+    Replay an event file, every symbol into its own OrderBook
+    Symbols are replayed in a ProcessPoolExecutor, or in this process if workers is 1
+
+    :param path: Event file path, see parse_events
+    :param workers: Number of worker processes, os.cpu_count() if None
+    :param sample_every: Number of events of a symbol between top of book samples
+    :param matching: OrderBook matching mode
+
+    :return: ReplayResult object
+    """
+    if not isinstance(sample_every, int) or sample_every < 1:
+        raise ValueError(f'sample_every should be an int over than 0: {sample_every}')
+    workers = workers or os.cpu_count() or 1
+    # Only the symbol field is parsed here, workers parse the rest
+    lines = split_lines(path)
+    symbols = list(lines)
+    LOGGER.debug('Replaying %s symbols with %s workers' % (len(symbols), workers))
+
+    arguments = (
+        symbols,
+        [lines[symbol] for symbol in symbols],
+        [sample_every] * len(symbols),
+        [matching] * len(symbols),
+    )
+    if workers == 1:
+        results = list(map(_replay_lines, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Big symbols go first, so the slowest one does not start last
+            order = sorted(range(len(symbols)), key=lambda index: -len(arguments[1][index]))
+            results = list(executor.map(_replay_lines, *([values[i] for i in order] for values in arguments)))
+
+    # Symbols in file order, so samples with equal timestamps go in the same order for any workers
+    by_symbol = {symbol: (snapshot, samples) for symbol, snapshot, samples in results}
+    return ReplayResult(
+        snapshots={symbol: by_symbol[symbol][0] for symbol in symbols},
+        samples=list(heapq.merge(*(by_symbol[symbol][1] for symbol in symbols), key=itemgetter(0))),
+    )
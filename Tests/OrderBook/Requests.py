@@ -1,14 +1,26 @@
 import logging
-from typing import Union
+import threading
+from typing import (
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
 
 from . import (
+    RequestIdError,
     RequestPriceError,
     RequestVolumeError,
 )
 
-__all__ = ['RequestTypes', 'Request', 'AskRequest', 'BidRequest', 'PRICE_TYPE']
+if TYPE_CHECKING:
+    from .PriceLevels import PriceLevel
+
+__all__ = ['RequestTypes', 'IdAllocator', 'Request', 'AskRequest', 'BidRequest', 'REQUEST_CLASSES', 'PRICE_TYPE',
+           'MAX_REQUEST_ID']
 
 PRICE_TYPE = Union[int, float]
+# Ids are stored as int64 by the journal and binary snapshots
+MAX_REQUEST_ID = 2 ** 63 - 1
 LOGGER = logging.getLogger(__name__)
 
 
@@ -20,22 +32,97 @@ class RequestTypes:
     BID = 'Bid'
 
 
+class IdAllocator:
+    """
+    Thread-safe allocator of request ids: start, start + step, start + 2 * step, ...
+
+    Allocators with the same step and different starts (0 <= start < step) never give the same id,
+    so books or shards in different processes get unique ids without a central counter
+    """
+
+    def __init__(self, start: int = 0, step: int = 1):
+        """
+        :param start: The first id
+        :param step: Step between ids
+        """
+        if not isinstance(start, int) or start < 0:
+            raise ValueError(f'start should be a not negative int: {start}')
+        if not isinstance(step, int) or step < 1:
+            raise ValueError(f'step should be an int over than 0: {step}')
+        self.start: int = start
+        self.step: int = step
+        self.__next: int = start
+        self.__lock = threading.Lock()
+
+    def allocate(self) -> int:
+        """
+        Take the next id
+
+        :return: Request id
+        """
+        with self.__lock:
+            request_id = self.__next
+            self.__next += self.step
+        return request_id
+
+    def skip(self, request_id: int) -> None:
+        """
+        Make sure new ids are over than the given one, e.g. after loading requests
+
+        :param request_id: The last used request id
+
+        :return: None
+        """
+        with self.__lock:
+            if request_id >= self.__next:
+                # The first id of the sequence over than request_id
+                self.__next = request_id + 1 + (self.start - request_id - 1) % self.step
+
+    def reset(self) -> None:
+        """
+        Start ids from the first one again
+
+        :return: None
+        """
+        with self.__lock:
+            self.__next = self.start
+
+
 class Request:
     """
     Base request without type
+
+    Requests use __slots__ and keep the type on the class, so a request has no instance __dict__.
+    A resting request is linked to its neighbours in the price level queue and to the level itself
+    (see PriceLevels.PriceLevel), so it may rest in one book only. Level volumes are not updated
+    by the price and volume setters: a resting request must be changed only through its OrderBook.
+    A request gets its id from the given IdAllocator, the process-wide Request.id_allocator by default,
+    or takes an id assigned by the caller (e.g. by an exchange).
     """
-    _curr_id: int = 0
+    __slots__ = ('_price', '_volume', '_id', '_prev', '_next', '_level')
+    id_allocator: IdAllocator = IdAllocator()
+    _type: str = ''
 
-    def __init__(self, price: PRICE_TYPE, volume: int):
+    def __init__(self, price: PRICE_TYPE, volume: int, request_id: Optional[int] = None,
+                 id_allocator: Optional[IdAllocator] = None):
         """
         :param price: Request price
         :param volume: Request volume
+        :param request_id: Request id, a new id is allocated if None
+        :param id_allocator: Allocator of the new id, Request.id_allocator if None
         """
         self._price: PRICE_TYPE = ...
         self._volume: int = ...
-        self._type = ''
-        self._id: int = self._curr_id
-        Request._curr_id += 1
+        self._prev: Optional[Request] = None
+        self._next: Optional[Request] = None
+        # The price level the request rests at
+        self._level: Optional['PriceLevel'] = None
+        if request_id is None:
+            request_id = (id_allocator or Request.id_allocator).allocate()
+        elif not isinstance(request_id, int) or not 0 <= request_id <= MAX_REQUEST_ID:
+            LOGGER.error('The request id is not a not negative int64 (%s)' % request_id)
+            raise RequestIdError(f'The request id should be a not negative int64, got {request_id}.')
+        self._id: int = request_id
         self.price = price
         self.volume = volume
         LOGGER.debug('A new request was created: %s' % str(self))
@@ -59,7 +146,19 @@ class Request:
         :return: None
         """
         LOGGER.debug(f'Trying to set a new price (%s) for the request with id "%s"' % (value, self.id))
+        self._check_price(value)
+        LOGGER.debug('A new price was set successfully')
+        self._price = value
+
+    @staticmethod
+    def _check_price(value: PRICE_TYPE) -> None:
+        """
+        Price validation method
+
+        :param value: Price
 
+        :return: None
+        """
         # The price should be an instance of int or float
         if not isinstance(value, PRICE_TYPE):
             LOGGER.error('The new price is not an int or float instance (%s)' % type(value))
@@ -71,9 +170,6 @@ class Request:
             LOGGER.error('The new price is lower than 0 (%s)' % value)
             raise RequestPriceError('The price should be over than 0.') from ValueError
 
-        LOGGER.debug('A new price was set successfully')
-        self._price = value
-
     @property
     def volume(self) -> int:
         """
@@ -93,7 +189,18 @@ class Request:
         :return: None
         """
         LOGGER.debug(f'Trying to set a new volume (%s) for the request with id "%s"' % (value, self.id))
+        self._check_volume(value)
+        self._volume = value
 
+    @staticmethod
+    def _check_volume(value: int) -> None:
+        """
+        Volume validation method
+
+        :param value: Volume
+
+        :return: None
+        """
         # The Volume should be an instance of int
         if not isinstance(value, int):
             LOGGER.error('The new volume is not an int instance (%s)' % type(value))
@@ -103,7 +210,6 @@ class Request:
         if value < 1:
             LOGGER.error('The new volume is lower than 1 (%s)' % value)
             raise RequestVolumeError('A volume can not be lower than 1.') from ValueError
-        self._volume = value
 
     @property
     def id(self) -> int:
@@ -141,22 +247,50 @@ class Request:
     def __str__(self) -> str:
         return str(self.as_dict)
 
+    @classmethod
+    def _restore(cls, request_id: int, price: PRICE_TYPE, volume: int) -> 'Request':
+        """
+        Create a request from already validated fields
+        Neither validation nor logging is done and no new id is taken
+
+        :param request_id: Request id
+        :param price: Request price
+        :param volume: Request volume
+
+        :return: Request object
+        """
+        request = cls.__new__(cls)
+        request._id = request_id
+        request._price = price
+        request._volume = volume
+        request._prev = request._next = request._level = None
+        return request
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the request without queue links, an unpickled request is not in any queue
+        """
+        return self._restore, (self._id, self._price, self._volume)
+
 
 class AskRequest(Request):
     """
     Request of the type 'Ask'
     """
-
-    def __init__(self, price: PRICE_TYPE, volume: int):
-        super(AskRequest, self).__init__(price=price, volume=volume)
-        self._type = RequestTypes.ASK
+    __slots__ = ()
+    _type = RequestTypes.ASK
 
 
 class BidRequest(Request):
     """
     Request of the type 'Bid'
     """
+    __slots__ = ()
+    _type = RequestTypes.BID
+
 
-    def __init__(self, price: PRICE_TYPE, volume: int):
-        super(BidRequest, self).__init__(price=price, volume=volume)
-        self._type = RequestTypes.BID
+# Request classes by request type
+REQUEST_CLASSES = {
+    RequestTypes.ASK: AskRequest,
+    RequestTypes.BID: BidRequest,
+}
@@ -0,0 +1,143 @@
+import functools
+import time
+from collections import Counter
+from typing import (
+    Callable,
+    Dict,
+    List,
+)
+
+__all__ = ['LatencyHistogram', 'Stats']
+
+# Bucket i counts latencies in [2 ** (i - 1), 2 ** i) nanoseconds, the last one is unbounded
+_BUCKETS_COUNT = 48
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram of one method
+    """
+    __slots__ = ('count', 'total_ns', 'buckets', 'errors')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Reset all counters
+
+        :return: None
+        """
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.buckets: List[int] = [0] * _BUCKETS_COUNT
+        # Exception class name -> count
+        self.errors: Counter = Counter()
+
+    def add(self, elapsed_ns: int) -> None:
+        """
+        Add a latency to the histogram
+
+        :param elapsed_ns: Latency in nanoseconds
+
+        :return: None
+        """
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.buckets[min(elapsed_ns.bit_length(), _BUCKETS_COUNT - 1)] += 1
+
+    def quantile(self, rank: float) -> int:
+        """
+        Upper bound of the bucket holding the quantile
+
+        :param rank: Quantile rank from 0 to 1
+
+        :return: Latency in nanoseconds, 0 for an empty histogram
+        """
+        if not self.count:
+            return 0
+        position = rank * self.count
+        accumulated = 0
+        for index, count in enumerate(self.buckets):
+            accumulated += count
+            if count and accumulated >= position:
+                return 2 ** index
+        return 2 ** (_BUCKETS_COUNT - 1)
+
+    @property
+    def as_dict(self) -> dict:
+        """
+        Histogram as a dict, buckets are keyed by their upper bound in nanoseconds
+
+        :return: dict: {'count': ..., 'total_ns': ..., 'p50_ns': ..., 'p99_ns': ..., 'buckets': {...}, 'errors': {...}}
+        """
+        return {
+            'count': self.count,
+            'total_ns': self.total_ns,
+            'p50_ns': self.quantile(0.5),
+            'p99_ns': self.quantile(0.99),
+            'buckets': {2 ** index: count for index, count in enumerate(self.buckets) if count},
+            'errors': dict(self.errors),
+        }
+
+
+class Stats:
+    """
+    Call counters, latency histograms and exception counters of methods
+    Methods are instrumented by wrapping, so objects without Stats do not pay for them
+    """
+
+    def __init__(self):
+        self.__histograms: Dict[str, LatencyHistogram] = {}
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """
+        Wrap the method to record its calls
+
+        :param name: Method name in stats
+        :param method: Bound method
+
+        :return: Wrapped method
+        """
+        histogram = self.__histograms.setdefault(name, LatencyHistogram())
+        clock = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def instrumented(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            except Exception as exception:
+                histogram.errors[type(exception).__name__] += 1
+                raise
+            finally:
+                histogram.add(clock() - start)
+
+        return instrumented
+
+    def reset(self) -> None:
+        """
+        Reset all histograms
+
+        :return: None
+        """
+        for histogram in self.__histograms.values():
+            histogram.clear()
+
+    @property
+    def histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Histograms getter
+
+        :return: dict: {method name: LatencyHistogram}
+        """
+        return self.__histograms
+
+    @property
+    def as_dict(self) -> Dict[str, dict]:
+        """
+        Stats as a dict
+
+        :return: dict: {method name: LatencyHistogram.as_dict}
+        """
+        return {name: histogram.as_dict for name, histogram in self.__histograms.items()}
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from itertools import count
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from . import SubscriptionDisconnectedError
+from .Requests import PRICE_TYPE
+
+__all__ = ['Subscription', 'SlowConsumerPolicies']
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SlowConsumerPolicies:
+    """
+    What a subscription does with a new update when its queue is full
+    """
+    # Skip the new update
+    DROP = 'drop'
+    # Always replace a queued update of the same level with the new one, so the queue holds one update per level,
+    # skip the new update of another level or an order update if the queue is full
+    CONFLATE = 'conflate'
+    # Close the subscription, the consumer gets SubscriptionDisconnectedError
+    DISCONNECT = 'disconnect'
+
+
+class Subscription:
+    """
+    Bounded queue of OrderBook updates consumed with "async for"
+
+    Level updates: {'type': 'level', 'side': ..., 'price': ..., 'volume': ..., 'version': ...}
+    Order updates: {'type': 'order', 'action': 'add' | 'delete' | 'change' | 'fill', 'request': {...}, 'version': ...}
+    In matching mode a partially filled resting request gets 'change' with its remaining volume,
+    a completely filled request (resting or incoming) gets 'fill' with its volume before the fill.
+    With the "conflate" policy a new level update replaces the queued update of the same level in its place,
+    so the consumer gets only the latest volume of a level and order updates may come after the level update.
+    Updates are published synchronously by the OrderBook, so the book must be changed in the event loop thread.
+    """
+
+    def __init__(self, maxsize: int = 1000, policy: str = SlowConsumerPolicies.CONFLATE, order_events: bool = False):
+        """
+        :param maxsize: Maximum number of queued updates
+        :param policy: SlowConsumerPolicies value
+        :param order_events: Publish order updates in addition to level updates or not
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f'maxsize should be an int over than 0: {maxsize}')
+        if policy not in (SlowConsumerPolicies.DROP, SlowConsumerPolicies.CONFLATE, SlowConsumerPolicies.DISCONNECT):
+            raise ValueError(f'Unknown slow consumer policy: {policy}')
+        self.maxsize: int = maxsize
+        self.policy: str = policy
+        self.order_events: bool = order_events
+        self.dropped: int = 0
+        self.__queue: Dict[int, dict] = OrderedDict()
+        self.__keys = count()
+        # Queue key of the queued update of each level, used to conflate updates
+        self.__level_keys: Dict[Tuple[str, PRICE_TYPE], int] = {}
+        self.__waiter: Optional[asyncio.Future] = None
+        self.__closed: bool = False
+        self.__disconnected: bool = False
+
+    @property
+    def closed(self) -> bool:
+        """
+        Closed subscription getter
+
+        :return: True if the subscription does not get new updates
+        """
+        return self.__closed
+
+    def __len__(self) -> int:
+        return len(self.__queue)
+
+    def _publish_level(self, side: str, price, volume: int, version: int) -> None:
+        """
+        Queue a level update
+
+        :param side: Level side
+        :param price: Level price
+        :param volume: New level volume, 0 if the level was removed
+        :param version: Book version
+
+        :return: None
+        """
+        self.__put({
+            'type': 'level',
+            'side': side,
+            'price': price,
+            'volume': volume,
+            'version': version,
+        }, level=(side, price))
+
+    def _publish_order(self, action: str, request_info: dict, version: int) -> None:
+        """
+        Queue an order update
+
+        :param action: 'add', 'delete', 'change' or 'fill'
+        :param request_info: Request info
+        :param version: Book version
+
+        :return: None
+        """
+        if self.order_events:
+            self.__put({
+                'type': 'order',
+                'action': action,
+                'request': request_info,
+                'version': version,
+            })
+
+    def __put(self, update: dict, level: Optional[Tuple[str, PRICE_TYPE]] = None) -> None:
+        """
+        Queue the update applying the slow consumer policy if the queue is full
+
+        :param update: Update dict
+        :param level: (side, price) of a level update, None for an order update
+
+        :return: None
+        """
+        if self.__closed:
+            return
+        if self.policy == SlowConsumerPolicies.CONFLATE and level in self.__level_keys:
+            self.__queue[self.__level_keys[level]] = update
+        elif len(self.__queue) < self.maxsize:
+            key = next(self.__keys)
+            self.__queue[key] = update
+            if level is not None:
+                self.__level_keys[level] = key
+        elif self.policy == SlowConsumerPolicies.DISCONNECT:
+            LOGGER.warning('The subscription is disconnected because its queue is full')
+            self.__disconnected = True
+            self.close()
+            return
+        else:
+            self.dropped += 1
+            return
+        self.__wake_up()
+
+    def __wake_up(self) -> None:
+        """
+        Wake up the consumer waiting for an update
+
+        :return: None
+        """
+        if self.__waiter is not None and not self.__waiter.done():
+            self.__waiter.set_result(None)
+
+    def close(self) -> None:
+        """
+        Stop getting updates, the consumer gets the queued updates and then the iteration stops
+
+        :return: None
+        """
+        self.__closed = True
+        self.__wake_up()
+
+    def __aiter__(self) -> 'Subscription':
+        return self
+
+    async def __anext__(self) -> dict:
+        while not self.__queue:
+            if self.__disconnected:
+                raise SubscriptionDisconnectedError('The consumer did not keep up with the OrderBook updates.')
+            if self.__closed:
+                raise StopAsyncIteration
+            self.__waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self.__waiter
+            finally:
+                self.__waiter = None
+        key, update = self.__queue.popitem(last=False)
+        if update['type'] == 'level' and self.__level_keys.get((update['side'], update['price'])) == key:
+            del self.__level_keys[update['side'], update['price']]
+        return update
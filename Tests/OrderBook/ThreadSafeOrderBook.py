@@ -0,0 +1,226 @@
+import logging
+import threading
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .OrderBook import OrderBook
+from .Requests import (
+    Request,
+    RequestTypes,
+    PRICE_TYPE,
+)
+
+__all__ = ['ThreadSafeOrderBook', 'LevelsView']
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LevelsView(NamedTuple):
+    """
+    Immutable view of the OrderBook levels at some book version
+    Levels go from the worst price to the best one, as in the snapshot
+    """
+    version: int
+    asks: Tuple[Tuple[PRICE_TYPE, int], ...]
+    bids: Tuple[Tuple[PRICE_TYPE, int], ...]
+
+
+class ThreadSafeOrderBook:
+    """
+    OrderBook which may be shared by one writer thread and many reader threads
+
+    Changes are serialized by a lock. Readers get snapshots from an immutable LevelsView: when the book
+    has changed, a reader takes only the levels changed since its view under the lock
+    (OrderBook.get_snapshot_since) and builds the next view outside of it, so a snapshot never blocks
+    the writer for longer than reading the changed levels.
+    """
+
+    def __init__(self, order_book: Optional[OrderBook] = None):
+        """
+        :param order_book: OrderBook object, a new OrderBook if None
+        """
+        self.__order_book: OrderBook = order_book if order_book is not None else OrderBook()
+        self.__lock = threading.Lock()
+        self.__view_lock = threading.Lock()
+        snapshot = self.__order_book.get_snapshot()
+        self.__view = LevelsView(
+            version=self.__order_book.version,
+            asks=tuple((level['price'], level['volume']) for level in snapshot['Asks']),
+            bids=tuple((level['price'], level['volume']) for level in snapshot['Bids']),
+        )
+
+    @property
+    def version(self) -> int:
+        """
+        Book version getter
+
+        :return: Book version
+        """
+        return self.__order_book.version
+
+    def add_request(self, request: Request) -> List[dict]:
+        """
+        See OrderBook.add_request
+        """
+        with self.__lock:
+            return self.__order_book.add_request(request)
+
+    def add_requests(self, requests: List[Request],
+                     raise_exceptions: bool = True) -> Union[List[Tuple[Request, str]], None]:
+        """
+        See OrderBook.add_requests
+        """
+        with self.__lock:
+            return self.__order_book.add_requests(requests, raise_exceptions=raise_exceptions)
+
+    def add_requests_bulk(self, requests: Iterable[Request]) -> bytearray:
+        """
+        See OrderBook.add_requests_bulk
+        """
+        with self.__lock:
+            return self.__order_book.add_requests_bulk(requests)
+
+    def delete_request(self, request_id: int, request_type: Optional[str] = None) -> None:
+        """
+        See OrderBook.delete_request
+        """
+        with self.__lock:
+            self.__order_book.delete_request(request_id, request_type=request_type)
+
+    def change_request_info(self, request_id: int, price: Optional[PRICE_TYPE] = None,
+                            volume: Optional[int] = None) -> List[dict]:
+        """
+        See OrderBook.change_request_info
+        """
+        with self.__lock:
+            return self.__order_book.change_request_info(request_id, price=price, volume=volume)
+
+    def change_requests(self, changes: Iterable[Tuple[int, Optional[PRICE_TYPE], Optional[int]]],
+                        raise_exceptions: bool = True) -> Tuple[List[dict], List[Tuple[int, str]]]:
+        """
+        See OrderBook.change_requests
+        """
+        with self.__lock:
+            return self.__order_book.change_requests(changes, raise_exceptions=raise_exceptions)
+
+    def get_request_info(self, request_id: int, request_type: Optional[str] = None) -> dict:
+        """
+        See OrderBook.get_request_info
+        """
+        with self.__lock:
+            return self.__order_book.get_request_info(request_id, request_type=request_type)
+
+    def best_bid(self) -> Optional[PRICE_TYPE]:
+        """
+        See OrderBook.best_bid, the price is read without the lock
+        """
+        return self.__order_book.best_bid()
+
+    def best_ask(self) -> Optional[PRICE_TYPE]:
+        """
+        See OrderBook.best_ask, the price is read without the lock
+        """
+        return self.__order_book.best_ask()
+
+    def spread(self) -> Optional[PRICE_TYPE]:
+        """
+        See OrderBook.spread, both prices are read under the lock
+        """
+        with self.__lock:
+            return self.__order_book.spread()
+
+    def mid(self) -> Optional[float]:
+        """
+        See OrderBook.mid, both prices are read under the lock
+        """
+        with self.__lock:
+            return self.__order_book.mid()
+
+    def get_view(self) -> LevelsView:
+        """
+        Method for getting an immutable view of the current levels
+
+        :return: LevelsView object
+        """
+        view = self.__view
+        if view.version == self.__order_book.version:
+            return view
+
+        with self.__lock:
+            changes = self.__order_book.get_snapshot_since(view.version)
+        view = LevelsView(
+            version=changes['version'],
+            asks=self.__apply_changes(view.asks, changes['Asks'], reverse=True),
+            bids=self.__apply_changes(view.bids, changes['Bids'], reverse=False),
+        )
+
+        # Another reader may have published a newer view meanwhile
+        with self.__view_lock:
+            if view.version > self.__view.version:
+                self.__view = view
+            LOGGER.debug('A new levels view was created (version: %s)' % view.version)
+            return self.__view
+
+    @staticmethod
+    def __apply_changes(levels: Tuple[Tuple[PRICE_TYPE, int], ...], changes: List[dict],
+                        reverse: bool) -> Tuple[Tuple[PRICE_TYPE, int], ...]:
+        """
+        Build new levels from the old ones and changed levels
+
+        :param levels: Old levels
+        :param changes: Changed levels, volume 0 for removed ones
+        :param reverse: Sort prices descending or not
+
+        :return: New levels
+        """
+        if not changes:
+            return levels
+        volumes: Dict[PRICE_TYPE, int] = dict(levels)
+        for level in changes:
+            if level['volume']:
+                volumes[level['price']] = level['volume']
+            else:
+                volumes.pop(level['price'], None)
+        return tuple(sorted(volumes.items(), reverse=reverse))
+
+    def get_snapshot(self, depth: Optional[int] = None) -> dict:
+        """
+        See OrderBook.get_snapshot, the snapshot is built from the current LevelsView
+        """
+        # depth should be None or a not negative int, as in OrderBook
+        if depth is not None and (not isinstance(depth, int) or depth < 0):
+            LOGGER.error('depth is not a not negative int (%s)' % depth)
+            raise ValueError(f'depth should be None or a not negative int: {depth}')
+
+        view = self.get_view()
+        result = {}
+        for key, levels in (('Asks', view.asks), ('Bids', view.bids)):
+            if depth is not None:
+                levels = levels[max(0, len(levels) - depth):] if depth else ()
+            result[key] = [{'price': price, 'volume': volume} for price, volume in levels]
+        return result
+
+    def get_snapshot_since(self, version: int) -> dict:
+        """
+        See OrderBook.get_snapshot_since
+        """
+        with self.__lock:
+            return self.__order_book.get_snapshot_since(version)
+
+    def get_side_levels(self, request_type: str) -> Tuple[Tuple[PRICE_TYPE, int], ...]:
+        """
+        Method for getting (price, volume) levels of one side from the current LevelsView
+
+        :param request_type: Request type
+
+        :return: Levels from the worst price to the best one
+        """
+        view = self.get_view()
+        return view.asks if request_type == RequestTypes.ASK else view.bids
@@ -0,0 +1,69 @@
+import logging
+from decimal import Decimal
+
+from . import RequestPriceError
+from .Requests import PRICE_TYPE
+
+__all__ = ['TickSize']
+
+LOGGER = logging.getLogger(__name__)
+# Relative distance to the nearest tick still treated as float rounding noise
+_TOLERANCE = 1e-6
+
+
+class TickSize:
+    """
+    Price grid of a book: prices are whole numbers of ticks
+
+    Prices are converted to integer tick counts for level keys, so 0.1 + 0.2 and 0.3 are the same level,
+    and back to canonical prices: ints for an int tick size, floats rounded to the tick decimals otherwise
+    """
+    __slots__ = ('value', '__decimals')
+
+    def __init__(self, value: PRICE_TYPE):
+        """
+        :param value: Tick size
+        """
+        if not isinstance(value, PRICE_TYPE) or isinstance(value, bool) or value <= 0:
+            raise ValueError(f'tick_size should be an int or float over than 0: {value}')
+        self.value: PRICE_TYPE = value
+        self.__decimals: int = max(0, -Decimal(repr(value)).as_tuple().exponent) if isinstance(value, float) else 0
+
+    def __repr__(self) -> str:
+        return f'TickSize({self.value!r})'
+
+    def to_ticks(self, price: PRICE_TYPE) -> int:
+        """
+        Convert the price to a number of ticks
+
+        :param price: Price
+
+        :return: Number of ticks
+        """
+        ticks = round(price / self.value)
+        if abs(price - ticks * self.value) > self.value * _TOLERANCE:
+            LOGGER.error('The price %s is not a multiple of the tick size %s' % (price, self.value))
+            raise RequestPriceError(f'The price should be a multiple of the tick size {self.value}, got {price}.')
+        return ticks
+
+    def to_price(self, ticks: int) -> PRICE_TYPE:
+        """
+        Convert a number of ticks to the canonical price
+
+        :param ticks: Number of ticks
+
+        :return: Price
+        """
+        if isinstance(self.value, int):
+            return ticks * self.value
+        return round(ticks * self.value, self.__decimals)
+
+    def normalize(self, price: PRICE_TYPE) -> PRICE_TYPE:
+        """
+        Get the canonical price of the tick nearest to the price
+
+        :param price: Price, must be a multiple of the tick size
+
+        :return: Canonical price
+        """
+        return self.to_price(self.to_ticks(price))
@@ -7,6 +7,8 @@ __all__ = [
     'RequestTypeError',
     'RequestWasNotFoundError',
     'RequestAlreadyExistsError',
+    'BinarySnapshotError',
+    'SubscriptionDisconnectedError',
 ]
 
 
@@ -56,3 +58,18 @@ class RequestAlreadyExistsError(RequestError):
     """
     Exception for errors when trying to add already existing Requests.Request object
     """
+    ...
+
+
+class BinarySnapshotError(RequestError):
+    """
+    Exception for errors when loading an OrderBook binary snapshot
+    """
+    ...
+
+
+class SubscriptionDisconnectedError(Exception):
+    """
+    Exception for a subscription to OrderBook updates disconnected because its consumer was too slow
+    """
+    ...
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from allure import (
     step,
@@ -5,7 +7,15 @@ from allure import (
     severity_level,
 )
 
-from Tests.OrderBook.Requests import Request
+from Tests.OrderBook import RequestIdError
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    IdAllocator,
+    Request,
+    RequestTypes,
+)
 from Tests.Source import (
     attach_dict_to_report,
     Defaults,
@@ -32,3 +42,83 @@ def test_id_order():
             attach_dict_to_report(request.as_dict, name=f'Request {i + 1}')
             assert request.id == base_id, f'Request {i + 1} has wrong id {request.id} (should be {base_id})'
             base_id += 1
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_request_id_assigned_by_caller():
+    """
+    Test checks requests with ids assigned by the caller
+
+    Steps:
+        1. Creating request with an id
+            E: Request has the given id, the default allocator is not used
+        2. Creating requests with wrong ids
+            E: RequestIdError is raised
+    """
+    with step('Creating request with an id'):
+        next_id = Request(price=Defaults.price, volume=Defaults.volume).id + 1
+        request = AskRequest(price=Defaults.price, volume=Defaults.volume, request_id=10 ** 12)
+        attach_dict_to_report(request.as_dict, 'Request')
+        assert request.id == 10 ** 12, 'Wrong request id'
+        assert Request(price=Defaults.price, volume=Defaults.volume).id == next_id, 'The default allocator was used'
+    with step('Creating requests with wrong ids'):
+        for request_id in (-1, 1.5, '1'):
+            with pytest.raises(RequestIdError):
+                AskRequest(price=Defaults.price, volume=Defaults.volume, request_id=request_id)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_id_allocator():
+    """
+    Test checks ids of IdAllocator objects
+
+    Steps:
+        1. Allocate ids of two shards
+            E: Shards have disjoint ids
+        2. Skip ids
+            E: New ids are over than the skipped one and stay in the shard sequence
+        3. Allocate ids from many threads
+            E: All ids are unique
+    """
+    with step('Allocate ids of two shards'):
+        shards = [IdAllocator(start=shard, step=2) for shard in range(2)]
+        requests = [BidRequest(price=Defaults.price, volume=Defaults.volume, id_allocator=shards[i % 2])
+                    for i in range(6)]
+        assert [request.id for request in requests] == [0, 1, 2, 3, 4, 5], 'Wrong ids'
+    with step('Skip ids'):
+        shards[1].skip(10)
+        shards[1].skip(3)
+        assert shards[1].allocate() == 11, 'Wrong id after skip'
+        shards[0].skip(10)
+        assert shards[0].allocate() == 12, 'Wrong id after skip'
+    with step('Allocate ids from many threads'):
+        allocator = IdAllocator()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: [allocator.allocate() for _ in range(1000)], range(8)))
+        assert len(set(sum(ids, []))) == 8000, 'Duplicated ids'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_order_book_id_allocator(order_book):
+    """
+    Test checks requests created by a book with its own allocator
+
+    Steps:
+        1. Create requests by two books
+            E: Every book takes ids from its own allocator
+        2. Load a binary snapshot
+            E: New ids of the loaded book are over than the loaded ones
+    """
+    with step('Create requests by two books'):
+        books = [OrderBook(id_allocator=IdAllocator(start=100 * i)) for i in range(2)]
+        for book in books:
+            book.add_request(book.create_request(RequestTypes.ASK, Defaults.price, Defaults.volume))
+            book.add_request(book.create_request(RequestTypes.BID, Defaults.price - 1, Defaults.volume))
+        assert books[0].get_request_info(1)['type'] == RequestTypes.BID, 'Wrong request'
+        assert books[1].get_request_info(101)['type'] == RequestTypes.BID, 'Wrong request'
+    with step('Load a binary snapshot'):
+        loaded = OrderBook.from_bytes(books[1].to_bytes(), id_allocator=IdAllocator())
+        assert loaded.create_request(RequestTypes.ASK, Defaults.price, Defaults.volume).id == 102, 'Wrong id'
@@ -0,0 +1,43 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    Request,
+    RequestTypes,
+)
+from Tests.Source import (
+    attach_dict_to_report,
+    Defaults,
+)
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type, expected_type', [
+    (Request, ''),
+    (AskRequest, RequestTypes.ASK),
+    (BidRequest, RequestTypes.BID),
+])
+def test_request_has_no_dict(request_type, expected_type):
+    """
+    Test checks that a request object is slotted and keeps its type on the class
+
+    Steps:
+        1. Creating request
+            E: Request created successfully
+        2. Check request attributes
+            E: Request has no instance __dict__
+            E: Request has the right type
+    """
+    with step('Creating request'):
+        request = request_type(price=Defaults.price, volume=Defaults.volume)
+        attach_dict_to_report(request.as_dict, 'Request')
+    with step('Check request attributes'):
+        assert not hasattr(request, '__dict__'), 'Request has an instance __dict__'
+        assert request.type == expected_type, 'Wrong request type'
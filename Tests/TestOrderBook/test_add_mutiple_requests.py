@@ -6,9 +6,11 @@ from allure import (
 )
 
 from Tests.OrderBook import RequestAlreadyExistsError
+from Tests.OrderBook.OrderBook import RequestStatuses
 from Tests.OrderBook.Requests import (
     AskRequest,
     BidRequest,
+    Request,
 )
 from Tests.Source import (
     Defaults,
@@ -148,3 +150,50 @@ def test_added_list_not_changed(order_book):
         order_book.add_requests(requests_copy, raise_exceptions=False)
     with step('Check that requests list has not changed'):
         assert requests_copy == requests
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+@pytest.mark.parametrize('order_book_fixture', ['order_book', 'matching_order_book'])
+def test_add_requests_bulk(request, order_book_fixture):
+    """
+    Test checks the statuses returned by adding multiple requests in bulk to the OrderBook
+
+    Steps:
+        1. Generate requests
+            E: Requests generated successfully
+        2. Add request
+            E: Request added successfully
+        3. Add requests in bulk
+            E: A status for each request was received
+            E: Only requests with the status ADDED were added
+    """
+    order_book = request.getfixturevalue(order_book_fixture)
+    with step('Generate requests'):
+        existing_request = AskRequest(price=Defaults.price, volume=Defaults.volume)
+        new_request = BidRequest(price=Defaults.price - 1, volume=Defaults.volume)
+        request_with_the_same_id = AskRequest(price=Defaults.price, volume=Defaults.volume)
+        request_with_the_same_id._id = new_request.id
+        requests = [
+            new_request,
+            existing_request,
+            request_with_the_same_id,
+            new_request.as_dict,
+            Request(price=Defaults.price, volume=Defaults.volume),
+        ]
+    with step('Add request'):
+        order_book.add_request(existing_request)
+    with step('Add requests in bulk'):
+        statuses = order_book.add_requests_bulk(requests)
+        attach_dict_to_report(list(statuses), 'Statuses')
+        assert list(statuses) == [
+            RequestStatuses.ADDED,
+            RequestStatuses.ALREADY_EXISTS,
+            RequestStatuses.ALREADY_EXISTS,
+            RequestStatuses.NOT_A_REQUEST,
+            RequestStatuses.WRONG_TYPE,
+        ], 'Wrong statuses'
+        assert order_book.get_snapshot() == {
+            'Asks': [{'price': Defaults.price, 'volume': Defaults.volume}],
+            'Bids': [{'price': Defaults.price - 1, 'volume': Defaults.volume}],
+        }, 'Wrong snapshot'
@@ -8,10 +8,16 @@ from allure import (
 from Tests.OrderBook import (
     RequestAlreadyExistsError,
     RequestError,
+    RequestIdError,
+)
+from Tests.OrderBook.OrderBook import (
+    OrderBook,
+    RequestStatuses,
 )
 from Tests.OrderBook.Requests import (
     AskRequest,
     BidRequest,
+    MAX_REQUEST_ID,
 )
 from Tests.Source import (
     attach_dict_to_report,
@@ -117,3 +123,51 @@ def test_add_not_a_request(order_book, request_):
     """
     with step('Add not a request'):
         order_book.add_request(request_)
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.parametrize('request_id', [-1, MAX_REQUEST_ID + 1, 2 ** 64])
+@pytest.mark.xfail(raises=RequestIdError, strict=True)
+def test_create_request_wrong_id(request_id):
+    """
+    Test checks that a request id should fit in int64 used by the journal and binary snapshots
+
+    Steps:
+        1. Create a request with a wrong id
+            E: RequestIdError raised
+    """
+    with step('Create a request with a wrong id'):
+        AskRequest(Defaults.price, Defaults.volume, request_id=request_id)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+def test_add_request_resting_in_another_book(order_book):
+    """
+    Test checks that a request resting in one book can not be added to another one
+
+    Steps:
+        1. Add requests to the first book
+            E: Requests added successfully
+        2. Add a resting request to the second book
+            E: RequestAlreadyExistsError raised, the bulk status is ALREADY_EXISTS
+            E: Levels of the first book are not changed
+        3. Delete the request from the first book and add it to the second one
+            E: The request is added
+    """
+    with step('Add requests to the first book'):
+        requests = [AskRequest(Defaults.price, Defaults.volume) for _ in range(3)]
+        order_book.add_requests(requests)
+    with step('Add a resting request to the second book'):
+        other_order_book = OrderBook()
+        with pytest.raises(RequestAlreadyExistsError):
+            other_order_book.add_request(requests[1])
+        assert list(other_order_book.add_requests_bulk([requests[1]])) == [RequestStatuses.ALREADY_EXISTS], \
+            'Wrong status'
+        level = order_book._OrderBook__ladders[requests[1].type].get(Defaults.price)
+        assert [request.id for request in level] == [request.id for request in requests], 'Wrong requests order'
+    with step('Delete the request from the first book and add it to the second one'):
+        order_book.delete_request(requests[1].id)
+        other_order_book.add_request(requests[1])
+        assert other_order_book.get_request_info(requests[1].id)['volume'] == Defaults.volume, 'Wrong request'
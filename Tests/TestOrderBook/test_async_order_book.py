@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import (
+    RequestAlreadyExistsError,
+    RequestWasNotFoundError,
+)
+from Tests.OrderBook.AsyncOrderBook import AsyncOrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+    compare_request_with_request_info,
+)
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+def test_async_order_book_concurrent_commands(order_book):
+    """
+    Test checks that commands from many coroutines are applied by the AsyncOrderBook
+
+    Steps:
+        1. Add requests from many coroutines
+            E: All requests added successfully
+        2. Change and get requests info from many coroutines
+            E: Requests info changed and received successfully
+        3. Get snapshot
+            E: Snapshot is the same as the snapshot of the OrderBook
+    """
+    async def scenario():
+        async with AsyncOrderBook(order_book, max_batch=7) as async_order_book:
+            with step('Add requests from many coroutines'):
+                results = await asyncio.gather(*(async_order_book.add_request(request) for request in requests))
+                assert results == [[]] * len(requests), 'Unexpected fills'
+            with step('Change and get requests info from many coroutines'):
+                await asyncio.gather(*(
+                    async_order_book.change_request_info(request.id, volume=Defaults.volume + 1)
+                    for request in requests
+                ))
+                requests_info = await asyncio.gather(*(
+                    async_order_book.get_request_info(request.id) for request in requests
+                ))
+                for request, request_info in zip(requests, requests_info):
+                    compare_request_with_request_info(request, request_info)
+            with step('Get snapshot'):
+                snapshot = await async_order_book.get_snapshot()
+                attach_dict_to_report(snapshot, 'Snapshot')
+                assert snapshot == order_book.get_snapshot(), 'Wrong snapshot'
+
+    requests = [AskRequest(Defaults.price + i % 5, Defaults.volume) for i in range(50)]
+    requests += [BidRequest(Defaults.price - 1 - i % 5, Defaults.volume) for i in range(50)]
+    asyncio.run(scenario())
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+def test_async_order_book_exceptions(order_book):
+    """
+    Test checks that exceptions of the OrderBook are raised to the coroutine which sent the command
+
+    Steps:
+        1. Send good and bad commands together
+            E: Bad commands raise the OrderBook exceptions
+            E: Good commands are applied
+    """
+    async def scenario():
+        async with AsyncOrderBook(order_book) as async_order_book:
+            return await asyncio.gather(
+                async_order_book.add_request(request),
+                async_order_book.add_request(request),
+                async_order_book.delete_request(request.id + 1),
+                async_order_book.get_request_info(request.id),
+                return_exceptions=True,
+            )
+
+    with step('Send good and bad commands together'):
+        request = AskRequest(Defaults.price, Defaults.volume)
+        results = asyncio.run(scenario())
+        assert results[0] == [], 'The request was not added'
+        assert isinstance(results[1], RequestAlreadyExistsError), 'Wrong exception'
+        assert isinstance(results[2], RequestWasNotFoundError), 'Wrong exception'
+        compare_request_with_request_info(request, results[3])
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=RuntimeError, strict=True)
+def test_async_order_book_not_started(order_book):
+    """
+    Test checks the possibility of sending a command to the not started AsyncOrderBook
+
+    Steps:
+        1. Get snapshot
+            E: RuntimeError raised
+    """
+    with step('Get snapshot'):
+        asyncio.run(AsyncOrderBook(order_book).get_snapshot())
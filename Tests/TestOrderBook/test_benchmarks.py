@@ -0,0 +1,31 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.Benchmarks.operations import run
+from Tests.Source import attach_dict_to_report
+
+
+@severity(severity_level.MINOR)
+@pytest.mark.positive
+def test_operations_benchmark(order_book):
+    """
+    Test checks that the operations benchmark runs and writes every metric
+
+    Steps:
+        1. Run the benchmark on small books
+            E: Results have every operation of every book, levels counts over half of the size are skipped
+            E: Every result has ops/s, latency percentiles and peak memory
+    """
+    with step('Run the benchmark on small books'):
+        result = run(sizes=[100], levels=[1, 10, 100], samples=20)
+        attach_dict_to_report(result, 'Benchmark')
+        assert {(item['size'], item['levels']) for item in result['results']} == {(100, 1), (100, 10)}, \
+            'Wrong benchmark cases'
+        assert len(result['results']) == 16, 'Wrong number of results'
+        for item in result['results']:
+            assert item['ops'] > 0 and 0 < item['p50_ns'] <= item['p99_ns'] and item['peak_memory_bytes'] > 0, \
+                f'Wrong result: {item}'
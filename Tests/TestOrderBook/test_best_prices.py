@@ -0,0 +1,74 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import Defaults
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('dense_window', [None, 16])
+def test_best_prices(dense_window):
+    """
+    Test checks the best bid and ask prices, the spread and the mid price
+
+    Steps:
+        1. Get prices of an empty book
+            E: All prices are None
+        2. Add requests to one side
+            E: The best price of the side is right, the spread and the mid price are None
+        3. Add requests to the other side
+            E: Best prices, the spread and the mid price are right
+        4. Delete and change the best requests
+            E: Best prices follow the changes
+    """
+    order_book = OrderBook(tick_size=1, dense_window=dense_window)
+    with step('Get prices of an empty book'):
+        assert (order_book.best_bid(), order_book.best_ask(), order_book.spread(), order_book.mid()) == \
+               (None, None, None, None), 'Wrong prices of an empty book'
+
+    with step('Add requests to one side'):
+        bids = [BidRequest(Defaults.price - i, Defaults.volume) for i in range(1, 4)]
+        order_book.add_requests(bids)
+        assert order_book.best_bid() == Defaults.price - 1, 'Wrong best bid'
+        assert (order_book.best_ask(), order_book.spread(), order_book.mid()) == (None, None, None), \
+            'Wrong prices of a one-sided book'
+
+    with step('Add requests to the other side'):
+        asks = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(1, 4)]
+        order_book.add_requests(asks)
+        assert order_book.best_ask() == Defaults.price + 1, 'Wrong best ask'
+        assert order_book.spread() == 2, 'Wrong spread'
+        assert order_book.mid() == Defaults.price, 'Wrong mid price'
+
+    with step('Delete and change the best requests'):
+        order_book.delete_request(bids[0].id)
+        order_book.change_request_info(asks[0].id, price=Defaults.price + 10)
+        assert (order_book.best_bid(), order_book.best_ask()) == (Defaults.price - 2, Defaults.price + 2), \
+            'Wrong best prices'
+        assert order_book.spread() == 4, 'Wrong spread'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_spread_tick_size():
+    """
+    Test checks that the spread of a book with a tick size is a canonical price
+
+    Steps:
+        1. Add bid and ask requests with float prices
+            E: The spread is rounded to the tick size, the mid price is between best prices
+    """
+    with step('Add bid and ask requests with float prices'):
+        order_book = OrderBook(tick_size=0.1)
+        order_book.add_requests([BidRequest(0.1, Defaults.volume), AskRequest(0.3, Defaults.volume)])
+        assert order_book.spread() == 0.2, 'Wrong spread'
+        assert order_book.mid() == pytest.approx(0.2), 'Wrong mid price'
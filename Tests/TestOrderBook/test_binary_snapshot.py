@@ -0,0 +1,106 @@
+import mmap
+import struct
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import BinarySnapshotError
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+    compare_request_with_request_info,
+)
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+@pytest.mark.parametrize('buffer_type', [bytes, bytearray, memoryview, mmap.mmap])
+def test_binary_snapshot_round_trip(order_book, buffer_type):
+    """
+    Test checks that an OrderBook loaded from a binary snapshot has the same requests and levels
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Get binary snapshot
+            E: Binary snapshot received successfully
+        3. Load OrderBook from the binary snapshot
+            E: The new OrderBook has the same requests, levels and time priority
+    """
+    with step('Add requests'):
+        requests = [AskRequest(Defaults.price + i % 3, Defaults.volume + i) for i in range(6)]
+        requests += [BidRequest(Defaults.price - 0.5 - i % 2, Defaults.volume) for i in range(4)]
+        order_book.add_requests(requests)
+    with step('Get binary snapshot'):
+        data = order_book.to_bytes()
+        if buffer_type is mmap.mmap:
+            buffer = mmap.mmap(-1, len(data))
+            buffer.write(data)
+        else:
+            buffer = buffer_type(data)
+    with step('Load OrderBook from the binary snapshot'):
+        new_order_book = OrderBook.from_bytes(buffer)
+        attach_dict_to_report(new_order_book.get_snapshot(), 'Snapshot')
+        assert new_order_book.get_snapshot() == order_book.get_snapshot(), 'Wrong snapshot'
+        for request in requests:
+            compare_request_with_request_info(request, new_order_book.get_request_info(request.id))
+        assert new_order_book.to_bytes() == data, 'Wrong requests order'
+        new_request = AskRequest(Defaults.price, Defaults.volume)
+        new_order_book.add_request(new_request)
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_empty_binary_snapshot(order_book):
+    """
+    Test checks the possibility of loading an empty OrderBook from a binary snapshot
+
+    Steps:
+        1. Load OrderBook from the binary snapshot of the empty OrderBook
+            E: The new OrderBook is empty
+    """
+    with step('Load OrderBook from the binary snapshot of the empty OrderBook'):
+        new_order_book = OrderBook.from_bytes(order_book.to_bytes(), matching=True)
+        assert new_order_book.get_snapshot() == {'Asks': [], 'Bids': []}, 'The OrderBook is not empty'
+        assert new_order_book.matching, 'OrderBook arguments were not used'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=BinarySnapshotError, strict=True)
+@pytest.mark.parametrize('corrupt', [
+    lambda data: b'',
+    lambda data: b'XXXX' + data[4:],
+    lambda data: data[:4] + b'\x02' + data[5:],
+    lambda data: data[:-1],
+    lambda data: data + data[-16:],
+    # Level table: side at 24, volume at 40, requests count at 48
+    lambda data: data[:24] + b'\x02' + data[25:],
+    lambda data: data[:48] + struct.pack('<q', 0) + data[56:],
+    lambda data: data[:48] + struct.pack('<q', -1) + data[56:],
+    lambda data: data[:40] + struct.pack('<q', 1) + data[48:],
+    lambda data: data[:40] + struct.pack('<qq', Defaults.volume, 1) + data[56:],
+])
+def test_load_wrong_binary_snapshot(order_book, corrupt):
+    """
+    Test checks the possibility of loading an OrderBook from a wrong binary snapshot
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Load OrderBook from the corrupted binary snapshot
+            E: BinarySnapshotError raised
+    """
+    with step('Add requests'):
+        order_book.add_requests([AskRequest(Defaults.price, Defaults.volume) for _ in range(2)])
+    with step('Load OrderBook from the corrupted binary snapshot'):
+        OrderBook.from_bytes(corrupt(order_book.to_bytes()))
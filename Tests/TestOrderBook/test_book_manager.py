@@ -0,0 +1,173 @@
+import pickle
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import RequestWasNotFoundError
+from Tests.OrderBook.BookManager import (
+    BookManager,
+    shard_index,
+)
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+    compare_request_with_request_info,
+)
+
+
+@pytest.fixture(scope='module')
+def book_manager():
+    with BookManager(workers=3) as book_manager:
+        yield book_manager
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_shard_index():
+    """
+    Test checks that shards of symbols are stable and cover all workers
+
+    Steps:
+        1. Get shards of many symbols
+            E: Every shard is in the range and used, the same symbol has the same shard
+    """
+    with step('Get shards of many symbols'):
+        shards = [shard_index(f'SYM{i}', 4) for i in range(100)]
+        assert set(shards) == {0, 1, 2, 3}, 'Not all shards are used'
+        assert shards == [shard_index(f'SYM{i}', 4) for i in range(100)], 'Shards are not stable'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_book_manager_commands(book_manager, order_book):
+    """
+    Test checks add, change, get info, snapshot and delete commands of the BookManager
+
+    Steps:
+        1. Add requests to many symbols
+            E: Requests added successfully
+        2. Change and get request info
+            E: Request info changed successfully
+        3. Get snapshot
+            E: Snapshot has the requests of the symbol only
+        4. Delete request
+            E: Request deleted successfully, the next get info raises RequestWasNotFoundError
+    """
+    symbols = [f'SYM{i}' for i in range(10)]
+    requests = {symbol: AskRequest(Defaults.price + i, Defaults.volume) for i, symbol in enumerate(symbols)}
+
+    with step('Add requests to many symbols'):
+        for symbol, request in requests.items():
+            assert book_manager.add_request(symbol, request) == [], 'Unexpected fills'
+
+    with step('Change and get request info'):
+        request = requests['SYM3']
+        book_manager.change_request_info('SYM3', request.id, volume=Defaults.volume + 1)
+        request.volume = Defaults.volume + 1
+        compare_request_with_request_info(request, book_manager.get_request_info('SYM3', request.id))
+
+    with step('Get snapshot'):
+        snapshot = book_manager.get_snapshot('SYM3')
+        attach_dict_to_report(snapshot, 'Snapshot')
+        assert snapshot == {'Asks': [{'price': request.price, 'volume': request.volume}], 'Bids': []}, \
+            'Wrong snapshot'
+
+    with step('Delete request'):
+        book_manager.delete_request('SYM3', request.id)
+        with pytest.raises(RequestWasNotFoundError):
+            book_manager.get_request_info('SYM3', request.id)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_book_manager_bbo(book_manager, order_book):
+    """
+    Test checks best prices of many symbols from one call
+
+    Steps:
+        1. Add requests to many symbols in one batch
+            E: Requests added successfully
+        2. Get best prices of the symbols and an unknown symbol
+            E: Best prices are the prices of the best requests, None for empty sides
+    """
+    symbols = [f'BBO{i}' for i in range(50)]
+
+    with step('Add requests to many symbols in one batch'):
+        commands = []
+        for i, symbol in enumerate(symbols):
+            commands.append(('add_request', symbol, (AskRequest(Defaults.price + i + 1, Defaults.volume),), {}))
+            commands.append(('add_request', symbol, (AskRequest(Defaults.price + i, Defaults.volume),), {}))
+            if i % 2:
+                commands.append(('add_request', symbol, (BidRequest(Defaults.price - 1, Defaults.volume),), {}))
+        book_manager.execute(commands)
+
+    with step('Get best prices of the symbols and an unknown symbol'):
+        bbo = book_manager.get_bbo(symbols + ['UNKNOWN'])
+        for i, symbol in enumerate(symbols):
+            expected = {'bid': Defaults.price - 1 if i % 2 else None, 'ask': Defaults.price + i}
+            assert bbo[symbol] == expected, f'Wrong best prices of {symbol}'
+        assert bbo['UNKNOWN'] == {'bid': None, 'ask': None}, 'Wrong best prices of an unknown symbol'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+def test_book_manager_exceptions(book_manager, order_book):
+    """
+    Test checks exceptions of batched commands
+
+    Steps:
+        1. Execute a batch with a bad command without raising exceptions
+            E: The exception is returned in place of the result, other commands are applied
+        2. Execute an unknown command
+            E: ValueError is raised
+    """
+    with step('Execute a batch with a bad command without raising exceptions'):
+        request = BidRequest(Defaults.price, Defaults.volume)
+        results = book_manager.execute([
+            ('delete_request', 'ERR', (request.id,), {}),
+            ('add_request', 'ERR', (request,), {}),
+        ], raise_exceptions=False)
+        assert isinstance(results[0], RequestWasNotFoundError), 'Wrong exception'
+        assert results[1] == [], 'The good command was not applied'
+
+    with step('Execute an unknown command'):
+        with pytest.raises(ValueError):
+            book_manager.execute([('_get_request', 'ERR', (request.id,), {})])
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+def test_book_manager_not_pickled_batch(book_manager, order_book):
+    """
+    Test checks that a batch which can not be sent does not break next calls
+
+    Steps:
+        1. Execute a batch with a command for one worker and a not picklable command for another one
+            E: The pickling error is raised
+        2. Get best prices
+            E: Best prices are returned, not a reply of the failed batch
+    """
+    symbols = ['PA', 'PB', 'PC', 'PD', 'PE', 'PF']
+    good_symbol = symbols[0]
+    bad_symbol = next(symbol for symbol in symbols if shard_index(symbol, 3) != shard_index(good_symbol, 3))
+
+    with step('Execute a batch with a command for one worker and a not picklable command for another one'):
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            book_manager.execute([
+                ('get_snapshot', good_symbol, (), {}),
+                ('add_request', bad_symbol, (lambda: None,), {}),
+            ])
+
+    with step('Get best prices'):
+        book_manager.add_request(good_symbol, AskRequest(Defaults.price, Defaults.volume))
+        bbo = book_manager.get_bbo([good_symbol])
+        attach_dict_to_report(bbo, 'BBO')
+        assert bbo == {good_symbol: {'bid': None, 'ask': Defaults.price}}, 'Wrong best prices'
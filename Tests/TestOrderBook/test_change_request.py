@@ -241,3 +241,43 @@ def test_change_nothing(order_book):
         order_book.add_request(request)
     with step('Change request'):
         order_book.change_request_info(request.id)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_change_requests(order_book):
+    """
+    Test checks changing multiple requests in one call
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Change requests without raising exceptions
+            E: Good changes are applied, bad changes are returned with exception names
+        3. Change requests raising exceptions
+            E: Changes before the bad one are applied, the exception is raised
+    """
+    with step('Add requests'):
+        requests = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(3)]
+        order_book.add_requests(requests)
+    with step('Change requests without raising exceptions'):
+        fills, errors = order_book.change_requests([
+            (requests[0].id, Defaults.price + 10, None),
+            (requests[1].id + 100, Defaults.price, None),
+            (requests[1].id, None, 0),
+            (requests[2].id, Defaults.price + 10, Defaults.volume - 1),
+        ], raise_exceptions=False)
+        attach_dict_to_report(errors, 'Errors')
+        assert fills == [], 'Fills without matching'
+        assert errors == [
+            (requests[1].id + 100, 'RequestWasNotFoundError'),
+            (requests[1].id, 'RequestVolumeError'),
+        ], 'Wrong errors'
+        assert order_book.get_snapshot()['Asks'] == [
+            {'price': Defaults.price + 10, 'volume': Defaults.volume * 2 - 1},
+            {'price': Defaults.price + 1, 'volume': Defaults.volume},
+        ], 'Wrong levels'
+    with step('Change requests raising exceptions'):
+        with pytest.raises(RequestPriceError):
+            order_book.change_requests([(requests[1].id, Defaults.price, None), (requests[0].id, -1, None)])
+        assert order_book.get_request_info(requests[1].id)['price'] == Defaults.price, 'The change was not applied'
@@ -0,0 +1,145 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import (
+    RequestAlreadyExistsError,
+    RequestIdError,
+    RequestPriceError,
+    RequestTypeError,
+    RequestVolumeError,
+)
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    RequestTypes,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+    compare_request_with_request_info,
+)
+
+numpy = pytest.importorskip('numpy')
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+def test_add_columns(order_book):
+    """
+    Test checks the possibility of adding requests as columns to the OrderBook
+
+    Steps:
+        1. Generate columns
+            E: Columns generated successfully
+        2. Add columns
+            E: Requests added successfully
+        3. Check requests info
+            E: Requests info is the same as in the columns
+    """
+    with step('Generate columns'):
+        ids = numpy.arange(10, dtype=numpy.int64)
+        sides = numpy.array([RequestTypes.ASK, RequestTypes.BID] * 5)
+        prices = numpy.full(10, Defaults.price, dtype=numpy.int64) + ids
+        volumes = numpy.full(10, Defaults.volume, dtype=numpy.int32)
+    with step('Add columns'):
+        order_book.add_columns(ids, sides, prices, volumes)
+    with step('Check requests info'):
+        for request_id, side, price, volume in zip(ids.tolist(), sides.tolist(), prices.tolist(), volumes.tolist()):
+            request_info = order_book.get_request_info(request_id)
+            assert request_info == {'id': request_id, 'price': price, 'volume': volume, 'type': side}, \
+                'Wrong request info'
+            assert type(request_info['price']) is int, 'The price is not a Python int'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_columns_round_trip(order_book):
+    """
+    Test checks that requests exported as columns can be added to another OrderBook
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Get columns
+            E: Columns received successfully
+        3. Add columns to a new OrderBook
+            E: The new OrderBook has the same requests and snapshot
+    """
+    with step('Add requests'):
+        requests = [AskRequest(Defaults.price + i % 3, Defaults.volume + i) for i in range(6)]
+        requests += [BidRequest(Defaults.price - 0.5, Defaults.volume) for _ in range(3)]
+        order_book.add_requests(requests)
+    with step('Get columns'):
+        columns = order_book.get_columns()
+        attach_dict_to_report({key: value.tolist() for key, value in columns.items()}, 'Columns')
+    with step('Add columns to a new OrderBook'):
+        new_order_book = OrderBook()
+        new_order_book.add_columns(**columns)
+        assert new_order_book.get_snapshot() == order_book.get_snapshot(), 'Wrong snapshot'
+        for request in requests:
+            compare_request_with_request_info(request, new_order_book.get_request_info(request.id))
+        assert numpy.array_equal(new_order_book.get_columns()['ids'], columns['ids']), 'Wrong requests order'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+@pytest.mark.parametrize('column, value, error', [
+    ('ids', [-1, 1], RequestIdError),
+    ('ids', [2 ** 63, 2 ** 63 + 1], RequestIdError),
+    ('ids', [1.0, 2.0], RequestIdError),
+    ('ids', [1, 1], RequestAlreadyExistsError),
+    ('sides', [RequestTypes.ASK, 'Wrong'], RequestTypeError),
+    ('prices', [0, Defaults.price], RequestPriceError),
+    ('prices', [str(Defaults.price)] * 2, RequestPriceError),
+    ('volumes', [0, Defaults.volume], RequestVolumeError),
+    ('volumes', [float(Defaults.volume)] * 2, RequestVolumeError),
+])
+def test_add_wrong_columns(order_book, column, value, error):
+    """
+    Test checks that wrong columns are rejected as a whole
+
+    Steps:
+        1. Generate columns with a wrong value
+            E: Columns generated successfully
+        2. Add columns
+            E: The expected RequestError raised
+            E: No requests were added
+    """
+    with step('Generate columns with a wrong value'):
+        columns = {
+            'ids': [1, 2],
+            'sides': [RequestTypes.ASK, RequestTypes.BID],
+            'prices': [Defaults.price, Defaults.price],
+            'volumes': [Defaults.volume, Defaults.volume],
+            column: value,
+        }
+        attach_dict_to_report(columns, 'Columns')
+    with step('Add columns'):
+        with pytest.raises(error):
+            order_book.add_columns(**{key: numpy.array(value) for key, value in columns.items()})
+        assert order_book.get_snapshot() == {'Asks': [], 'Bids': []}, 'Requests were added'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=RequestAlreadyExistsError, strict=True)
+def test_add_columns_with_existing_id(order_book):
+    """
+    Test checks the possibility of adding columns with an id of an existing request
+
+    Steps:
+        1. Add request
+            E: Request added successfully
+        2. Add columns with the same id
+            E: RequestAlreadyExistsError raised
+    """
+    with step('Add request'):
+        request = AskRequest(Defaults.price, Defaults.volume)
+        order_book.add_request(request)
+    with step('Add columns with the same id'):
+        order_book.add_columns([request.id], [RequestTypes.BID], [Defaults.price], [Defaults.volume])
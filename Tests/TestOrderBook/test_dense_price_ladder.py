@@ -0,0 +1,142 @@
+import random
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.PriceLevels import (
+    DensePriceLadder,
+    PriceLadder,
+)
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    RequestTypes,
+)
+from Tests.OrderBook.Ticks import TickSize
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type', [RequestTypes.ASK, RequestTypes.BID])
+def test_dense_ladder_as_sorted_ladder(request_type):
+    """
+    Test checks that the dense ladder keeps the same levels in the same order as the sorted ladder
+
+    Steps:
+        1. Create and remove random levels in both ladders, prices leave the window
+            E: Levels, their order and the best level are the same after every change
+    """
+    tick_size = TickSize(0.5)
+    sorted_ladder = PriceLadder(request_type, tick_size)
+    dense_ladder = DensePriceLadder(request_type, tick_size, window=8)
+    generator = random.Random(request_type)
+
+    with step('Create and remove random levels in both ladders, prices leave the window'):
+        for _ in range(500):
+            price = generator.randint(1, 80) * 0.5
+            if price in sorted_ladder:
+                sorted_ladder.remove(price)
+                dense_ladder.remove(price)
+            else:
+                sorted_ladder.get_or_create(price)
+                dense_ladder.get_or_create(price)
+            prices = [level.price for level in dense_ladder]
+            assert prices == [level.price for level in sorted_ladder], 'Wrong levels'
+            assert [level.price for level in reversed(dense_ladder)] == prices[::-1], 'Wrong reversed levels'
+            assert len(dense_ladder) == len(sorted_ladder), 'Wrong levels count'
+            assert dense_ladder.best_price() == sorted_ladder.best_price(), 'Wrong best price'
+        attach_dict_to_report(prices, 'Prices')
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_dense_order_book(order_book):
+    """
+    Test checks that a book with dense ladders works as a book with sorted ladders
+
+    Steps:
+        1. Apply the same random adds, matches, changes and deletes to both books
+            E: Fills and snapshots are the same
+        2. Create a dense book without the tick size
+            E: ValueError is raised
+    """
+    books = [OrderBook(matching=True, tick_size=1), OrderBook(matching=True, tick_size=1, dense_window=16)]
+    generator = random.Random(0)
+
+    with step('Apply the same random adds, matches, changes and deletes to both books'):
+        for i in range(1000):
+            action = generator.random()
+            request_id = generator.randrange(i + 1)
+            resting = [book._get_request(request_id, raise_if_not_found=False) for book in books]
+            if action < 0.15 and resting[0] is not None:
+                for book in books:
+                    book.delete_request(request_id)
+            elif action < 0.3 and resting[0] is not None:
+                price = generator.randint(1, 200)
+                for book in books:
+                    book.change_request_info(request_id, price=price)
+            else:
+                request_class = generator.choice((AskRequest, BidRequest))
+                price, volume = Defaults.price + generator.randint(-60, 60), generator.randint(1, 10)
+                fills = [book.add_request(request_class(price, volume, request_id=i)) for book in books]
+                assert fills[0] == fills[1], 'Wrong fills'
+            assert books[0].get_snapshot() == books[1].get_snapshot(), 'Wrong snapshot'
+        attach_dict_to_report(books[1].get_snapshot(), 'Snapshot')
+
+    with step('Create a dense book without the tick size'):
+        with pytest.raises(ValueError):
+            OrderBook(dense_window=16)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type', [AskRequest, BidRequest])
+def test_dense_order_book_far_price(request_type):
+    """
+    Test checks that a far-away price does not grow the dense ladder list over its maximum size
+
+    Steps:
+        1. Add requests with near prices and a far-away price
+            E: The list size is not over the maximum, levels are in the right order
+        2. Delete requests with near prices
+            E: The far-away level is the best one
+        3. Add requests with prices near the far-away one
+            E: Levels are in the right order
+    """
+    dense_window = 1024
+    order_book = OrderBook(tick_size=0.01, dense_window=dense_window)
+    ladder = order_book._OrderBook__ladders[request_type(1, 1).type]
+
+    with step('Add requests with near prices and a far-away price'):
+        near = [request_type(100 + i / 100, Defaults.volume) for i in range(10)]
+        far = request_type(100000.0, Defaults.volume)
+        order_book.add_requests(near + [far])
+        assert len(ladder._DensePriceLadder__levels) <= dense_window * DensePriceLadder.MAX_GROWTH, \
+            'The list is over the maximum size'
+        prices = [level.price for level in ladder]
+        assert prices == sorted(prices, reverse=request_type is AskRequest), 'Wrong levels order'
+        assert [level.price for level in reversed(ladder)] == prices[::-1], 'Wrong reversed levels order'
+        best = max(prices) if request_type is BidRequest else min(prices)
+        assert next(order_book.iter_snapshot(near[0].type, 1))['price'] == best, 'Wrong best level'
+
+    with step('Delete requests with near prices'):
+        for request in near:
+            order_book.delete_request(request.id)
+        assert ladder.best().price == far.price, 'Wrong best level'
+        assert len(ladder) == 1, 'Wrong levels count'
+
+    with step('Add requests with prices near the far-away one'):
+        order_book.add_requests([request_type(100000.0 + i / 100, Defaults.volume) for i in range(-5, 6)])
+        prices = [level.price for level in ladder]
+        attach_dict_to_report(prices, 'Prices')
+        assert len(prices) == 11, 'Wrong levels count'
+        assert prices == sorted(prices, reverse=request_type is AskRequest), 'Wrong levels order'
@@ -125,3 +125,31 @@ def test_get_request_info_wrong_request_type(order_book):
         order_book.add_request(request)
     with step('Get request info'):
         order_book.get_request_info(request.id, request_type='SomeWrongType')
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=RequestWasNotFoundError, strict=True)
+def test_get_deleted_request_info(order_book):
+    """
+    Test checks the possibility of getting a deleted request info from the OrderBook
+
+    Steps:
+        1. Generate request
+            E: Request generated successfully
+        2. Add request
+            E: Request added successfully
+        3. Delete request
+            E: Request deleted successfully
+        4. Get request info
+            E: RequestWasNotFoundError raised
+    """
+    with step('Generate request'):
+        request = AskRequest(price=Defaults.price, volume=Defaults.volume)
+        attach_dict_to_report(request.as_dict, 'Request')
+    with step('Add request'):
+        order_book.add_request(request)
+    with step('Delete request'):
+        order_book.delete_request(request.id)
+    with step('Get request info'):
+        order_book.get_request_info(request.id)
@@ -8,6 +8,7 @@ from allure import (
 from Tests.OrderBook.Requests import (
     AskRequest,
     BidRequest,
+    RequestTypes,
 )
 from Tests.Source import (
     Defaults,
@@ -250,3 +251,126 @@ def test_change_snapshot(order_book):
         attach_dict_to_report(new_snapshot, 'New snapshot')
     with step('Check snapshot not changed'):
         assert new_snapshot != changed_snapshot, 'Snapshot has changed'
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type, request_type_snapshot', [
+    (AskRequest, 'Asks'),
+    (BidRequest, 'Bids'),
+])
+def test_snapshot_volume_after_changes(order_book, request_type, request_type_snapshot):
+    """
+    Test checks that snapshot volumes follow deleting and changing requests in the OrderBook
+
+    Steps:
+        1. Generate requests
+            E: Requests generated successfully
+        2. Add requests
+            E: Requests added successfully
+        3. Delete the first request, change volume of the second one and price of the third one
+            E: Requests changed successfully
+        4. Get snapshot
+            E: Snapshot received successfully
+        5. Check volumes
+            E: Volumes are correct
+    """
+    with step('Generate requests'):
+        requests = [request_type(Defaults.price, Defaults.volume) for _ in range(4)]
+        attach_dict_to_report([request.as_dict for request in requests], 'Requests')
+    with step('Add requests'):
+        order_book.add_requests(requests)
+    with step('Delete the first request, change volume of the second one and price of the third one'):
+        order_book.delete_request(requests[0].id)
+        order_book.change_request_info(requests[1].id, volume=Defaults.volume + 1)
+        order_book.change_request_info(requests[2].id, price=Defaults.price + 1)
+    with step('Get snapshot'):
+        snapshot = order_book.get_snapshot()
+        attach_dict_to_report(snapshot, 'Snapshot')
+    with step('Check volumes'):
+        volumes = {price_info['price']: price_info['volume'] for price_info in snapshot[request_type_snapshot]}
+        assert volumes == {
+            Defaults.price: Defaults.volume * 2 + 1,
+            Defaults.price + 1: Defaults.volume,
+        }, 'Wrong volumes'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('depth', [0, 1, 5, 20])
+def test_snapshot_depth(order_book, depth):
+    """
+    Test checks the possibility of getting a depth limited snapshot from the OrderBook
+
+    Steps:
+        1. Generate requests
+            E: Requests generated successfully
+        2. Add requests
+            E: Requests added successfully
+        3. Get snapshot
+            E: Snapshot received successfully
+        4. Check levels
+            E: Only the best levels are in the snapshot
+    """
+    with step('Generate requests'):
+        levels_count = 10
+        requests = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(levels_count)]
+        requests += [BidRequest(Defaults.price - i - 1, Defaults.volume) for i in range(levels_count)]
+    with step('Add requests'):
+        order_book.add_requests(requests)
+    with step('Get snapshot'):
+        snapshot = order_book.get_snapshot(depth=depth)
+        attach_dict_to_report(snapshot, 'Snapshot')
+    with step('Check levels'):
+        full_snapshot = order_book.get_snapshot()
+        expected_count = min(depth, levels_count)
+        for request_type_snapshot in ('Asks', 'Bids'):
+            expected_levels = full_snapshot[request_type_snapshot][levels_count - expected_count:]
+            assert snapshot[request_type_snapshot] == expected_levels, f'Wrong {request_type_snapshot} levels'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type, request_type_snapshot', [
+    (RequestTypes.ASK, 'Asks'),
+    (RequestTypes.BID, 'Bids'),
+])
+def test_iter_snapshot(order_book, request_type, request_type_snapshot):
+    """
+    Test checks the possibility of lazy iterating over snapshot levels from the best price to the worst one
+
+    Steps:
+        1. Generate requests
+            E: Requests generated successfully
+        2. Add requests
+            E: Requests added successfully
+        3. Iterate over snapshot
+            E: Levels are received from the best price to the worst one
+    """
+    with step('Generate requests'):
+        requests = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(10)]
+        requests += [BidRequest(Defaults.price - i - 1, Defaults.volume) for i in range(10)]
+    with step('Add requests'):
+        order_book.add_requests(requests)
+    with step('Iterate over snapshot'):
+        levels = order_book.iter_snapshot(request_type)
+        assert next(levels) == order_book.get_snapshot()[request_type_snapshot][-1], 'Wrong best level'
+        real_levels = [next(levels)] + list(levels)
+        attach_dict_to_report(real_levels, 'Levels')
+        assert real_levels == order_book.get_snapshot()[request_type_snapshot][-2::-1], 'Wrong levels order'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=ValueError, strict=True)
+@pytest.mark.parametrize('depth', [-1, 1.5, '1'])
+def test_snapshot_wrong_depth(order_book, depth):
+    """
+    Test checks the possibility of getting a snapshot with a wrong depth from the OrderBook
+
+    Steps:
+        1. Get snapshot
+            E: ValueError raised
+    """
+    with step('Get snapshot'):
+        order_book.get_snapshot(depth=depth)
@@ -0,0 +1,118 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+def test_get_snapshot_since(order_book):
+    """
+    Test checks that only levels changed after the given version are returned
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Change the OrderBook
+            E: The book version increased
+        3. Get changes since the version before the changes
+            E: Changed levels have new volumes
+            E: Removed levels have volume 0
+            E: Not changed levels are not returned
+        4. Get changes since the current version
+            E: No levels are returned
+    """
+    with step('Add requests'):
+        ask = AskRequest(Defaults.price + 1, Defaults.volume)
+        removed_ask = AskRequest(Defaults.price + 2, Defaults.volume)
+        bid = BidRequest(Defaults.price - 1, Defaults.volume)
+        not_changed_bid = BidRequest(Defaults.price - 2, Defaults.volume)
+        order_book.add_requests([ask, removed_ask, bid, not_changed_bid])
+        version = order_book.version
+    with step('Change the OrderBook'):
+        order_book.delete_request(removed_ask.id)
+        order_book.change_request_info(ask.id, volume=Defaults.volume + 1)
+        order_book.change_request_info(bid.id, price=Defaults.price - 0.5)
+        assert order_book.version > version, 'The book version did not increase'
+    with step('Get changes since the version before the changes'):
+        changes = order_book.get_snapshot_since(version)
+        attach_dict_to_report(changes, 'Changes')
+        assert changes == {
+            'version': order_book.version,
+            'Asks': [
+                {'price': Defaults.price + 2, 'volume': 0},
+                {'price': Defaults.price + 1, 'volume': Defaults.volume + 1},
+            ],
+            'Bids': [
+                {'price': Defaults.price - 1, 'volume': 0},
+                {'price': Defaults.price - 0.5, 'volume': Defaults.volume},
+            ],
+        }, 'Wrong changes'
+    with step('Get changes since the current version'):
+        changes = order_book.get_snapshot_since(changes['version'])
+        assert changes == {'version': order_book.version, 'Asks': [], 'Bids': []}, 'Unexpected changes'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_apply_snapshot_changes(matching_order_book):
+    """
+    Test checks that applying changes to a snapshot gives the current snapshot
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Get snapshot
+            E: Snapshot received successfully
+        3. Change the OrderBook with matching requests
+            E: Requests matched successfully
+        4. Apply changes to the snapshot
+            E: The result is the same as the current snapshot
+    """
+    with step('Add requests'):
+        matching_order_book.add_requests([AskRequest(Defaults.price + i, Defaults.volume) for i in range(5)])
+        matching_order_book.add_requests([BidRequest(Defaults.price - i - 1, Defaults.volume) for i in range(5)])
+    with step('Get snapshot'):
+        version = matching_order_book.version
+        snapshot = matching_order_book.get_snapshot()
+    with step('Change the OrderBook with matching requests'):
+        matching_order_book.add_request(BidRequest(Defaults.price + 2, Defaults.volume * 2 + 1))
+        matching_order_book.add_request(AskRequest(Defaults.price - 1, Defaults.volume))
+    with step('Apply changes to the snapshot'):
+        changes = matching_order_book.get_snapshot_since(version)
+        attach_dict_to_report(changes, 'Changes')
+        for key in ('Asks', 'Bids'):
+            levels = {price_info['price']: price_info['volume'] for price_info in snapshot[key]}
+            levels.update((price_info['price'], price_info['volume']) for price_info in changes[key])
+            expected_levels = [
+                {'price': price, 'volume': volume}
+                for price, volume in sorted(levels.items(), reverse=key == 'Asks') if volume
+            ]
+            assert expected_levels == matching_order_book.get_snapshot()[key], f'Wrong {key} levels'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=ValueError, strict=True)
+@pytest.mark.parametrize('version', [-1, 1.5, None])
+def test_get_snapshot_since_wrong_version(order_book, version):
+    """
+    Test checks the possibility of getting changes since a wrong version
+
+    Steps:
+        1. Get changes
+            E: ValueError raised
+    """
+    with step('Get changes'):
+        order_book.get_snapshot_since(version)
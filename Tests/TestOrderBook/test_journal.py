@@ -0,0 +1,148 @@
+import os
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.Journal import Journal
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    Request,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+    compare_request_with_request_info,
+)
+
+
+@pytest.fixture(scope='function')
+def journal_path(tmp_path):
+    yield str(tmp_path / 'order_book.journal')
+    Request.id_allocator.reset()  # Reset start request id
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+@pytest.mark.parametrize('matching', [False, True])
+@pytest.mark.parametrize('sync_every', [1, 1000])
+def test_journal_replay(journal_path, matching, sync_every):
+    """
+    Test checks that replaying the journal restores the OrderBook
+
+    Steps:
+        1. Change the OrderBook with a journal
+            E: All changes are done successfully
+        2. Replay the journal to a new OrderBook
+            E: All records are applied
+            E: The new OrderBook has the same requests and snapshot
+    """
+    with step('Change the OrderBook with a journal'):
+        with Journal(journal_path, sync_every=sync_every) as journal:
+            order_book = OrderBook(matching=matching, journal=journal)
+            requests = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(5)]
+            requests += [BidRequest(Defaults.price - 0.5, Defaults.volume + i) for i in range(5)]
+            order_book.add_requests(requests)
+            order_book.add_requests_bulk([AskRequest(Defaults.price + 0.25, Defaults.volume)])
+            order_book.delete_request(requests[0].id)
+            order_book.change_request_info(requests[1].id, price=Defaults.price + 10)
+            order_book.change_request_info(requests[6].id, volume=Defaults.volume * 2)
+            order_book.add_request(BidRequest(Defaults.price + 2, Defaults.volume * 2))
+            snapshot = order_book.get_snapshot()
+            attach_dict_to_report(snapshot, 'Snapshot')
+    with step('Replay the journal to a new OrderBook'):
+        with Journal(journal_path) as journal:
+            new_order_book = OrderBook(matching=matching, journal=journal)
+            assert journal.replay(new_order_book) == 10 + 1 + 1 + 2 + 1, 'Wrong number of records'
+        assert new_order_book.get_snapshot() == snapshot, 'Wrong snapshot'
+        for request in requests[1:]:
+            if order_book._get_request(request.id, raise_if_not_found=False) is not None:
+                compare_request_with_request_info(request, new_order_book.get_request_info(request.id))
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_journal_partial_record(journal_path):
+    """
+    Test checks that a partially written last record is dropped and records written after it are replayed
+
+    Steps:
+        1. Add requests with a journal
+            E: Requests added successfully
+        2. Write a part of a record to the journal
+            E: The journal is changed
+        3. Open the journal and add a request
+            E: The partial record is dropped, the new record is written at a record boundary
+        4. Replay the journal
+            E: Only whole records are applied, including the one written after the crash
+            E: New requests get ids not used by the replayed ones
+    """
+    with step('Add requests with a journal'):
+        with Journal(journal_path) as journal:
+            OrderBook(journal=journal).add_requests([AskRequest(Defaults.price, Defaults.volume) for _ in range(3)])
+    with step('Write a part of a record to the journal'):
+        with open(journal_path, 'ab') as file:
+            file.write(b'\x01' * (Journal.RECORD_SIZE // 2))
+    with step('Open the journal and add a request'):
+        with Journal(journal_path) as journal:
+            assert os.path.getsize(journal_path) == Journal.RECORD_SIZE * 3, 'The partial record was not dropped'
+            OrderBook(journal=journal).add_request(AskRequest(Defaults.price + 1, Defaults.volume + 1))
+    with step('Replay the journal'):
+        Request.id_allocator.reset()
+        order_book = OrderBook()
+        with Journal(journal_path) as journal:
+            assert journal.replay(order_book) == 4, 'Wrong number of records'
+        assert order_book.get_snapshot()['Asks'] == [
+            {'price': Defaults.price + 1, 'volume': Defaults.volume + 1},
+            {'price': Defaults.price, 'volume': Defaults.volume * 3},
+        ], 'Wrong levels'
+        order_book.add_request(AskRequest(Defaults.price, Defaults.volume))
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+@pytest.mark.parametrize('method', ['add_requests_bulk', 'add_columns'])
+def test_journal_failed_write(journal_path, method):
+    """
+    Test checks that a request is not added if it was not written to the journal
+
+    Steps:
+        1. Close the journal of the OrderBook
+            E: The journal is closed
+        2. Add a request
+            E: The write error is raised, the request is not added
+    """
+    with step('Close the journal of the OrderBook'):
+        journal = Journal(journal_path)
+        order_book = OrderBook(journal=journal)
+        journal.close()
+    with step('Add a request'):
+        request = AskRequest(Defaults.price, Defaults.volume)
+        with pytest.raises(ValueError):
+            if method == 'add_requests_bulk':
+                order_book.add_requests_bulk([request])
+            else:
+                order_book.add_columns([request.id], [request.type], [request.price], [request.volume])
+        assert order_book.get_snapshot() == {'Asks': [], 'Bids': []}, 'The request was added'
+        assert order_book._get_request(request.id, raise_if_not_found=False) is None, 'The request was indexed'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=ValueError, strict=True)
+@pytest.mark.parametrize('sync_every', [0, 1.5])
+def test_journal_wrong_sync_every(journal_path, sync_every):
+    """
+    Test checks the possibility of creating a journal with a wrong sync_every
+
+    Steps:
+        1. Create journal
+            E: ValueError raised
+    """
+    with step('Create journal'):
+        Journal(journal_path, sync_every=sync_every)
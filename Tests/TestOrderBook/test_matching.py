@@ -0,0 +1,235 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import (
+    RequestVolumeError,
+    RequestWasNotFoundError,
+)
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+@pytest.mark.parametrize('maker_type, taker_type', [
+    (AskRequest, BidRequest),
+    (BidRequest, AskRequest),
+])
+def test_full_match(matching_order_book, maker_type, taker_type):
+    """
+    Test checks that a request crossing the opposite side is filled and not added to the OrderBook
+
+    Steps:
+        1. Add maker request
+            E: Request added successfully
+        2. Add taker request with the same price and volume
+            E: One fill received
+            E: Both requests are not in the OrderBook
+    """
+    with step('Add maker request'):
+        maker = maker_type(Defaults.price, Defaults.volume)
+        assert matching_order_book.add_request(maker) == [], 'Unexpected fills'
+    with step('Add taker request with the same price and volume'):
+        taker = taker_type(Defaults.price, Defaults.volume)
+        fills = matching_order_book.add_request(taker)
+        attach_dict_to_report(fills, 'Fills')
+        assert fills == [{
+            'taker_id': taker.id,
+            'maker_id': maker.id,
+            'price': Defaults.price,
+            'volume': Defaults.volume,
+        }], 'Wrong fills'
+        assert matching_order_book.get_snapshot() == {'Asks': [], 'Bids': []}, 'The OrderBook is not empty'
+        for request in (maker, taker):
+            with pytest.raises(RequestWasNotFoundError):
+                matching_order_book.get_request_info(request.id)
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+def test_price_time_priority(matching_order_book):
+    """
+    Test checks that requests are matched from the best price and in the order they were added
+
+    Steps:
+        1. Add ask requests
+            E: Requests added successfully
+        2. Add bid request crossing several levels
+            E: Fills received in price-time priority
+            E: The remainder of the bid request is added to the OrderBook
+    """
+    with step('Add ask requests'):
+        worse_ask = AskRequest(Defaults.price + 1, Defaults.volume)
+        first_ask = AskRequest(Defaults.price, Defaults.volume)
+        second_ask = AskRequest(Defaults.price, Defaults.volume)
+        not_crossed_ask = AskRequest(Defaults.price + 10, Defaults.volume)
+        matching_order_book.add_requests([worse_ask, first_ask, second_ask, not_crossed_ask])
+    with step('Add bid request crossing several levels'):
+        bid = BidRequest(Defaults.price + 1, Defaults.volume * 3 + 1)
+        fills = matching_order_book.add_request(bid)
+        attach_dict_to_report(fills, 'Fills')
+        assert [(fill['maker_id'], fill['price']) for fill in fills] == [
+            (first_ask.id, Defaults.price),
+            (second_ask.id, Defaults.price),
+            (worse_ask.id, Defaults.price + 1),
+        ], 'Wrong fills order'
+        assert matching_order_book.get_request_info(bid.id)['volume'] == 1, 'Wrong remainder volume'
+        assert matching_order_book.get_snapshot() == {
+            'Asks': [{'price': Defaults.price + 10, 'volume': Defaults.volume}],
+            'Bids': [{'price': Defaults.price + 1, 'volume': 1}],
+        }, 'Wrong snapshot'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_partial_maker_fill(matching_order_book):
+    """
+    Test checks that a partially filled maker request keeps its place and its volume is decreased
+
+    Steps:
+        1. Add ask requests
+            E: Requests added successfully
+        2. Add smaller bid request
+            E: The first ask request is partially filled
+    """
+    with step('Add ask requests'):
+        first_ask = AskRequest(Defaults.price, Defaults.volume)
+        second_ask = AskRequest(Defaults.price, Defaults.volume)
+        matching_order_book.add_requests([first_ask, second_ask])
+    with step('Add smaller bid request'):
+        fills = matching_order_book.add_request(BidRequest(Defaults.price, Defaults.volume - 1))
+        attach_dict_to_report(fills, 'Fills')
+        assert [fill['maker_id'] for fill in fills] == [first_ask.id], 'Wrong maker'
+        assert matching_order_book.get_request_info(first_ask.id)['volume'] == 1, 'Wrong maker volume'
+        assert matching_order_book.get_snapshot(depth=1)['Asks'] == [
+            {'price': Defaults.price, 'volume': Defaults.volume + 1},
+        ], 'Wrong level volume'
+        fills = matching_order_book.add_request(BidRequest(Defaults.price, 1))
+        assert [fill['maker_id'] for fill in fills] == [first_ask.id], 'The maker lost its priority'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_crossing_change(matching_order_book):
+    """
+    Test checks that a request moved through the best opposite price is matched
+
+    Steps:
+        1. Add ask and bid requests
+            E: Requests added without fills
+        2. Change the bid price through the best ask price
+            E: The bid is partially filled, its remainder rests at the new price, the book is not crossed
+        3. Change the ask price through the best bid price
+            E: The ask is filled completely and deleted
+    """
+    with step('Add ask and bid requests'):
+        ask = AskRequest(Defaults.price, Defaults.volume)
+        bid = BidRequest(Defaults.price - 1, Defaults.volume + 2)
+        matching_order_book.add_requests([ask, bid])
+    with step('Change the bid price through the best ask price'):
+        fills = matching_order_book.change_request_info(bid.id, price=Defaults.price + 1)
+        attach_dict_to_report(fills, 'Fills')
+        assert fills == [
+            {'taker_id': bid.id, 'maker_id': ask.id, 'price': Defaults.price, 'volume': Defaults.volume},
+        ], 'Wrong fills'
+        assert matching_order_book.get_request_info(bid.id)['volume'] == 2, 'Wrong remainder volume'
+        assert matching_order_book.get_snapshot() == {
+            'Asks': [], 'Bids': [{'price': Defaults.price + 1, 'volume': 2}],
+        }, 'Wrong levels'
+    with step('Change the ask price through the best bid price'):
+        second_ask = AskRequest(Defaults.price + 5, 1)
+        matching_order_book.add_request(second_ask)
+        fills = matching_order_book.change_request_info(second_ask.id, price=Defaults.price)
+        assert [(fill['maker_id'], fill['price'], fill['volume']) for fill in fills] == [
+            (bid.id, Defaults.price + 1, 1),
+        ], 'Wrong fills'
+        with pytest.raises(RequestWasNotFoundError):
+            matching_order_book.get_request_info(second_ask.id)
+        assert matching_order_book.get_snapshot() == {
+            'Asks': [], 'Bids': [{'price': Defaults.price + 1, 'volume': 1}],
+        }, 'Wrong levels'
+        assert matching_order_book.change_request_info(bid.id, price=Defaults.price) == [], 'Unexpected fills'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_crossing_changes(matching_order_book):
+    """
+    Test checks that fills of multiple crossing changes are returned
+
+    Steps:
+        1. Add ask and bid requests
+            E: Requests added without fills
+        2. Change both bids through the best ask prices with a bad change between them
+            E: Fills of both changes are returned in the order of changes, the bad change is returned as an error
+    """
+    with step('Add ask and bid requests'):
+        asks = [AskRequest(Defaults.price + i, 1) for i in range(2)]
+        bids = [BidRequest(Defaults.price - 1, 1) for _ in range(2)]
+        matching_order_book.add_requests(asks + bids)
+    with step('Change both bids through the best ask prices with a bad change between them'):
+        fills, errors = matching_order_book.change_requests([
+            (bids[0].id, Defaults.price + 1, None),
+            (bids[1].id + 100, Defaults.price + 1, None),
+            (bids[1].id, Defaults.price + 1, None),
+        ], raise_exceptions=False)
+        attach_dict_to_report(fills, 'Fills')
+        assert fills == [
+            {'taker_id': bids[0].id, 'maker_id': asks[0].id, 'price': Defaults.price, 'volume': 1},
+            {'taker_id': bids[1].id, 'maker_id': asks[1].id, 'price': Defaults.price + 1, 'volume': 1},
+        ], 'Wrong fills'
+        assert errors == [(bids[1].id + 100, 'RequestWasNotFoundError')], 'Wrong errors'
+        assert matching_order_book.get_snapshot() == {'Asks': [], 'Bids': []}, 'Wrong levels'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+def test_crossing_change_wrong_volume(matching_order_book):
+    """
+    Test checks that a crossing change with a wrong volume changes nothing and does not match
+
+    Steps:
+        1. Add ask and bid requests
+            E: Requests added without fills
+        2. Change the bid price through the best ask price with a wrong volume
+            E: RequestVolumeError raised, both requests and levels are not changed
+    """
+    with step('Add ask and bid requests'):
+        ask = AskRequest(Defaults.price, Defaults.volume)
+        bid = BidRequest(Defaults.price - 1, Defaults.volume)
+        matching_order_book.add_requests([ask, bid])
+        snapshot = matching_order_book.get_snapshot()
+        version = matching_order_book.version
+    with step('Change the bid price through the best ask price with a wrong volume'):
+        with pytest.raises(RequestVolumeError):
+            matching_order_book.change_request_info(bid.id, price=Defaults.price, volume=0)
+        assert matching_order_book.get_request_info(bid.id)['price'] == Defaults.price - 1, 'The price was changed'
+        assert matching_order_book.get_snapshot() == snapshot, 'Levels were changed'
+        assert matching_order_book.version == version, 'The book version was changed'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_crossed_book_without_matching(order_book):
+    """
+    Test checks that the OrderBook without matching keeps crossing requests
+
+    Steps:
+        1. Add crossing requests
+            E: Requests added without fills
+    """
+    with step('Add crossing requests'):
+        assert order_book.add_request(AskRequest(Defaults.price, Defaults.volume)) == [], 'Unexpected fills'
+        assert order_book.add_request(BidRequest(Defaults.price + 1, Defaults.volume)) == [], 'Unexpected fills'
+        snapshot = order_book.get_snapshot()
+        assert snapshot['Asks'] and snapshot['Bids'], 'Requests were matched'
@@ -0,0 +1,110 @@
+import urllib.error
+import urllib.request
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import RequestAlreadyExistsError
+from Tests.OrderBook.Metrics import (
+    MetricsFileWriter,
+    MetricsHTTPServer,
+    render_metrics,
+)
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.Source import Defaults
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_get_metrics(matching_order_book):
+    """
+    Test checks counters of the book load
+
+    Steps:
+        1. Add, match, change and delete requests
+            E: Requests and levels are counted by side, best prices are right
+    """
+    with step('Add, match, change and delete requests'):
+        asks = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(3)]
+        bid = BidRequest(Defaults.price - 1, Defaults.volume)
+        matching_order_book.add_requests(asks + [bid])
+        matching_order_book.add_request(BidRequest(Defaults.price, Defaults.volume))
+        matching_order_book.change_request_info(asks[2].id, price=Defaults.price + 1)
+        matching_order_book.delete_request(bid.id)
+        metrics = matching_order_book.get_metrics()
+        assert metrics['requests'] == {'Ask': 2, 'Bid': 0}, 'Wrong requests count'
+        assert metrics['levels'] == {'Ask': 1, 'Bid': 0}, 'Wrong levels count'
+        assert metrics['best_prices'] == {'Ask': Defaults.price + 1, 'Bid': None}, 'Wrong best prices'
+        assert metrics['version'] == matching_order_book.version, 'Wrong version'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_render_metrics(order_book):
+    """
+    Test checks the Prometheus text of book metrics
+
+    Steps:
+        1. Render metrics of a book without stats
+            E: Book metrics are rendered with labels, method metrics are not rendered
+        2. Render metrics of a book with stats
+            E: Calls, errors and latencies of methods are rendered
+    """
+    with step('Render metrics of a book without stats'):
+        order_book.add_request(AskRequest(Defaults.price, Defaults.volume))
+        text = render_metrics(order_book, labels={'symbol': 'AAPL'})
+        assert '# TYPE order_book_requests gauge' in text, 'No requests metric type'
+        assert 'order_book_requests{symbol="AAPL",side="Ask"} 1\n' in text, 'Wrong requests metric'
+        assert f'order_book_best_price{{symbol="AAPL",side="Ask"}} {Defaults.price}\n' in text, 'Wrong best price'
+        assert 'side="Bid"} ' not in text.split('order_book_best_price')[-1], 'Best price of an empty side'
+        assert 'calls_total' not in text, 'Method metrics without stats'
+
+    with step('Render metrics of a book with stats'):
+        stats_order_book = OrderBook(stats=True)
+        request = BidRequest(Defaults.price, Defaults.volume)
+        stats_order_book.add_request(request)
+        with pytest.raises(RequestAlreadyExistsError):
+            stats_order_book.add_request(request)
+        text = render_metrics(stats_order_book)
+        assert 'order_book_calls_total{method="add_request"} 2\n' in text, 'Wrong calls metric'
+        assert 'order_book_errors_total{method="add_request",error="RequestAlreadyExistsError"} 1\n' in text, \
+            'Wrong errors metric'
+        assert 'order_book_latency_seconds{method="add_request",quantile="0.99"} ' in text, 'No latency quantile'
+        assert 'order_book_latency_seconds_count{method="add_request"} 2\n' in text, 'Wrong latency count'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_metrics_exporters(order_book, tmp_path):
+    """
+    Test checks the metrics file writer and the metrics HTTP server
+
+    Steps:
+        1. Start and stop the file writer
+            E: The metrics file is written
+        2. Get metrics from the HTTP server
+            E: Metrics are returned on /metrics, other paths are not found
+    """
+    order_book.add_request(BidRequest(Defaults.price, Defaults.volume))
+    expected = render_metrics(order_book)
+
+    with step('Start and stop the file writer'):
+        path = tmp_path / 'order_book.prom'
+        with MetricsFileWriter(order_book, str(path), interval=0.01):
+            pass
+        assert path.read_text() == expected, 'Wrong metrics file'
+
+    with step('Get metrics from the HTTP server'):
+        with MetricsHTTPServer(order_book) as server:
+            with urllib.request.urlopen(f'http://127.0.0.1:{server.port}/metrics', timeout=5) as response:
+                assert response.read().decode() == expected, 'Wrong metrics response'
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f'http://127.0.0.1:{server.port}/', timeout=5)
@@ -0,0 +1,186 @@
+import random
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.PriceLevels import (
+    PriceLadder,
+    PriceLevel,
+)
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    RequestTypes,
+)
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type, best_price', [
+    (RequestTypes.ASK, Defaults.price),
+    (RequestTypes.BID, Defaults.price + 20),
+])
+def test_ladder_best_level(request_type, best_price):
+    """
+    Test checks that the ladder keeps levels sorted from the worst price to the best one
+
+    Steps:
+        1. Create levels
+            E: Levels created successfully
+        2. Check levels order
+            E: Levels are sorted from the worst price to the best one
+        3. Remove the best level
+            E: The next level became the best one
+    """
+    with step('Create levels'):
+        ladder = PriceLadder(request_type)
+        for price in (Defaults.price + 10, Defaults.price, Defaults.price + 20):
+            ladder.get_or_create(price)
+    with step('Check levels order'):
+        prices = [level.price for level in ladder]
+        attach_dict_to_report(prices, 'Prices')
+        assert prices[-1] == best_price, 'Wrong best price'
+        assert ladder.best().price == best_price, 'Wrong best level'
+        assert [level.price for level in reversed(ladder)] == prices[::-1], 'Wrong reversed order'
+    with step('Remove the best level'):
+        ladder.remove(best_price)
+        assert ladder.best().price == Defaults.price + 10, 'Wrong best level after removal'
+        assert len(ladder) == 2, 'Wrong levels count'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type', [AskRequest, BidRequest])
+def test_level_time_priority(order_book, request_type):
+    """
+    Test checks that requests with the same price are queued in the order they were added
+
+    Steps:
+        1. Generate requests
+            E: Requests generated successfully
+        2. Add requests
+            E: Requests added successfully
+        3. Change price of the first request there and back
+            E: The first request moved to the end of the queue
+    """
+    with step('Generate requests'):
+        requests = [request_type(Defaults.price, Defaults.volume) for _ in range(3)]
+        attach_dict_to_report([request.as_dict for request in requests], 'Requests')
+    with step('Add requests'):
+        order_book.add_requests(requests)
+    with step('Change price of the first request there and back'):
+        order_book.change_request_info(requests[0].id, price=Defaults.price + 1)
+        order_book.change_request_info(requests[0].id, price=Defaults.price)
+        ladder = order_book._OrderBook__ladders[requests[0].type]
+        queue = [request.id for request in ladder.get(Defaults.price)]
+        assert queue == [requests[1].id, requests[2].id, requests[0].id], 'Wrong requests order'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('removed', [[0], [2], [4], [1, 3], [0, 1, 2, 3, 4]])
+def test_level_unlink(removed):
+    """
+    Test checks removing requests from any place of the level queue
+
+    Steps:
+        1. Add requests to the level
+            E: Requests are queued in time priority
+        2. Remove requests
+            E: Other requests keep their order, the level volume and count are right
+        3. Append a request
+            E: The request is queued last
+    """
+    with step('Add requests to the level'):
+        level = PriceLevel(Defaults.price)
+        requests = [AskRequest(Defaults.price, Defaults.volume + i) for i in range(5)]
+        level.extend(requests[:2], requests[0].volume + requests[1].volume)
+        for request in requests[2:]:
+            level.append(request)
+        assert list(level) == requests, 'Wrong requests order'
+    with step('Remove requests'):
+        for index in removed:
+            level.remove(requests[index])
+        left = [request for index, request in enumerate(requests) if index not in removed]
+        attach_dict_to_report([request.as_dict for request in left], 'Requests')
+        assert list(level) == left, 'Wrong requests order'
+        assert (level.count, level.volume) == (len(left), sum(request.volume for request in left)), \
+            'Wrong level count or volume'
+    with step('Append a request'):
+        request = AskRequest(Defaults.price, Defaults.volume)
+        level.append(request)
+        assert list(level) == left + [request], 'Wrong requests order'
+        assert level.head is (left + [request])[0] and level.tail is request, 'Wrong queue ends'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type', [AskRequest, BidRequest])
+def test_level_amend_priority(order_book, request_type):
+    """
+    Test checks that a volume decrease keeps the place in the queue and a volume increase loses it
+
+    Steps:
+        1. Add requests
+            E: Requests added successfully
+        2. Decrease volume of the first request
+            E: The first request keeps its place, the level volume is decreased
+        3. Increase volume of the first request
+            E: The first request moved to the end of the queue, the level volume is increased
+    """
+    with step('Add requests'):
+        requests = [request_type(Defaults.price, Defaults.volume) for _ in range(3)]
+        order_book.add_requests(requests)
+        ladder = order_book._OrderBook__ladders[requests[0].type]
+    with step('Decrease volume of the first request'):
+        order_book.change_request_info(requests[0].id, volume=Defaults.volume - 1)
+        level = ladder.get(Defaults.price)
+        assert [request.id for request in level] == [request.id for request in requests], 'Wrong requests order'
+        assert level.volume == Defaults.volume * 3 - 1, 'Wrong level volume'
+    with step('Increase volume of the first request'):
+        order_book.change_request_info(requests[0].id, price=Defaults.price, volume=Defaults.volume + 1)
+        level = ladder.get(Defaults.price)
+        assert [request.id for request in level] == [requests[1].id, requests[2].id, requests[0].id], \
+            'Wrong requests order'
+        assert level.volume == Defaults.volume * 3 + 1, 'Wrong level volume'
+        assert len(level) == 3, 'Wrong level count'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('request_type', [RequestTypes.ASK, RequestTypes.BID])
+def test_ladder_chunks(monkeypatch, request_type):
+    """
+    Test checks that levels stay sorted while sort keys are split into chunks and merged back
+
+    Steps:
+        1. Create and remove random levels with small chunks
+            E: Levels are sorted from the worst price to the best one after every change
+    """
+    monkeypatch.setattr(PriceLadder, 'CHUNK_SIZE', 4)
+    ladder = PriceLadder(request_type)
+    prices = set()
+    generator = random.Random(request_type)
+
+    with step('Create and remove random levels with small chunks'):
+        for _ in range(2000):
+            price = generator.randint(1, 100)
+            if price in prices:
+                ladder.remove(price)
+                prices.remove(price)
+            else:
+                ladder.get_or_create(price)
+                prices.add(price)
+            expected = sorted(prices, reverse=request_type == RequestTypes.ASK)
+            assert [level.price for level in ladder] == expected, 'Wrong levels order'
+            assert [level.price for level in reversed(ladder)] == expected[::-1], 'Wrong reversed levels order'
+            assert ladder.best_price() == (expected[-1] if expected else None), 'Wrong best price'
+        attach_dict_to_report(sorted(prices), 'Prices')
@@ -0,0 +1,110 @@
+import csv
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.Replay import (
+    FIELDS,
+    ReplayActions,
+    read_events,
+    replay,
+)
+from Tests.OrderBook.Requests import RequestTypes
+from Tests.Source import attach_dict_to_report
+
+
+@pytest.fixture(scope='function')
+def events_path(tmp_path):
+    path = tmp_path / 'events.csv'
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+        writer.writerows([
+            (1, 'AAA', ReplayActions.ADD, 0, RequestTypes.ASK, 10, 5),
+            (2, 'BBB', ReplayActions.ADD, 0, RequestTypes.BID, 1.5, 3),
+            (3, 'AAA', ReplayActions.ADD, 1, RequestTypes.BID, 9, 5),
+            (4, 'AAA', ReplayActions.ADD, 2, RequestTypes.ASK, 11, 1),
+            (5, 'CCC', ReplayActions.ADD, 7, RequestTypes.ASK, 20, 2),
+            (6, 'AAA', ReplayActions.CHANGE, 2, '', 8.5, ''),
+            (7, 'BBB', ReplayActions.CHANGE, 0, '', '', 4),
+            (8, 'AAA', ReplayActions.DELETE, 0, '', '', ''),
+            (9, 'CCC', ReplayActions.DELETE, 7, '', '', ''),
+        ])
+    return str(path)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_replay(events_path, order_book):
+    """
+    Test checks replay of an event file by symbols
+
+    Steps:
+        1. Read events
+            E: Events are split by symbol, numbers are parsed
+        2. Replay events in this process
+            E: Final snapshots of every symbol are right
+            E: Top of book samples go in timestamp order
+        3. Replay events in worker processes
+            E: The result is the same as the result of the replay in this process
+    """
+    with step('Read events'):
+        events = read_events(events_path)
+        assert list(events) == ['AAA', 'BBB', 'CCC'], 'Wrong symbols'
+        assert events['AAA'][3] == (6, ReplayActions.CHANGE, 2, '', 8.5, None), 'Wrong event'
+
+    with step('Replay events in this process'):
+        result = replay(events_path, workers=1, sample_every=2)
+        attach_dict_to_report(result.snapshots, 'Snapshots')
+        assert result.snapshots == {
+            'AAA': {'Asks': [{'price': 8.5, 'volume': 1}], 'Bids': [{'price': 9, 'volume': 5}]},
+            'BBB': {'Asks': [], 'Bids': [{'price': 1.5, 'volume': 4}]},
+            'CCC': {'Asks': [], 'Bids': []},
+        }, 'Wrong snapshots'
+        assert result.samples == [
+            (3, 'AAA', 9, 10),
+            (6, 'AAA', 9, 8.5),
+            (7, 'BBB', 1.5, None),
+            (8, 'AAA', 9, 8.5),
+            (9, 'CCC', None, None),
+        ], 'Wrong samples'
+
+    with step('Replay events in worker processes'):
+        assert replay(events_path, workers=2, sample_every=2) == result, 'Results are not the same'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+def test_replay_wrong_file(tmp_path, order_book):
+    """
+    Test checks that a file with a wrong header, action or request is not replayed
+
+    Steps:
+        1. Replay a file with a wrong header
+            E: ValueError is raised
+        2. Replay a file with a wrong action
+            E: ValueError is raised
+        3. Replay files with a wrong price, volume or side of an added request
+            E: ValueError with the number of the event is raised
+    """
+    path = tmp_path / 'events.csv'
+    with step('Replay a file with a wrong header'):
+        path.write_text('time,symbol,action\n1,AAA,add\n')
+        with pytest.raises(ValueError):
+            replay(str(path), workers=1)
+
+    with step('Replay a file with a wrong action'):
+        path.write_text(','.join(FIELDS) + '\n1,AAA,move,0,Ask,1,1\n')
+        with pytest.raises(ValueError):
+            replay(str(path), workers=1)
+
+    with step('Replay files with a wrong price, volume or side of an added request'):
+        for row in ('-5,1,Ask', '1,0,Ask', ',1,Ask', '1,1,Buy'):
+            price, volume, side = row.split(',')
+            path.write_text(','.join(FIELDS) + f'\n1,AAA,add,0,Ask,1,1\n2,AAA,add,1,{side},{price},{volume}\n')
+            with pytest.raises(ValueError, match='event 2 of AAA'):
+                replay(str(path), workers=1)
@@ -0,0 +1,104 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import (
+    RequestAlreadyExistsError,
+    RequestWasNotFoundError,
+)
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.OrderBook.Stats import LatencyHistogram
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_stats(order_book):
+    """
+    Test checks calls, exceptions and latencies recorded by OrderBook stats
+
+    Steps:
+        1. Call methods of an OrderBook with stats
+            E: Methods work as without stats
+        2. Get stats
+            E: Calls and exceptions are counted for every method
+            E: Latency buckets hold all calls
+        3. Reset stats
+            E: All counters are 0
+    """
+    stats_order_book = OrderBook(stats=True)
+    request = AskRequest(Defaults.price, Defaults.volume)
+
+    with step('Call methods of an OrderBook with stats'):
+        stats_order_book.add_request(request)
+        with pytest.raises(RequestAlreadyExistsError):
+            stats_order_book.add_request(request)
+        stats_order_book.add_requests([BidRequest(Defaults.price - 1, Defaults.volume) for _ in range(3)])
+        stats_order_book.change_request_info(request.id, volume=Defaults.volume + 1)
+        stats_order_book.get_snapshot()
+        stats_order_book.delete_request(request.id)
+        with pytest.raises(RequestWasNotFoundError):
+            stats_order_book.get_request_info(request.id)
+
+    with step('Get stats'):
+        stats = stats_order_book.get_stats()
+        attach_dict_to_report(stats, 'Stats')
+        # add_requests adds every request with add_request
+        assert stats['add_request']['count'] == 5, 'Wrong add_request count'
+        assert stats['add_request']['errors'] == {'RequestAlreadyExistsError': 1}, 'Wrong add_request errors'
+        assert stats['add_requests']['count'] == 1, 'Wrong add_requests count'
+        assert stats['get_request_info']['errors'] == {'RequestWasNotFoundError': 1}, 'Wrong get_request_info errors'
+        assert stats['get_columns']['count'] == 0, 'Wrong get_columns count'
+        for name, method_stats in stats.items():
+            assert sum(method_stats['buckets'].values()) == method_stats['count'], f'Wrong {name} buckets'
+            assert method_stats['p50_ns'] <= method_stats['p99_ns'], f'Wrong {name} quantiles'
+
+    with step('Reset stats'):
+        stats_order_book.reset_stats()
+        assert all(not method_stats['count'] for method_stats in stats_order_book.get_stats().values()), \
+            'Stats were not reset'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.positive
+def test_stats_disabled(order_book):
+    """
+    Test checks that stats are disabled by default and methods are not wrapped
+
+    Steps:
+        1. Get stats of an OrderBook without stats
+            E: Stats are empty, methods are the class methods
+    """
+    with step('Get stats of an OrderBook without stats'):
+        assert order_book.get_stats() == {}, 'Stats are not empty'
+        assert 'add_request' not in vars(order_book), 'add_request is wrapped'
+
+
+@severity(severity_level.MINOR)
+@pytest.mark.positive
+def test_latency_histogram():
+    """
+    Test checks log buckets and quantiles of LatencyHistogram
+
+    Steps:
+        1. Add latencies
+            E: Latencies are counted by power of two buckets, quantiles are bucket upper bounds
+    """
+    with step('Add latencies'):
+        histogram = LatencyHistogram()
+        for latency in [100] * 98 + [5000, 10 ** 30]:
+            histogram.add(latency)
+        result = histogram.as_dict
+        attach_dict_to_report(result, 'Histogram')
+        assert result['buckets'] == {128: 98, 8192: 1, 2 ** 47: 1}, 'Wrong buckets'
+        assert (result['p50_ns'], result['p99_ns']) == (128, 8192), 'Wrong quantiles'
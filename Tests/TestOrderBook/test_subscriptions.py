@@ -0,0 +1,201 @@
+import asyncio
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import SubscriptionDisconnectedError
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    RequestTypes,
+)
+from Tests.OrderBook.Subscriptions import SlowConsumerPolicies
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+async def collect(subscription, count: int) -> list:
+    """
+    Get the given number of updates from the subscription
+
+    :param subscription: Subscription object
+    :param count: Number of updates
+
+    :return: List of updates
+    """
+    updates = []
+    async for update in subscription:
+        updates.append(update)
+        if len(updates) == count:
+            break
+    return updates
+
+
+@severity(severity_level.BLOCKER)
+@pytest.mark.positive
+def test_subscription_updates(order_book):
+    """
+    Test checks that a subscription gets level and order updates in the order they were made
+
+    Steps:
+        1. Subscribe and change the OrderBook from another coroutine
+            E: Level and order updates received in the right order
+    """
+    async def scenario():
+        subscription = order_book.subscribe(policy=SlowConsumerPolicies.DROP, order_events=True)
+
+        async def writer():
+            await asyncio.sleep(0)
+            order_book.add_request(ask)
+            order_book.change_request_info(ask.id, volume=Defaults.volume + 1)
+            order_book.delete_request(ask.id)
+
+        task = asyncio.create_task(writer())
+        updates = await collect(subscription, 6)
+        await task
+        return updates
+
+    with step('Subscribe and change the OrderBook from another coroutine'):
+        ask = AskRequest(Defaults.price, Defaults.volume)
+        updates = asyncio.run(scenario())
+        attach_dict_to_report(updates, 'Updates')
+        assert [(update['type'], update.get('action'), update.get('volume')) for update in updates] == [
+            ('level', None, Defaults.volume),
+            ('order', 'add', None),
+            ('level', None, Defaults.volume + 1),
+            ('order', 'change', None),
+            ('level', None, 0),
+            ('order', 'delete', None),
+        ], 'Wrong updates'
+        assert updates[0]['side'] == RequestTypes.ASK and updates[0]['price'] == Defaults.price, 'Wrong level'
+        assert updates[-1]['version'] == order_book.version, 'Wrong version'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_subscription_fill_updates(matching_order_book):
+    """
+    Test checks that a subscription gets order updates of matched requests
+
+    Steps:
+        1. Subscribe, add an ask request and bid requests filling it in two steps
+            E: The partially filled ask gets 'change', filled requests get 'fill'
+    """
+    async def scenario():
+        subscription = matching_order_book.subscribe(policy=SlowConsumerPolicies.DROP, order_events=True)
+
+        async def writer():
+            await asyncio.sleep(0)
+            matching_order_book.add_request(ask)
+            matching_order_book.add_request(BidRequest(Defaults.price, 3))
+            matching_order_book.add_request(BidRequest(Defaults.price, 2))
+
+        task = asyncio.create_task(writer())
+        updates = await collect(subscription, 8)
+        await task
+        return updates
+
+    with step('Subscribe, add an ask request and bid requests filling it in two steps'):
+        ask = AskRequest(Defaults.price, 5)
+        updates = asyncio.run(scenario())
+        attach_dict_to_report(updates, 'Updates')
+        assert [
+            (update['type'], update.get('action'),
+             update['volume'] if update['type'] == 'level' else update['request']['volume'])
+            for update in updates
+        ] == [
+            ('level', None, 5),
+            ('order', 'add', 5),
+            ('order', 'change', 2),
+            ('level', None, 2),
+            ('order', 'fill', 3),
+            ('order', 'fill', 2),
+            ('level', None, 0),
+            ('order', 'fill', 2),
+        ], 'Wrong updates'
+        assert updates[2]['request']['id'] == ask.id and updates[5]['request']['id'] == ask.id, 'Wrong maker'
+        assert updates[4]['request']['type'] == RequestTypes.BID, 'Wrong taker'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('policy, expected_levels, expected_dropped', [
+    (SlowConsumerPolicies.DROP, [(Defaults.price, Defaults.volume), (Defaults.price, Defaults.volume * 2)], 3),
+    (SlowConsumerPolicies.CONFLATE, [(Defaults.price, Defaults.volume * 3), (Defaults.price - 1, Defaults.volume)], 1),
+])
+def test_slow_consumer_policy(order_book, policy, expected_levels, expected_dropped):
+    """
+    Test checks dropping and conflating updates when the subscription queue is full
+
+    Steps:
+        1. Subscribe with a small queue
+            E: Subscription created successfully
+        2. Add requests to one level twice, to a new level and to the first level again
+            E: Updates are dropped or conflated, the queue keeps one update per level with conflating
+        3. Add a request to a new level while the queue is full
+            E: The update is dropped
+        4. Get updates
+            E: Updates match the policy
+    """
+    with step('Subscribe with a small queue'):
+        subscription = order_book.subscribe(maxsize=2, policy=policy)
+    with step('Add requests to one level twice, to a new level and to the first level again'):
+        order_book.add_request(AskRequest(Defaults.price, Defaults.volume))
+        order_book.add_request(AskRequest(Defaults.price, Defaults.volume))
+        order_book.add_request(BidRequest(Defaults.price - 1, Defaults.volume))
+        order_book.add_request(AskRequest(Defaults.price, Defaults.volume))
+    with step('Add a request to a new level while the queue is full'):
+        order_book.add_request(AskRequest(Defaults.price + 1, Defaults.volume))
+        subscription.close()
+    with step('Get updates'):
+        updates = asyncio.run(collect(subscription, 10))
+        attach_dict_to_report(updates, 'Updates')
+        assert [(update['price'], update['volume']) for update in updates] == expected_levels, 'Wrong updates'
+        assert subscription.dropped == expected_dropped, 'Wrong number of dropped updates'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=SubscriptionDisconnectedError, strict=True)
+def test_slow_consumer_disconnect(order_book):
+    """
+    Test checks that a slow consumer is disconnected with the "disconnect" policy
+
+    Steps:
+        1. Subscribe with a small queue
+            E: Subscription created successfully
+        2. Add more requests than the queue size
+            E: The subscription is closed
+        3. Get updates
+            E: Queued updates received
+            E: SubscriptionDisconnectedError raised
+    """
+    with step('Subscribe with a small queue'):
+        subscription = order_book.subscribe(maxsize=2, policy=SlowConsumerPolicies.DISCONNECT)
+    with step('Add more requests than the queue size'):
+        order_book.add_requests([AskRequest(Defaults.price + i, Defaults.volume) for i in range(3)])
+        assert subscription.closed, 'The subscription is not closed'
+    with step('Get updates'):
+        asyncio.run(collect(subscription, 10))
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=ValueError, strict=True)
+@pytest.mark.parametrize('kwargs', [{'maxsize': 0}, {'policy': 'block'}])
+def test_subscribe_wrong_arguments(order_book, kwargs):
+    """
+    Test checks the possibility of subscribing with wrong arguments
+
+    Steps:
+        1. Subscribe
+            E: ValueError raised
+    """
+    with step('Subscribe'):
+        order_book.subscribe(**kwargs)
@@ -0,0 +1,164 @@
+import sys
+import threading
+
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook.OrderBook import OrderBook
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+    RequestTypes,
+)
+from Tests.OrderBook.ThreadSafeOrderBook import ThreadSafeOrderBook
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_thread_safe_order_book_snapshot(order_book):
+    """
+    Test checks that the ThreadSafeOrderBook snapshot follows changes of the book
+
+    Steps:
+        1. Add, change and delete requests
+            E: Snapshot is the same as the snapshot of the OrderBook after every change
+        2. Get snapshot with depth
+            E: Snapshot has only the best levels
+        3. Get view twice without changes
+            E: The same view is returned
+    """
+    thread_safe_order_book = ThreadSafeOrderBook(order_book)
+    requests = [AskRequest(Defaults.price + i, Defaults.volume) for i in range(5)]
+    requests += [BidRequest(Defaults.price - 1 - i, Defaults.volume) for i in range(5)]
+
+    with step('Add, change and delete requests'):
+        for request in requests:
+            thread_safe_order_book.add_request(request)
+            assert thread_safe_order_book.get_snapshot() == order_book.get_snapshot(), 'Wrong snapshot'
+        thread_safe_order_book.change_request_info(requests[0].id, price=Defaults.price + 10)
+        thread_safe_order_book.change_request_info(requests[5].id, volume=Defaults.volume + 1)
+        assert thread_safe_order_book.get_snapshot() == order_book.get_snapshot(), 'Wrong snapshot'
+        thread_safe_order_book.delete_request(requests[9].id)
+        snapshot = thread_safe_order_book.get_snapshot()
+        attach_dict_to_report(snapshot, 'Snapshot')
+        assert snapshot == order_book.get_snapshot(), 'Wrong snapshot'
+
+    with step('Get snapshot with depth'):
+        # 5 ask and 4 bid levels: depths over the number of levels and under twice of it are checked too
+        for depth in (0, 2, 5, 6, 7, 10):
+            assert thread_safe_order_book.get_snapshot(depth) == order_book.get_snapshot(depth), 'Wrong snapshot'
+
+    with step('Get view twice without changes'):
+        view = thread_safe_order_book.get_view()
+        assert view.version == order_book.version, 'Wrong view version'
+        assert thread_safe_order_book.get_view() is view, 'The view was rebuilt'
+        assert thread_safe_order_book.get_side_levels(RequestTypes.BID) == view.bids, 'Wrong levels'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_thread_safe_order_book_concurrent_readers(order_book):
+    """
+    Test checks that snapshots are consistent while a writer changes the book
+
+    Steps:
+        1. Add and delete requests in the writer thread, get snapshots in reader threads
+            E: Every snapshot has only the levels of the initial requests and the changing level
+        2. Get snapshot after the writer is stopped
+            E: Snapshot is the same as the snapshot of the OrderBook
+    """
+    thread_safe_order_book = ThreadSafeOrderBook(order_book)
+    thread_safe_order_book.add_requests([AskRequest(Defaults.price + i, Defaults.volume) for i in range(10)])
+    expected_prices = {Defaults.price + i for i in range(10)}
+    errors = []
+    stop = threading.Event()
+
+    def read():
+        while not stop.is_set():
+            asks = thread_safe_order_book.get_snapshot()['Asks']
+            prices = [level['price'] for level in asks]
+            if prices != sorted(prices, reverse=True) or not expected_prices <= set(prices) \
+                    or len(prices) > len(expected_prices) + 1:
+                errors.append(asks)
+
+    with step('Add and delete requests in the writer thread, get snapshots in reader threads'):
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for _ in range(500):
+            request = AskRequest(Defaults.price + 20, Defaults.volume)
+            thread_safe_order_book.add_request(request)
+            thread_safe_order_book.delete_request(request.id)
+        stop.set()
+        for reader in readers:
+            reader.join()
+        assert not errors, f'Inconsistent snapshots: {errors[:3]}'
+
+    with step('Get snapshot after the writer is stopped'):
+        assert thread_safe_order_book.get_snapshot() == order_book.get_snapshot(), 'Wrong snapshot'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+@pytest.mark.parametrize('dense_window', [None, 8])
+def test_thread_safe_order_book_best_prices(dense_window):
+    """
+    Test checks that best prices read without the lock are never missing while the book is changed
+
+    Steps:
+        1. Add and delete better asks in a writer thread
+            E: Readers never get None as the best ask of a non-empty side
+    """
+    thread_safe_order_book = ThreadSafeOrderBook(OrderBook(tick_size=1, dense_window=dense_window))
+    thread_safe_order_book.add_request(AskRequest(Defaults.price + 10, Defaults.volume))
+    stop = threading.Event()
+    missing = []
+
+    def reader():
+        while not stop.is_set():
+            if thread_safe_order_book.best_ask() is None:
+                missing.append(True)
+
+    with step('Add and delete better asks in a writer thread'):
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        # Threads are switched often, so readers get in the middle of changes
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        for thread in readers:
+            thread.start()
+        try:
+            for i in range(3000):
+                request = AskRequest(Defaults.price + i % 10, Defaults.volume)
+                thread_safe_order_book.add_request(request)
+                thread_safe_order_book.delete_request(request.id)
+        finally:
+            stop.set()
+            for thread in readers:
+                thread.join()
+            sys.setswitchinterval(switch_interval)
+        assert not missing, f'The best ask was missing {len(missing)} times'
+        assert thread_safe_order_book.best_ask() == Defaults.price + 10, 'Wrong best ask'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.negative
+@pytest.mark.xfail(raises=ValueError, strict=True)
+@pytest.mark.parametrize('depth', [-1, 1.5, '1'])
+def test_thread_safe_order_book_wrong_depth(order_book, depth):
+    """
+    Test checks the possibility of getting a ThreadSafeOrderBook snapshot with a wrong depth
+
+    Steps:
+        1. Get snapshot with a wrong depth
+            E: ValueError raised
+    """
+    with step('Get snapshot with a wrong depth'):
+        ThreadSafeOrderBook(order_book).get_snapshot(depth)
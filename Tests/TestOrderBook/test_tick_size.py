@@ -0,0 +1,108 @@
+import pytest
+from allure import (
+    step,
+    severity,
+    severity_level,
+)
+
+from Tests.OrderBook import RequestPriceError
+from Tests.OrderBook.OrderBook import (
+    OrderBook,
+    RequestStatuses,
+)
+from Tests.OrderBook.Requests import (
+    AskRequest,
+    BidRequest,
+)
+from Tests.OrderBook.Ticks import TickSize
+from Tests.Source import (
+    Defaults,
+    attach_dict_to_report,
+)
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.positive
+def test_tick_size_levels(order_book):
+    """
+    Test checks that prices equal up to float rounding are the same level of a book with a tick size
+
+    Steps:
+        1. Add requests with 0.1 + 0.2 and 0.3 prices to books without and with the tick size
+            E: The book without the tick size has two levels, the book with the tick size has one
+            E: Prices are canonical
+        2. Change the request price
+            E: The request is moved to the canonical price level
+    """
+    with step('Add requests with 0.1 + 0.2 and 0.3 prices to books without and with the tick size'):
+        tick_order_book = OrderBook(tick_size=0.1)
+        for book in (order_book, tick_order_book):
+            book.add_requests([BidRequest(0.1 + 0.2, Defaults.volume), BidRequest(0.3, Defaults.volume)])
+        assert len(order_book.get_snapshot()['Bids']) == 2, 'Wrong levels without the tick size'
+        snapshot = tick_order_book.get_snapshot()
+        attach_dict_to_report(snapshot, 'Snapshot')
+        assert snapshot['Bids'] == [{'price': 0.3, 'volume': Defaults.volume * 2}], 'Wrong levels with the tick size'
+        assert tick_order_book.get_metrics()['best_prices']['Bid'] == 0.3, 'Wrong best price'
+
+    with step('Change the request price'):
+        request = AskRequest(1.1, Defaults.volume)
+        tick_order_book.add_request(request)
+        tick_order_book.change_request_info(request.id, price=0.7 + 0.2 + 0.1)
+        assert request.price == 1.0, 'The price is not canonical'
+        assert tick_order_book.get_snapshot()['Asks'] == [{'price': 1.0, 'volume': Defaults.volume}], \
+            'Wrong levels after the price change'
+
+
+@severity(severity_level.CRITICAL)
+@pytest.mark.negative
+def test_tick_size_wrong_price(order_book):
+    """
+    Test checks that prices off the tick grid are not accepted
+
+    Steps:
+        1. Add a request with a price off the grid
+            E: RequestPriceError is raised
+        2. Add requests in bulk with a price off the grid
+            E: The request gets the WRONG_PRICE status
+        3. Change the request price to a price off the grid
+            E: RequestPriceError is raised, the request keeps its price
+    """
+    tick_order_book = OrderBook(tick_size=5)
+    with step('Add a request with a price off the grid'):
+        with pytest.raises(RequestPriceError):
+            tick_order_book.add_request(AskRequest(12, Defaults.volume))
+
+    with step('Add requests in bulk with a price off the grid'):
+        request = AskRequest(10.0, Defaults.volume)
+        statuses = tick_order_book.add_requests_bulk([request, AskRequest(11, Defaults.volume)])
+        assert list(statuses) == [RequestStatuses.ADDED, RequestStatuses.WRONG_PRICE], 'Wrong statuses'
+        assert request.price == 10 and isinstance(request.price, int), 'The price is not canonical'
+
+    with step('Change the request price to a price off the grid'):
+        with pytest.raises(RequestPriceError):
+            tick_order_book.change_request_info(request.id, price=13)
+        assert tick_order_book.get_request_info(request.id)['price'] == 10, 'The price was changed'
+        assert tick_order_book.get_snapshot()['Asks'] == [{'price': 10, 'volume': Defaults.volume}], 'Wrong levels'
+
+
+@severity(severity_level.NORMAL)
+@pytest.mark.parametrize('tick_size, price, ticks, canonical_price', [
+    (0.01, 1.23, 123, 1.23),
+    (0.01, 0.1 + 0.2, 30, 0.3),
+    (0.25, 2.75, 11, 2.75),
+    (5, 15.0, 3, 15),
+])
+@pytest.mark.positive
+def test_tick_size_conversion(tick_size, price, ticks, canonical_price):
+    """
+    Test checks conversion of prices to ticks and back
+
+    Steps:
+        1. Convert the price
+            E: The number of ticks and the canonical price are right
+    """
+    with step('Convert the price'):
+        tick = TickSize(tick_size)
+        assert tick.to_ticks(price) == ticks, 'Wrong number of ticks'
+        assert tick.normalize(price) == canonical_price, 'Wrong canonical price'
+        assert type(tick.normalize(price)) is type(canonical_price), 'Wrong canonical price type'
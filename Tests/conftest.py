@@ -8,4 +8,11 @@ from Tests.OrderBook.Requests import Request
 def order_book():
     order_book = OrderBook()
     yield order_book
-    Request._curr_id = 0  # Reset start request id
+    Request.id_allocator.reset()  # Reset start request id
+
+
+@pytest.fixture(scope='function')
+def matching_order_book():
+    order_book = OrderBook(matching=True)
+    yield order_book
+    Request.id_allocator.reset()  # Reset start request id